@@ -0,0 +1,110 @@
+"""Benchmarks for the pure-Python game engine."""
+
+import random
+
+from benchmarks.harness import benchmark
+from raid_boss.boss import HorrorfromtheDepths, LunarChanneler, TheManaGod
+from raid_boss.game_logic import GameLogic
+from raid_boss.game_state import GameState
+from raid_boss.game_text import GameTextManager, TextType
+from raid_boss.rolls import draw_rolls
+from raid_boss.sinks import MemorySink
+
+BOSSES = (TheManaGod, HorrorfromtheDepths, LunarChanneler)
+BUFFER_SIZES = (10, 100, 1000, 10000)
+HINT_ROLLS = list(range(11)) * 2
+
+# A full game: four players, the Mana God, and 30 rounds of damage and no defeats
+SCRIPTED_GAME = ["4", "Bench Boss", "1"] + ["5", "0"] * 30
+
+
+@benchmark("game_state.new")
+def game_state_new():
+    return lambda: GameState(seed=1)
+
+
+@benchmark("game_state.schedule_30_turns")
+def game_state_schedule():
+    def roll_turns():
+        schedule = GameState(seed=1).schedule
+        for turn in range(30):
+            schedule[turn]
+
+    return roll_turns
+
+
+@benchmark("rolls.draw_1000")
+def rolls_draw():
+    rng = random.Random(1)
+    return lambda: draw_rolls(1000, rng)
+
+
+def _register_boss(boss_cls):
+    name = boss_cls.__name__
+
+    @benchmark(f"boss.{name}.spells")
+    def spells():
+        boss = boss_cls(boss_name="Bench Boss", player_count=4)
+        funcs = [boss.boss_funcs[roll] for roll in sorted(boss.boss_funcs)]
+
+        def cast_all():
+            for func in funcs:
+                func()
+
+        return cast_all
+
+    @benchmark(f"boss.{name}.render_turn")
+    def render_turn():
+        boss = boss_cls(boss_name="Bench Boss", player_count=4)
+        rolls = bytes(HINT_ROLLS)
+        return lambda: boss.render_turn(rolls)
+
+    @benchmark(f"boss.{name}.get_attack_hint")
+    def attack_hint():
+        boss = boss_cls(boss_name="Bench Boss", player_count=4)
+        return lambda: boss.get_attack_hint(HINT_ROLLS)
+
+
+for boss_cls in BOSSES:
+    _register_boss(boss_cls)
+
+
+def _filled_manager(size: int) -> GameTextManager:
+    manager = GameTextManager()
+    manager.max_buffer_size = max(size, 1000) * 2
+    manager.set_output_callback(lambda text, append: None)
+    for index in range(size):
+        manager.add_text(f"Line {index} of a long and whimsical battle", TextType.GAME_STATE)
+    return manager
+
+
+def _register_buffer_size(size: int):
+    @benchmark(f"text_manager.add_text[{size}]", number=200)
+    def add_text():
+        manager = _filled_manager(size)
+        return lambda: manager.add_text("THE BOSS ATTACKS!", TextType.BOSS_ATTACK)
+
+    @benchmark(f"text_manager.update_display_full[{size}]", number=20)
+    def update_display_full():
+        manager = _filled_manager(size)
+
+        def redraw():
+            manager._dirty_from = manager.text_buffer.first_in_memory
+            manager._update_display()
+
+        return redraw
+
+
+for size in BUFFER_SIZES:
+    _register_buffer_size(size)
+
+
+@benchmark("game_logic.scripted_30_turns")
+def scripted_game():
+    def play():
+        game_state = GameState(seed=7)
+        logic = GameLogic(game_state, MemorySink())
+        for user_input in SCRIPTED_GAME:
+            logic.handle_input(user_input)
+
+    return play
@@ -0,0 +1,44 @@
+"""Benchmarks for the Kivy transcript widget, run against Kivy's headless window."""
+
+import os
+
+os.environ.setdefault("KIVY_NO_ARGS", "1")
+
+from kivy.uix.scrollview import ScrollView
+
+from benchmarks.harness import benchmark
+from raid_boss.ui_components import GameOutput, TextType
+
+OUTPUT_SIZES = (10, 1000, 5000)
+
+
+def _filled_output(size: int) -> GameOutput:
+    scroll = ScrollView(size=(800, 600))
+    output = GameOutput()
+    output.set_scroll_view(scroll)
+    output.size = (800, output.height)
+    output.add_texts([(f"Line {index} of a long and whimsical battle", TextType.GAME_STATE) for index in range(size)])
+    output.flush()
+    scroll.scroll_y = 0
+    return output
+
+
+def _register_output_size(size: int):
+    @benchmark(f"game_output.add_text[{size}]", number=100)
+    def add_text():
+        output = _filled_output(size)
+
+        def append():
+            output.add_text("THE BOSS ATTACKS!", TextType.BOSS_ATTACK)
+            output.flush()
+
+        return append
+
+    @benchmark(f"game_output.redraw[{size}]", number=20)
+    def redraw():
+        output = _filled_output(size)
+        return output._redraw
+
+
+for size in OUTPUT_SIZES:
+    _register_output_size(size)
@@ -0,0 +1,122 @@
+"""A small timing harness for the benchmark suite.
+
+Benchmarks register a factory with ``@benchmark``. The factory does any setup and
+returns the callable to time, and it is called again before every repeat so each repeat
+starts from the same state. Results are per-call seconds, with the best of the repeats
+used for comparisons.
+"""
+
+import json
+import platform
+import time
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, List, Optional
+
+Factory = Callable[[], Callable[[], object]]
+
+BENCHMARKS: Dict[str, "Benchmark"] = {}
+
+
+@dataclass
+class Benchmark:
+    name: str
+    factory: Factory
+    number: Optional[int] = None  # calls per repeat; calibrated when None
+
+
+@dataclass
+class Result:
+    best: float
+    median: float
+    number: int
+    repeat: int
+
+
+def benchmark(name: str, number: Optional[int] = None):
+    """Register a benchmark factory under ``name``."""
+
+    def register(factory: Factory) -> Factory:
+        if name in BENCHMARKS:
+            raise ValueError(f"Benchmark {name!r} is registered twice")
+        BENCHMARKS[name] = Benchmark(name, factory, number)
+        return factory
+
+    return register
+
+
+def _time_calls(func: Callable[[], object], number: int) -> float:
+    start = time.perf_counter()
+    for _ in range(number):
+        func()
+    return time.perf_counter() - start
+
+
+def calibrate(factory: Factory, min_time: float) -> int:
+    """Smallest power of ten of calls that takes at least ``min_time`` seconds."""
+    number = 1
+    while True:
+        if _time_calls(factory(), number) >= min_time or number >= 10**7:
+            return number
+        number *= 10
+
+
+def measure(bench: Benchmark, repeat: int = 5, min_time: float = 0.05) -> Result:
+    number = bench.number or calibrate(bench.factory, min_time)
+    times = sorted(_time_calls(bench.factory(), number) / number for _ in range(repeat))
+    return Result(best=times[0], median=times[len(times) // 2], number=number, repeat=repeat)
+
+
+def run(names: List[str], repeat: int = 5, min_time: float = 0.05, report=print) -> Dict[str, Result]:
+    results = {}
+    for name in names:
+        results[name] = measure(BENCHMARKS[name], repeat, min_time)
+        report(f"{name:<48} {format_seconds(results[name].best):>10}  (x{results[name].number})")
+    return results
+
+
+def format_seconds(seconds: float) -> str:
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+
+def save(path: str, results: Dict[str, Result]) -> None:
+    data = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": {name: asdict(result) for name, result in sorted(results.items())},
+    }
+    with open(path, "w") as baseline_file:
+        json.dump(data, baseline_file, indent=2)
+        baseline_file.write("\n")
+
+
+def load(path: str) -> Dict[str, Result]:
+    with open(path) as baseline_file:
+        data = json.load(baseline_file)
+    return {name: Result(**result) for name, result in data["results"].items()}
+
+
+@dataclass
+class Comparison:
+    name: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else float("inf")
+
+
+def compare(baseline: Dict[str, Result], current: Dict[str, Result], threshold: float) -> List[Comparison]:
+    """Benchmarks whose best time got slower than the baseline by more than ``threshold`` (0.2 = 20%)."""
+    regressions = []
+    for name in sorted(current.keys() & baseline.keys()):
+        comparison = Comparison(name, baseline[name].best, current[name].best)
+        if comparison.ratio > 1 + threshold:
+            regressions.append(comparison)
+    return regressions
@@ -0,0 +1,64 @@
+"""Run the benchmark suite, save a JSON baseline, or compare against one.
+
+python benchmarks/run_benchmarks.py --save benchmarks/baseline.json
+python benchmarks/run_benchmarks.py --compare benchmarks/baseline.json --threshold 0.2
+"""
+
+import argparse
+import importlib
+import os
+import sys
+
+# Add the repo root to the sys.path to handle standalone execution
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks import harness
+
+MODULES = ("benchmarks.bench_engine", "benchmarks.bench_ui")
+
+
+def load_benchmarks(modules=MODULES) -> None:
+    for module in modules:
+        try:
+            importlib.import_module(module)
+        except ImportError as error:
+            print(f"Skipping {module}: {error}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Raid Boss benchmarks.")
+    parser.add_argument("-k", "--filter", default="", help="only run benchmarks whose name contains this")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.05, help="seconds per repeat when calibrating")
+    parser.add_argument("--save", metavar="FILE", help="write the results to a JSON baseline")
+    parser.add_argument("--compare", metavar="FILE", help="compare the results with a JSON baseline")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed slowdown before failing (0.2 = 20%%)")
+    parser.add_argument("--list", action="store_true", help="list the benchmarks and exit")
+    args = parser.parse_args(argv)
+
+    load_benchmarks()
+    names = [name for name in harness.BENCHMARKS if args.filter in name]
+    if args.list:
+        print("\n".join(names))
+        return 0
+
+    results = harness.run(names, repeat=args.repeat, min_time=args.min_time)
+    if args.save:
+        harness.save(args.save, results)
+        print(f"\nSaved {len(results)} results to {args.save}")
+    if args.compare:
+        baseline = harness.load(args.compare)
+        regressions = harness.compare(baseline, results, args.threshold)
+        print(f"\nCompared with {args.compare} (threshold {args.threshold:.0%}):")
+        for name in sorted(results.keys() & baseline.keys()):
+            ratio = results[name].best / baseline[name].best if baseline[name].best else float("inf")
+            flag = "  REGRESSION" if any(regression.name == name for regression in regressions) else ""
+            print(f"  {name:<48} {ratio:6.2f}x{flag}")
+        if regressions:
+            print(f"\n{len(regressions)} benchmark(s) regressed")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,288 @@
+"""Play scripted games without anyone at the keyboard.
+
+A script is a text file with one answer per line, in the order the game asks for them.
+Lines starting with ``#`` are comments, blank lines are skipped, and a line of ``---``
+starts the next game, so one file can hold a whole tournament. Each game is played at
+full speed through one of two engines:
+
+* ``logic``: the ``GameLogic`` state machine that ``main.py`` and the server use;
+* ``run``: the terminal game loop from ``run.py``, with its output captured.
+
+Game N of a batch is played with seed + N, so any game can be played again on its own.
+With ``--jobs`` the games are spread over worker processes; the results are the same.
+"""
+
+import argparse
+import io
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from dataclasses import asdict, dataclass
+from typing import Iterable, List, Optional, Sequence, TextIO
+
+# Add the parent directory to the sys.path to handle standalone execution
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from raid_boss.game_logic import GameLogic
+from raid_boss.game_state import GameState
+from raid_boss.game_text import TextType
+from raid_boss.metrics import METRICS
+from raid_boss.rolls import new_seed
+from raid_boss.sinks import MemorySink
+
+ENGINES = ("logic", "run")
+SEPARATOR = "---"
+
+
+def parse_scripts(text: str) -> List[List[str]]:
+    """Split script text into the answers for each game."""
+    scripts: List[List[str]] = [[]]
+    for line in text.splitlines():
+        line = line.strip()
+        if line == SEPARATOR:
+            scripts.append([])
+        elif line and not line.startswith("#"):
+            scripts[-1].append(line)
+    return [answers for answers in scripts if answers]
+
+
+@dataclass
+class GameResult:
+    index: int
+    seed: int
+    won: bool = False
+    finished: bool = False  # the game reached its end before the script ran out
+    turns: int = 0
+    answers: int = 0  # answers the game took
+    boss_health: int = 0
+    elapsed: float = 0.0
+    transcript: str = ""
+    error: Optional[str] = None
+
+
+class ScriptEnded(Exception):
+    """The game asked for more answers than the script has."""
+
+
+def _play_logic(answers: Sequence[str], game_state: GameState, result: GameResult) -> None:
+    output = MemorySink()
+    logic = GameLogic(game_state, output)
+    output.add_texts(
+        [
+            (f"Game seed: {game_state.seed}", TextType.GAME_STATE),
+            ("Welcome to Raid Boss!", TextType.GAME_STATE),
+            ("How many people are playing?", TextType.PROMPT),
+        ]
+    )
+    try:
+        for answer in answers:
+            if game_state.phase == 6:
+                break
+            output.add_text("> " + answer, TextType.PLAYER_ACTION)
+            logic.handle_input(answer)
+            result.answers += 1
+    finally:
+        result.transcript = output.text
+    result.finished = game_state.phase == 6
+    if not result.finished:
+        raise ScriptEnded(f"the script ran out of answers after {result.answers}")
+
+
+def _play_run(answers: Sequence[str], game_state: GameState, result: GameResult) -> None:
+    from raid_boss.run import play
+
+    remaining = iter(answers)
+
+    def ask(prompt: str) -> str:
+        answer = next(remaining, None)
+        if answer is None:
+            raise ScriptEnded(f"the script ran out of answers after {result.answers}")
+        print(prompt + answer)
+        result.answers += 1
+        return answer
+
+    captured = io.StringIO()
+    try:
+        with redirect_stdout(captured):
+            print(f"Game seed: {game_state.seed}")
+            won = play(game_state, ask, aggregate_spells=game_state.aggregate_spells, setup=ask)
+    finally:
+        result.transcript = captured.getvalue()
+    result.finished = won or game_state.players.alive_count <= 0
+
+
+_ENGINE_PLAYERS = {"logic": _play_logic, "run": _play_run}
+
+
+def play_script(
+    answers: Sequence[str],
+    seed: int,
+    engine: str = "logic",
+    curve: str = "normal",
+    index: int = 0,
+    aggregate_spells: bool = False,
+) -> GameResult:
+    """Play one game from its answers. Errors are recorded on the result rather than raised."""
+    result = GameResult(index, seed)
+    game_state = GameState(curve, seed)
+    game_state.aggregate_spells = aggregate_spells
+    start = time.perf_counter()
+    try:
+        _ENGINE_PLAYERS[engine](answers, game_state, result)
+    except ScriptEnded as error:
+        result.error = str(error)
+    except Exception as error:
+        result.error = f"{type(error).__name__}: {error}"
+    result.elapsed = time.perf_counter() - start
+    result.won = game_state.boss is not None and game_state.is_game_over()
+    if game_state.boss is not None:
+        result.turns = game_state.boss.turn_count
+        result.boss_health = game_state.boss.health
+    return result
+
+
+def run_batch(
+    scripts: Sequence[Sequence[str]],
+    engine: str = "logic",
+    seed: Optional[int] = None,
+    curve: str = "normal",
+    jobs: int = 1,
+    aggregate_spells: bool = False,
+) -> List[GameResult]:
+    """Play every script, game N with ``seed + N``. ``jobs`` above 1 uses that many processes."""
+    if engine not in _ENGINE_PLAYERS:
+        raise ValueError(f"Unknown engine {engine!r}, expected one of {list(ENGINES)}")
+    seed = new_seed() if seed is None else seed
+    arguments = [
+        (answers, seed + index, engine, curve, index, aggregate_spells) for index, answers in enumerate(scripts)
+    ]
+    if jobs == 1 or len(scripts) < 2:
+        return [play_script(*game) for game in arguments]
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = [executor.submit(play_script, *game) for game in arguments]
+        return [future.result() for future in futures]
+
+
+@dataclass
+class BatchSummary:
+    games: int = 0
+    finished: int = 0
+    wins: int = 0
+    errors: int = 0
+    answers: int = 0
+    turns: int = 0
+    elapsed: float = 0.0  # wall time for the whole batch
+
+    @classmethod
+    def of(cls, results: Iterable[GameResult], elapsed: float) -> "BatchSummary":
+        summary = cls(elapsed=elapsed)
+        for result in results:
+            summary.games += 1
+            summary.finished += result.finished
+            summary.wins += result.won
+            summary.errors += result.error is not None
+            summary.answers += result.answers
+            summary.turns += result.turns
+        return summary
+
+    @property
+    def win_rate(self) -> float:
+        return self.wins / self.finished if self.finished else 0.0
+
+    @property
+    def mean_turns(self) -> float:
+        return self.turns / self.games if self.games else 0.0
+
+    @property
+    def answers_per_second(self) -> float:
+        return self.answers / self.elapsed if self.elapsed else 0.0
+
+    def to_dict(self) -> dict:
+        return dict(
+            asdict(self),
+            win_rate=self.win_rate,
+            mean_turns=self.mean_turns,
+            answers_per_second=self.answers_per_second,
+        )
+
+    def format(self) -> str:
+        return "\n".join(
+            [
+                f"Games:        {self.games} ({self.finished} finished, {self.errors} with errors)",
+                f"Wins:         {self.wins} ({self.win_rate:.1%} of finished games)",
+                f"Mean turns:   {self.mean_turns:.1f}",
+                f"Throughput:   {self.answers} answers in {self.elapsed:.2f}s ({self.answers_per_second:,.0f}/s)",
+            ]
+        )
+
+
+def write_transcripts(results: Iterable[GameResult], directory: str) -> None:
+    os.makedirs(directory, exist_ok=True)
+    for result in results:
+        with open(os.path.join(directory, f"game-{result.index + 1:04d}.txt"), "w", encoding="utf-8") as file:
+            file.write(result.transcript)
+            if result.error is not None:
+                file.write(f"\n[stopped: {result.error}]\n")
+
+
+def _read_scripts(paths: Sequence[str], stdin: TextIO) -> List[List[str]]:
+    scripts = []
+    for path in paths or ["-"]:
+        if path == "-":
+            scripts.extend(parse_scripts(stdin.read()))
+        else:
+            with open(path, encoding="utf-8") as script_file:
+                scripts.extend(parse_scripts(script_file.read()))
+    return scripts
+
+
+def main(argv=None, engine: str = "logic") -> int:
+    parser = argparse.ArgumentParser(description="Play scripted Raid Boss games in a batch.")
+    parser.add_argument("scripts", nargs="*", help="script files, one answer per line ('-' or none for stdin)")
+    parser.add_argument("--engine", choices=ENGINES, default=engine, help=f"game loop to drive (default: {engine})")
+    parser.add_argument("--seed", type=int, default=None, help="base seed; game N uses seed + N")
+    parser.add_argument("--hard", action="store_true", help="hard mode: roll 2d6 per the turn number")
+    parser.add_argument(
+        "--aggregate-spells", action="store_true", help="show repeated spells once per turn with a multiplier"
+    )
+    parser.add_argument("--jobs", type=int, default=1, help="worker processes (default: 1)")
+    parser.add_argument("--transcripts", metavar="DIR", help="write each game's transcript to DIR")
+    parser.add_argument("--stats", metavar="FILE", help="write per-game results and the summary as JSON")
+    parser.add_argument(
+        "--metrics", metavar="FILE", help="time the GameLogic handlers; a .prom file gets Prometheus text, else JSON"
+    )
+    args = parser.parse_args(argv)
+    if args.metrics and (args.engine != "logic" or args.jobs != 1):
+        # Timings are only kept in this process, and only GameLogic is instrumented
+        parser.error("--metrics needs --engine logic and --jobs 1")
+
+    scripts = _read_scripts(args.scripts, sys.stdin)
+    if args.metrics:
+        METRICS.instrument(GameLogic)
+    start = time.perf_counter()
+    results = run_batch(
+        scripts, args.engine, args.seed, "hard" if args.hard else "normal", args.jobs, args.aggregate_spells
+    )
+    summary = BatchSummary.of(results, time.perf_counter() - start)
+
+    for result in results:
+        if result.error is not None:
+            print(f"Game {result.index + 1} (seed {result.seed}): {result.error}", file=sys.stderr)
+    print(summary.format())
+    if args.transcripts:
+        write_transcripts(results, args.transcripts)
+    if args.stats:
+        games = [{key: value for key, value in asdict(result).items() if key != "transcript"} for result in results]
+        with open(args.stats, "w", encoding="utf-8") as stats_file:
+            json.dump({"summary": summary.to_dict(), "games": games}, stats_file, indent=2)
+    if args.metrics:
+        METRICS.uninstrument()
+        METRICS.write(args.metrics)
+    return 1 if summary.errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
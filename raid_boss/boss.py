@@ -1,9 +1,39 @@
+from functools import lru_cache, partial
+
+from raid_boss.spells import ALL, NO_EFFECT, SpellEffect, Token
+
+
+def _roll_hints(*categories):
+    """Hint bitmask for each roll value: bit i is set when the roll is in categories[i]."""
+    return tuple(sum(1 << bit for bit, rolls in enumerate(categories) if roll in rolls) for roll in range(11))
+
+
+def _multiplied(text, count):
+    """Mark a spell text as standing for ``count`` casts."""
+    return text.replace("BOSS SPELL>", f"BOSS SPELL x{count}>", 1)
+
+
+@lru_cache(maxsize=None)
+def _hint_text(hints, mask):
+    return " ".join(hint for bit, hint in enumerate(hints) if mask >> bit & 1) + "\n"
+
+
 class Boss(object):
 
     result_text = ""
     BASE_HEALTH = 250
+    # Players also win once they have given the boss this much poison per player
+    POISON_PER_PLAYER = 50
+
+    # Rolls whose spells change the boss when cast; they are never served from the render cache
+    STATEFUL_ROLLS = frozenset()
+
+    # Prose for each roll value's spell, indexed like ``boss_funcs``. Filled in with
+    # ``str.format`` from the spell's ``effect`` and the ``boss`` casting it.
+    SPELL_TEXTS = ()
 
     def __init__(self, boss_name="", player_count=4, poison=0):
+        self._render_cache = {}
         self.boss_name = boss_name
         self.player_count = player_count
         self.health = player_count * self.BASE_HEALTH
@@ -12,252 +42,344 @@ class Boss(object):
         self.text_result = ""
         self.next_attacks = []
         self.current_attacks = []
-
-
-class TheManaGod(Boss):
-
-    def __init__(self, boss_name="", player_count=4, poison=0):
-        super().__init__(boss_name, player_count, poison)
-        self.boss_funcs = {
-            0: self.two,
-            1: self.three,
-            2: self.four,
-            3: self.five,
-            4: self.six,
-            5: self.seven,
-            6: self.eight,
-            7: self.nine,
-            8: self.ten,
-            9: self.eleven,
-            10: self.twelve,
-        }
-
+        self.boss_funcs = {roll: partial(self.cast, roll) for roll in range(len(self.SPELL_TEXTS))}
+
+    @classmethod
+    def spell_effects(cls, player_count):
+        """What each roll value's spell does at ``player_count`` players, indexed like ``boss_funcs``."""
+        return ()
+
+    @classmethod
+    def effect_table(cls, player_count=4):
+        return _effect_table(cls, player_count)
+
+    def effect(self, roll):
+        return self.effect_table(self._player_count)[roll]
+
+    def apply(self, effect):
+        """Apply the part of a spell's effect that changes the boss."""
+        if effect.heal:
+            self.health += effect.heal
+
+    def cast(self, roll):
+        """Cast the spell for ``roll``: apply its effect, then return its text."""
+        effect = self.effect(roll)
+        self.apply(effect)
+        return self.SPELL_TEXTS[roll].format(effect=effect, boss=self)
+
+    def cast_multiple(self, roll, count):
+        """Cast the spell for ``roll`` ``count`` times, returning one text with the summed quantities."""
+        effect = self.effect(roll)
+        for _ in range(count):
+            self.apply(effect)
+        return self.SPELL_TEXTS[roll].format(effect=effect.times(count), boss=self)
+
+    # The spells by roll result (2-12)
     def two(self):
-        return """BOSS SPELL> Each player chooses three: sacrifice all creatures you control, sacrifice all enchantments you control, 
-sacrifice all artifacts you control, exile your graveyard. Boss permanents cannot be sacrificed this way."""
+        return self.cast(0)
 
     def three(self):
-        return """BOSS SPELL> For each player, create a colorless Boss enchantment token named Curse of Confusion under their control with 
-"At the beginning of your end step, choose one: sacrifice a permanent, discard a card, or mill 5."""
+        return self.cast(1)
 
     def four(self):
-        return f"""BOSS SPELL> Create {self.player_count * 4} 1/1 red goblin zombie creature tokens with first strike, decayed, and haste.
- Four tokens attack each player this combat."""
+        return self.cast(2)
 
     def five(self):
-        return f"""BOSS SPELL> Players discard {2 * self.player_count} divided between players."""
+        return self.cast(3)
 
     def six(self):
-        return f"""BOSS SPELL> Create {self.player_count * 2} 2/2 black vampire zombie creature tokens with menace, decayed, and haste.
- Two tokens attack each player this combat."""
+        return self.cast(4)
 
     def seven(self):
-        return f"""BOSS SPELL> Create {self.player_count * 1} 5/5 green beast zombie creature token with trample, decayed, and haste. 
-One token attacks each player this combat."""
+        return self.cast(5)
 
     def eight(self):
-        return f"""BOSS SPELL> Create {self.player_count * 2} 2/2 blue drake zombie creature token with flying, decayed, and haste. 
-Two token attacks each player this combat."""
+        return self.cast(6)
 
     def nine(self):
-        return f"""BOSS SPELL> Players sacrifice {self.player_count} nonland, non-token permanents divided between players."""
+        return self.cast(7)
 
     def ten(self):
-        self.health += self.player_count * 4
-        return f"""BOSS SPELL> Create {self.player_count * 4} 1/1 white cleric zombie creature tokens with 'enters' lifelink (this lifegain cannot be prevented), decayed, 
-and haste. Four tokens attack each player this combat. Boss heals {self.player_count * 4} from the clerics!"""
+        return self.cast(8)
 
     def eleven(self):
-        return """BOSS SPELL> For each player, create a colorless artifact token named Altar of Bleeding under their 
-control with 'At the beginning of your end step, you lose 3 life unless you pay 2.'"""
+        return self.cast(9)
 
     def twelve(self):
-        self.health += self.player_count * 20
-        return f"""BOSS SPELL> {self.boss_name} heals {self.player_count * 20}
-{self.boss_name}'s health is now {self.health}!"""
+        return self.cast(10)
+
+    @property
+    def health(self):
+        return self._health
+
+    @health.setter
+    def health(self, value):
+        self._health = value
+        self._render_cache.clear()
+
+    @property
+    def player_count(self):
+        return self._player_count
+
+    @player_count.setter
+    def player_count(self, value):
+        self._player_count = value
+        self._render_cache.clear()
+
+    def render(self, roll):
+        """Cast the spell for ``roll`` and return its text.
+
+        Text is cached per (roll, player_count, boss_name) until the health or player count
+        changes. Stateful spells always run so their effects apply once per roll.
+        """
+        if roll in self.STATEFUL_ROLLS:
+            return self.boss_funcs[roll]()
+        key = (roll, self._player_count, self.boss_name)
+        text = self._render_cache.get(key)
+        if text is None:
+            text = self._render_cache[key] = self.boss_funcs[roll]()
+        return text
+
+    def render_multiple(self, roll, count):
+        """Cast the spell for ``roll`` ``count`` times and return a single text for all of them."""
+        if count == 1:
+            return self.render(roll)
+        if roll in self.STATEFUL_ROLLS:
+            return _multiplied(self.cast_multiple(roll, count), count)
+        key = (roll, count, self._player_count, self.boss_name)
+        text = self._render_cache.get(key)
+        if text is None:
+            text = self._render_cache[key] = _multiplied(self.cast_multiple(roll, count), count)
+        return text
+
+    def render_turn(self, rolls, separator="\n\n\n", aggregate=False):
+        """Cast every roll of a turn and return the spell texts as one block.
+
+        With ``aggregate``, each distinct spell is shown once, in the order it was first
+        rolled, with how many times it was cast and the quantities summed over the casts.
+        """
+        if aggregate:
+            return separator.join([self.render_multiple(roll, rolls.count(roll)) for roll in dict.fromkeys(rolls)])
+        return separator.join([self.render(roll) for roll in rolls])
+
+    # Arcane intuition texts, and for each roll value the bitmask of texts it reveals
+    HINTS = ()
+    ROLL_HINTS = (0,) * 11
+
+    def hint_mask(self, rolls):
+        mask = 0
+        for roll in rolls:
+            mask |= self.ROLL_HINTS[roll]
+        return mask
+
+    def hint_text(self, mask):
+        return _hint_text(self.HINTS, mask)
 
     def get_attack_hint(self, num_list):
-        result = []
-        CHANNEL_TEXT = "The boss is channeling energy!  "
-        ATTACK_TEXT = "The boss is amassing armies!  "
-        HEAL_TEXT = "The boss is about to heal!  "
-        CHANNEL_LIST = [0, 1, 3, 7, 9]
-        ATTACK_LIST = [2, 4, 5, 6, 8]
-        HEAL_LIST = [10]
-        for num in num_list:
-            if num in CHANNEL_LIST:
-                if CHANNEL_TEXT not in result:
-                    result.append(CHANNEL_TEXT)
-            if num in ATTACK_LIST:
-                if ATTACK_TEXT not in result:
-                    result.append(ATTACK_TEXT)
-            if num in HEAL_LIST:
-                if HEAL_TEXT not in result:
-                    result.append(HEAL_TEXT)
-        return " ".join(result) + "\n"
+        return self.hint_text(self.hint_mask(num_list))
 
+    def render_key(self):
+        """The state that the text of non-stateful spells depends on."""
+        return (self.player_count, self.boss_name)
 
-# BOSS 2
+    def spell_tokens(self, roll):
+        return self.effect(roll).token_count
 
+    @classmethod
+    def heal_table(cls, player_count=4):
+        """How much each roll value heals the boss."""
+        return [effect.heal for effect in cls.effect_table(player_count)]
 
-class HorrorfromtheDepths(Boss):
 
-    def __init__(self, boss_name="", player_count=4, poison=0):
-        super().__init__(boss_name, player_count, poison)
-        self.boss_funcs = {
-            0: self.two,
-            1: self.three,
-            2: self.four,
-            3: self.five,
-            4: self.six,
-            5: self.seven,
-            6: self.eight,
-            7: self.nine,
-            8: self.ten,
-            9: self.eleven,
-            10: self.twelve,
-        }
+@lru_cache(maxsize=256)
+def _effect_table(boss_cls, player_count):
+    return tuple(boss_cls.spell_effects(player_count))
 
-    def two(self):
-        return """BOSS SPELL> Return all nonland, non-boss permanents to their owner's hands."""
 
-    def three(self):
-        return """BOSS SPELL> For each player, create a blue enchantment token named
-        Curse of Sinking with "Whenever you gain life, mill that many cards."""
-
-    def four(self):
-        return f"""BOSS SPELL> Return {self.player_count * 1} nonland, nontoken permanents to their owner's hands."""
-
-    def five(self):
-        return f"""BOSS SPELL> For each player, create a blue enchantment token named
-        Curse of Rising Tides with "Whenever you draw one or more cards, mill that many cards."""
-
-    def six(self):
-        return f"""BOSS SPELL> Create {self.player_count * 1} 1/1 blue tentacle creature tokens with decayed, haste
-        and "This creature gets +1/+1 for each instant or sorcery in defending player's graveyard."
-        One token attacks each player this combat."""
-
-    def seven(self):
-        return f"""BOSS SPELL> Create {self.player_count * 2} 1/1 blue jellyfish creature tokens with first strike, decayed, haste and 
-        "When this creature deals combat damage to a player, that player chooses an untapped creature they control, taps it
-        and puts a stun counter on it." Two tokens attack each player this combat."""
+class TheManaGod(Boss):
 
-    def eight(self):
-        return f"""BOSS SPELL> Create {self.player_count * 1} 1/1 blue spawn creature tokens with decayed, haste and 
-        "This creature gets +1/+0 for each card in defending player's hand." One token attacks each player this combat."""
+    STATEFUL_ROLLS = frozenset({8, 10})
+    HINTS = (
+        "The boss is channeling energy!  ",
+        "The boss is amassing armies!  ",
+        "The boss is about to heal!  ",
+    )
+    ROLL_HINTS = _roll_hints([0, 1, 3, 7, 9], [2, 4, 5, 6, 8], [10])
+    SPELL_TEXTS = (
+        # 2
+        """BOSS SPELL> Each player chooses three: sacrifice all creatures you control, sacrifice all enchantments you control, 
+sacrifice all artifacts you control, exile your graveyard. Boss permanents cannot be sacrificed this way.""",
+        # 3
+        """BOSS SPELL> For each player, create a colorless Boss enchantment token named Curse of Confusion under their control with 
+"At the beginning of your end step, choose one: sacrifice a permanent, discard a card, or mill 5.""",
+        # 4
+        """BOSS SPELL> Create {effect.tokens[0].count} 1/1 red goblin zombie creature tokens with first strike, decayed, and haste.
+ Four tokens attack each player this combat.""",
+        # 5
+        """BOSS SPELL> Players discard {effect.discard} divided between players.""",
+        # 6
+        """BOSS SPELL> Create {effect.tokens[0].count} 2/2 black vampire zombie creature tokens with menace, decayed, and haste.
+ Two tokens attack each player this combat.""",
+        # 7
+        """BOSS SPELL> Create {effect.tokens[0].count} 5/5 green beast zombie creature token with trample, decayed, and haste. 
+One token attacks each player this combat.""",
+        # 8
+        """BOSS SPELL> Create {effect.tokens[0].count} 2/2 blue drake zombie creature token with flying, decayed, and haste. 
+Two token attacks each player this combat.""",
+        # 9
+        """BOSS SPELL> Players sacrifice {effect.sacrifice} nonland, non-token permanents divided between players.""",
+        # 10
+        """BOSS SPELL> Create {effect.tokens[0].count} 1/1 white cleric zombie creature tokens with 'enters' lifelink (this lifegain cannot be prevented), decayed, 
+and haste. Four tokens attack each player this combat. Boss heals {effect.heal} from the clerics!""",
+        # 11
+        """BOSS SPELL> For each player, create a colorless artifact token named Altar of Bleeding under their 
+control with 'At the beginning of your end step, you lose 3 life unless you pay 2.'""",
+        # 12
+        """BOSS SPELL> {boss.boss_name} heals {effect.heal}
+{boss.boss_name}'s health is now {boss.health}!""",
+    )
+
+    @staticmethod
+    def spell_effects(player_count):
+        n = player_count
+        return (
+            NO_EFFECT,  # each player chooses what to lose
+            SpellEffect(tokens=(Token("Curse of Confusion", n, creature=False),)),
+            SpellEffect(tokens=(Token("red goblin zombie", 4 * n, 1, 1, ("first strike", "decayed", "haste")),)),
+            SpellEffect(discard=2 * n),
+            SpellEffect(tokens=(Token("black vampire zombie", 2 * n, 2, 2, ("menace", "decayed", "haste")),)),
+            SpellEffect(tokens=(Token("green beast zombie", n, 5, 5, ("trample", "decayed", "haste")),)),
+            SpellEffect(tokens=(Token("blue drake zombie", 2 * n, 2, 2, ("flying", "decayed", "haste")),)),
+            SpellEffect(sacrifice=n),
+            SpellEffect(
+                tokens=(Token("white cleric zombie", 4 * n, 1, 1, ("lifelink", "decayed", "haste")),), heal=4 * n
+            ),
+            SpellEffect(tokens=(Token("Altar of Bleeding", n, creature=False),)),
+            SpellEffect(heal=20 * n),
+        )
 
-    def nine(self):
-        return f"""BOSS SPELL> For each player, create a blue enchantment token named Curse of Rising Tides with
-        "Whenever you draw one or more cards, mill that many cards."""
 
-    def ten(self):
-        return f"""BOSS SPELL> Return {self.player_count * 1} nonland, nontoken permanents to their owner's hands."""
+# BOSS 2
 
-    def eleven(self):
-        return """BOSS SPELL> For each player, create a blue enchantment token named Curse of Sinking with 
-        "Whenever you gain life, mill that many cards."""
 
-    def twelve(self):
-        return f"""BOSS SPELL> Return all nonland, non-boss permanents to their owner's hands."""
+class HorrorfromtheDepths(Boss):
 
-    def get_attack_hint(self, num_list):
-        result = []
-        RECOIL_TEXT = "The Horror recoils as it prepares to unleash a massive tidal wave. "
-        CHANNEL_TEXT = "The Horror is channeling dark energies. "
-        ATTACK_TEXT = "The Horror is summoning beasts from the depths. "
-        CHANNEL_LIST = [1, 2, 3, 7, 8, 9]
-        ATTACK_LIST = [4, 5, 6]
-        RECOIL_LIST = [0, 10]
-        for num in num_list:
-            if num in CHANNEL_LIST:
-                if CHANNEL_TEXT not in result:
-                    result.append(CHANNEL_TEXT)
-            if num in ATTACK_LIST:
-                if ATTACK_TEXT not in result:
-                    result.append(ATTACK_TEXT)
-            if num in RECOIL_LIST:
-                if RECOIL_TEXT not in result:
-                    result.append(RECOIL_TEXT)
-        return " ".join(result) + "\n"
+    HINTS = (
+        "The Horror is channeling dark energies. ",
+        "The Horror is summoning beasts from the depths. ",
+        "The Horror recoils as it prepares to unleash a massive tidal wave. ",
+    )
+    ROLL_HINTS = _roll_hints([1, 2, 3, 7, 8, 9], [4, 5, 6], [0, 10])
+    SPELL_TEXTS = (
+        # 2
+        """BOSS SPELL> Return all nonland, non-boss permanents to their owner's hands.""",
+        # 3
+        """BOSS SPELL> For each player, create a blue enchantment token named
+        Curse of Sinking with "Whenever you gain life, mill that many cards.""",
+        # 4
+        """BOSS SPELL> Return {effect.bounce} nonland, nontoken permanents to their owner's hands.""",
+        # 5
+        """BOSS SPELL> For each player, create a blue enchantment token named
+        Curse of Rising Tides with "Whenever you draw one or more cards, mill that many cards.""",
+        # 6
+        """BOSS SPELL> Create {effect.tokens[0].count} 1/1 blue tentacle creature tokens with decayed, haste
+        and "This creature gets +1/+1 for each instant or sorcery in defending player's graveyard."
+        One token attacks each player this combat.""",
+        # 7
+        """BOSS SPELL> Create {effect.tokens[0].count} 1/1 blue jellyfish creature tokens with first strike, decayed, haste and 
+        "When this creature deals combat damage to a player, that player chooses an untapped creature they control, taps it
+        and puts a stun counter on it." Two tokens attack each player this combat.""",
+        # 8
+        """BOSS SPELL> Create {effect.tokens[0].count} 1/1 blue spawn creature tokens with decayed, haste and 
+        "This creature gets +1/+0 for each card in defending player's hand." One token attacks each player this combat.""",
+        # 9
+        """BOSS SPELL> For each player, create a blue enchantment token named Curse of Rising Tides with
+        "Whenever you draw one or more cards, mill that many cards.""",
+        # 10
+        """BOSS SPELL> Return {effect.bounce} nonland, nontoken permanents to their owner's hands.""",
+        # 11
+        """BOSS SPELL> For each player, create a blue enchantment token named Curse of Sinking with 
+        "Whenever you gain life, mill that many cards.""",
+        # 12
+        """BOSS SPELL> Return all nonland, non-boss permanents to their owner's hands.""",
+    )
+
+    @staticmethod
+    def spell_effects(player_count):
+        n = player_count
+        return (
+            SpellEffect(bounce=ALL),
+            SpellEffect(tokens=(Token("Curse of Sinking", n, creature=False),)),
+            SpellEffect(bounce=n),
+            SpellEffect(tokens=(Token("Curse of Rising Tides", n, creature=False),)),
+            SpellEffect(tokens=(Token("blue tentacle", n, 1, 1, ("decayed", "haste")),)),
+            SpellEffect(tokens=(Token("blue jellyfish", 2 * n, 1, 1, ("first strike", "decayed", "haste")),)),
+            SpellEffect(tokens=(Token("blue spawn", n, 1, 1, ("decayed", "haste")),)),
+            SpellEffect(tokens=(Token("Curse of Rising Tides", n, creature=False),)),
+            SpellEffect(bounce=n),
+            SpellEffect(tokens=(Token("Curse of Sinking", n, creature=False),)),
+            SpellEffect(bounce=ALL),
+        )
 
 
 class LunarChanneler(Boss):
 
-    def __init__(self, boss_name="", player_count=4, poison=0):
-        super().__init__(boss_name, player_count, poison)
-        self.boss_funcs = {
-            0: self.two,
-            1: self.three,
-            2: self.four,
-            3: self.five,
-            4: self.six,
-            5: self.seven,
-            6: self.eight,
-            7: self.nine,
-            8: self.ten,
-            9: self.eleven,
-            10: self.twelve,
-        }
-
-    def two(self):
-        return f"""BOSS SPELL> create {self.player_count * 1}  X/X Spirit Zombie Cleric with "when this creature attacks, tap target creature defending player controls at random"
-        where X is the total number of cards in all graveyards with haste, decayed, menace. 1 token attacks each player this combat. """
-
-    def three(self):
-        return """BOSS SPELL> Lunar Channeler creates "Moon's Presence" an enchantment aura with "enchant player. 
-        Lunar Light Soldier creatures the boss controls gain +1/+1 for each Aura attached to players." Randomly attach it to a player."""
-
-    def four(self):
-        return f"""BOSS SPELL> Create {self.player_count * 3} Lunar Light Soldiers with haste and decayed. 3 tokens attack each player this combat."""
-
-    def five(self):
-        return f"""BOSS SPELL> create {self.player_count * 2} 1/1 Lunar Light Soldiers with decayed and haste"""
-
-    def six(self):
-        return f"""BOSS SPELL> Lunar Channeler creates "Curse of the full Moon" an enchantment with "enchant player. 
-        Enchanted player's creatures get -X/0 where X is the number of cards in enchanted players hand." Randomly attach it to a player."""
-
-    def seven(self):
-        return f"""BOSS SPELL> Make a Pumpkin Totem artifact enchantment token with "enchant player. at your end step the boss heals 5." Randomly attach it to a player. """
-
-    def eight(self):
-        return f"""BOSS SPELL> Lunar Channeler creates "Moon's Watcher" an enchantment with "enchant player. 
+    HINTS = (
+        "Lunar Channeler begins chanting at the moon.",
+        "Lunar Channeler is conjuring entities.",
+        "An unsettling energy eminates from the moon... ",
+        "The ground begins to open at Lunar Channeler's feet.",
+    )
+    ROLL_HINTS = _roll_hints([1, 4, 5, 6], [2, 3, 7, 8, 9], [10], [0])
+    SPELL_TEXTS = (
+        # 2
+        """BOSS SPELL> create {effect.tokens[0].count}  X/X Spirit Zombie Cleric with "when this creature attacks, tap target creature defending player controls at random"
+        where X is the total number of cards in all graveyards with haste, decayed, menace. 1 token attacks each player this combat. """,
+        # 3
+        """BOSS SPELL> Lunar Channeler creates "Moon's Presence" an enchantment aura with "enchant player. 
+        Lunar Light Soldier creatures the boss controls gain +1/+1 for each Aura attached to players." Randomly attach it to a player.""",
+        # 4
+        """BOSS SPELL> Create {effect.tokens[0].count} Lunar Light Soldiers with haste and decayed. 3 tokens attack each player this combat.""",
+        # 5
+        """BOSS SPELL> create {effect.tokens[0].count} 1/1 Lunar Light Soldiers with decayed and haste""",
+        # 6
+        """BOSS SPELL> Lunar Channeler creates "Curse of the full Moon" an enchantment with "enchant player. 
+        Enchanted player's creatures get -X/0 where X is the number of cards in enchanted players hand." Randomly attach it to a player.""",
+        # 7
+        """BOSS SPELL> Make a Pumpkin Totem artifact enchantment token with "enchant player. at your end step the boss heals 5." Randomly attach it to a player. """,
+        # 8
+        """BOSS SPELL> Lunar Channeler creates "Moon's Watcher" an enchantment with "enchant player. 
         Whenever enchanted player attacks with one or more creatures, this enchantment becomes a 0/1 indestructible white Lunar Statue. 
-        It gains "this creature blocks the creature with the highest power among attacking creatures." Randomly attach it to a player."""
-
-    def nine(self):
-        return f"""BOSS SPELL> create {self.player_count * 2} white Lunar Light Soldiers with haste and decayed."""
-
-    def ten(self):
-        return f"""BOSS SPELL> Create {self.player_count * 1} white and blue Moon's Disciple an X/X Spirit with decayed, haste and flying and this creature gets +1/+1 where X is the number of turns the boss has taken (including this one).."""
-
-    def eleven(self):
-        return f"""BOSS SPELL> create {self.player_count * 3} white Lunar Light Soldiers with haste and decayed. 3 tokens attach each player this combat."""
-
-    def twelve(self):
-        return f"""BOSS SPELL> Create {self.player_count * 1} 5/5 Reflection of Emrakul, Freed from the Moon, an Eldrazi creature with haste, decayed, trample, flying and Annihilator 1."""
-
-    def get_attack_hint(self, num_list):
-        result = []
-        EMRAKUL_TEXT = "An unsettling energy eminates from the moon... "
-        ZOMBIE_TEXT = "The ground begins to open at Lunar Channeler's feet."
-        CHANNEL_TEXT = "Lunar Channeler begins chanting at the moon."
-        ATTACK_TEXT = "Lunar Channeler is conjuring entities."
-        CHANNEL_LIST = [1, 4, 5, 6]
-        ATTACK_LIST = [2, 3, 7, 8, 9]
-        EMRAKUL_LIST = [10]
-        ZOMBIE_LIST = [0]
-        for num in num_list:
-            if num in CHANNEL_LIST:
-                if CHANNEL_TEXT not in result:
-                    result.append(CHANNEL_TEXT)
-            if num in ATTACK_LIST:
-                if ATTACK_TEXT not in result:
-                    result.append(ATTACK_TEXT)
-            if num in EMRAKUL_LIST:
-                if EMRAKUL_TEXT not in result:
-                    result.append(EMRAKUL_TEXT)
-            if num in ZOMBIE_LIST:
-                if ZOMBIE_TEXT not in result:
-                    result.append(ZOMBIE_TEXT)
-        return " ".join(result) + "\n"
+        It gains "this creature blocks the creature with the highest power among attacking creatures." Randomly attach it to a player.""",
+        # 9
+        """BOSS SPELL> create {effect.tokens[0].count} white Lunar Light Soldiers with haste and decayed.""",
+        # 10
+        """BOSS SPELL> Create {effect.tokens[0].count} white and blue Moon's Disciple an X/X Spirit with decayed, haste and flying and this creature gets +1/+1 where X is the number of turns the boss has taken (including this one)..""",
+        # 11
+        """BOSS SPELL> create {effect.tokens[0].count} white Lunar Light Soldiers with haste and decayed. 3 tokens attach each player this combat.""",
+        # 12
+        """BOSS SPELL> Create {effect.tokens[0].count} 5/5 Reflection of Emrakul, Freed from the Moon, an Eldrazi creature with haste, decayed, trample, flying and Annihilator 1.""",
+    )
+
+    @staticmethod
+    def spell_effects(player_count):
+        n = player_count
+        return (
+            SpellEffect(tokens=(Token("Spirit Zombie Cleric", n, keywords=("haste", "decayed", "menace")),)),
+            SpellEffect(tokens=(Token("Moon's Presence", 1, creature=False),), auras=("Moon's Presence",)),
+            SpellEffect(tokens=(Token("Lunar Light Soldier", 3 * n, keywords=("haste", "decayed")),)),
+            SpellEffect(tokens=(Token("Lunar Light Soldier", 2 * n, 1, 1, ("decayed", "haste")),)),
+            SpellEffect(
+                tokens=(Token("Curse of the full Moon", 1, creature=False),), auras=("Curse of the full Moon",)
+            ),
+            SpellEffect(tokens=(Token("Pumpkin Totem", 1, creature=False),), auras=("Pumpkin Totem",)),
+            SpellEffect(tokens=(Token("Moon's Watcher", 1, creature=False),), auras=("Moon's Watcher",)),
+            SpellEffect(tokens=(Token("white Lunar Light Soldier", 2 * n, keywords=("haste", "decayed")),)),
+            SpellEffect(tokens=(Token("Moon's Disciple", n, keywords=("decayed", "haste", "flying")),)),
+            SpellEffect(tokens=(Token("white Lunar Light Soldier", 3 * n, keywords=("haste", "decayed")),)),
+            SpellEffect(
+                tokens=(
+                    Token("Reflection of Emrakul", n, 5, 5, ("haste", "decayed", "trample", "flying", "annihilator 1")),
+                )
+            ),
+        )
@@ -0,0 +1,369 @@
+"""Data-driven bosses compiled from ``data/BossMaster.xlsx``.
+
+The workbook is stream-parsed straight from its XML parts (no openpyxl). Each boss row
+holds a roll result (2-12), the spell text for each phase and its Arcane Intuition hint.
+Spell texts may contain ``{self.<attr>}`` or ``{self.<attr> * n}`` placeholders, exactly
+as the hand-written spells in ``boss.py`` do; a spell with a ``heals {...}`` placeholder
+heals the boss by that amount when cast.
+
+The compiled definitions are written to a binary cache next to the workbook, keyed by
+the workbook's mtime and size, so the xlsx is only parsed again after it changes.
+
+The default workbook's bosses are on the boss menu as a pack (see ``workbook_bosses``);
+their registry targets name classes on this module, which are built when first picked.
+"""
+
+import ast
+import marshal
+import os
+import re
+import zipfile
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple, Type
+from xml.etree.ElementTree import iterparse
+
+from raid_boss.boss import Boss
+from raid_boss.registry import BossInfo
+from raid_boss.spells import NO_EFFECT, SpellEffect
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+WORKBOOK_PATH = os.path.join(DATA_DIR, "BossMaster.xlsx")
+
+_MAIN_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_REL_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_PACKAGE_REL_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+_CACHE_MAGIC = b"RBBC"
+_CACHE_VERSION = 2
+_PLACEHOLDER = re.compile(r"\{([^{}]*)\}")
+# Spell text is cached until one of these changes (see Boss.render), so only they may appear
+_ALLOWED_ATTRIBUTES = ("player_count", "boss_name", "health")
+_HEAL_MARKER = "heals "
+ROLL_RESULTS = range(2, 13)
+
+# A compiled placeholder: (attribute, multiplier); multiplier is None for text attributes.
+Placeholder = Tuple[str, Optional[int]]
+# A compiled template: literal text followed by a placeholder, with a trailing literal.
+Template = Tuple[Tuple[Tuple[str, Placeholder], ...], str]
+
+
+@dataclass(frozen=True)
+class SpellDefinition:
+    phases: Tuple[Template, ...]
+    heal: Optional[Placeholder]
+    hint: str
+
+
+@dataclass(frozen=True)
+class BossDefinition:
+    name: str
+    spells: Tuple[SpellDefinition, ...]  # indexed like boss_funcs (roll result - 2)
+
+
+def _column_index(cell_ref: str) -> int:
+    index = 0
+    for char in cell_ref:
+        if not char.isalpha():
+            break
+        index = index * 26 + ord(char.upper()) - ord("A") + 1
+    return index - 1
+
+
+def _first_sheet_path(workbook: zipfile.ZipFile) -> str:
+    with workbook.open("xl/workbook.xml") as workbook_xml:
+        for _, element in iterparse(workbook_xml):
+            if element.tag == f"{_MAIN_NS}sheet":
+                sheet_id = element.get(f"{_REL_NS}id")
+                break
+        else:
+            raise ValueError("Workbook has no sheets")
+    with workbook.open("xl/_rels/workbook.xml.rels") as rels_xml:
+        for _, element in iterparse(rels_xml):
+            if element.tag == f"{_PACKAGE_REL_NS}Relationship" and element.get("Id") == sheet_id:
+                target = element.get("Target").lstrip("/")
+                return target if target.startswith("xl/") else f"xl/{target}"
+    raise ValueError(f"Workbook relationship {sheet_id} not found")
+
+
+def _shared_strings(workbook: zipfile.ZipFile) -> List[str]:
+    if "xl/sharedStrings.xml" not in workbook.namelist():
+        return []
+    strings = []
+    with workbook.open("xl/sharedStrings.xml") as strings_xml:
+        for _, element in iterparse(strings_xml):
+            if element.tag == f"{_MAIN_NS}si":
+                strings.append("".join(text.text or "" for text in element.iter(f"{_MAIN_NS}t")))
+                element.clear()
+    return strings
+
+
+def read_rows(path: str = WORKBOOK_PATH) -> Iterator[Dict[str, str]]:
+    """Yield the first sheet's rows as dicts keyed by the header row."""
+    with zipfile.ZipFile(path) as workbook:
+        strings = _shared_strings(workbook)
+        header: Optional[List[str]] = None
+        with workbook.open(_first_sheet_path(workbook)) as sheet_xml:
+            for _, element in iterparse(sheet_xml):
+                if element.tag != f"{_MAIN_NS}row":
+                    continue
+                values: Dict[int, str] = {}
+                for cell in element.iter(f"{_MAIN_NS}c"):
+                    cell_type = cell.get("t")
+                    if cell_type == "inlineStr":
+                        value = "".join(text.text or "" for text in cell.iter(f"{_MAIN_NS}t"))
+                    else:
+                        raw = cell.find(f"{_MAIN_NS}v")
+                        if raw is None or raw.text is None:
+                            continue
+                        value = strings[int(raw.text)] if cell_type == "s" else raw.text
+                    values[_column_index(cell.get("r"))] = value
+                element.clear()
+                if header is None:
+                    header = [values.get(index, "").strip() for index in range(max(values, default=-1) + 1)]
+                elif values:
+                    yield {name: values.get(index, "") for index, name in enumerate(header) if name}
+
+
+def _compile_placeholder(expression: str, where: str) -> Placeholder:
+    try:
+        node = ast.parse(expression.strip(), mode="eval").body
+    except SyntaxError as error:
+        raise ValueError(f"{where}: cannot parse placeholder {{{expression}}}") from error
+
+    def attribute(candidate) -> Optional[str]:
+        if (
+            isinstance(candidate, ast.Attribute)
+            and isinstance(candidate.value, ast.Name)
+            and candidate.value.id == "self"
+            and candidate.attr in _ALLOWED_ATTRIBUTES
+        ):
+            return candidate.attr
+        return None
+
+    if attribute(node):
+        return attribute(node), None if node.attr == "boss_name" else 1
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Mult):
+        for left, right in ((node.left, node.right), (node.right, node.left)):
+            if attribute(left) and attribute(left) != "boss_name" and isinstance(right, ast.Constant):
+                if isinstance(right.value, int):
+                    return attribute(left), right.value
+    raise ValueError(f"{where}: unsupported placeholder {{{expression}}}")
+
+
+def compile_template(text: str, where: str = "template") -> Template:
+    parts = []
+    position = 0
+    for match in _PLACEHOLDER.finditer(text):
+        parts.append((text[position : match.start()], _compile_placeholder(match.group(1), where)))
+        position = match.end()
+    return tuple(parts), text[position:]
+
+
+def _heal_placeholder(template: Template) -> Optional[Placeholder]:
+    parts, _ = template
+    for literal, placeholder in parts:
+        if literal.endswith(_HEAL_MARKER) and placeholder[1] is not None:
+            return placeholder
+    return None
+
+
+def compile_definitions(rows: Iterator[Dict[str, str]]) -> Dict[str, BossDefinition]:
+    """Group workbook rows into one definition per boss."""
+    spells: Dict[str, Dict[int, SpellDefinition]] = {}
+    for row in rows:
+        name = row.get("BossName", "").strip()
+        if not name:
+            continue
+        roll_result = int(float(row["RollResult"]))
+        if roll_result not in ROLL_RESULTS:
+            raise ValueError(f"{name}: roll result {roll_result} is not between 2 and 12")
+        phase_columns = sorted(
+            (column for column in row if column.replace(" ", "").lower().startswith("phase")),
+            key=lambda column: int(re.sub(r"\D", "", column) or 0),
+        )
+        phases = tuple(
+            compile_template(row[column].strip(), f"{name} roll {roll_result} {column}")
+            for column in phase_columns
+            if row[column].strip()
+        )
+        if not phases:
+            raise ValueError(f"{name}: roll {roll_result} has no spell text")
+        spells.setdefault(name, {})[roll_result] = SpellDefinition(
+            phases=phases,
+            heal=_heal_placeholder(phases[0]),
+            hint=row.get("Arcane Intuition", "").strip(),
+        )
+
+    definitions = {}
+    for name, by_roll in spells.items():
+        missing = [roll for roll in ROLL_RESULTS if roll not in by_roll]
+        if missing:
+            raise ValueError(f"{name}: missing roll results {missing}")
+        definitions[name] = BossDefinition(name=name, spells=tuple(by_roll[roll] for roll in ROLL_RESULTS))
+    return definitions
+
+
+def _to_plain(definitions: Dict[str, BossDefinition]):
+    return tuple(
+        (
+            definition.name,
+            tuple((spell.phases, spell.heal, spell.hint) for spell in definition.spells),
+        )
+        for definition in definitions.values()
+    )
+
+
+def _from_plain(plain) -> Dict[str, BossDefinition]:
+    return {
+        name: BossDefinition(
+            name=name,
+            spells=tuple(SpellDefinition(phases=phases, heal=heal, hint=hint) for phases, heal, hint in spells),
+        )
+        for name, spells in plain
+    }
+
+
+def default_cache_path(workbook_path: str) -> str:
+    return os.path.splitext(workbook_path)[0] + ".cache"
+
+
+def load_definitions(path: str = WORKBOOK_PATH, cache_path: Optional[str] = None) -> Dict[str, BossDefinition]:
+    """Load boss definitions from the binary cache, recompiling the workbook if it changed."""
+    cache_path = cache_path or default_cache_path(path)
+    stat = os.stat(path)
+    key = (_CACHE_VERSION, marshal.version, stat.st_mtime_ns, stat.st_size)
+    try:
+        with open(cache_path, "rb") as cache_file:
+            if cache_file.read(len(_CACHE_MAGIC)) == _CACHE_MAGIC:
+                cached_key, plain = marshal.load(cache_file)
+                if cached_key == key:
+                    return _from_plain(plain)
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+
+    definitions = compile_definitions(read_rows(path))
+    try:
+        with open(cache_path, "wb") as cache_file:
+            cache_file.write(_CACHE_MAGIC)
+            marshal.dump((key, _to_plain(definitions)), cache_file)
+    except OSError:
+        # A read-only install still works, it just parses the workbook every time
+        pass
+    return definitions
+
+
+def render_template(template: Template, boss: Boss, casts: int = 1) -> str:
+    """Fill in a spell template; per-player quantities are summed over ``casts``."""
+    parts, tail = template
+    pieces = []
+    for literal, (attribute, multiplier) in parts:
+        value = getattr(boss, attribute)
+        pieces.append(literal)
+        if multiplier is not None:
+            value *= multiplier * casts if attribute == "player_count" else multiplier
+        pieces.append(str(value))
+    pieces.append(tail)
+    return "".join(pieces)
+
+
+class DataBoss(Boss):
+    """A boss whose spells and hints come from a ``BossDefinition``.
+
+    Concrete classes are made per definition by ``boss_class`` so they can be built like
+    the hand-written bosses (``cls(boss_name=..., player_count=...)``).
+    """
+
+    DEFINITION: BossDefinition = None
+
+    def __init__(self, boss_name="", player_count=4, poison=0):
+        super().__init__(boss_name, player_count, poison)
+        self.starting_health = self.health
+        self.boss_funcs = {roll: self._spell(roll) for roll in range(len(self.DEFINITION.spells))}
+
+    @property
+    def phase(self) -> int:
+        """Phase 2 starts once the boss is down to half of its starting health."""
+        return 1 if self.health <= self.starting_health / 2 else 0
+
+    @classmethod
+    def spell_effects(cls, player_count):
+        # Heals scale with a boss attribute, so read it off a fresh boss
+        probe = cls(player_count=player_count)
+        effects = []
+        for spell in cls.DEFINITION.spells:
+            if spell.heal is None:
+                effects.append(NO_EFFECT)
+            else:
+                attribute, multiplier = spell.heal
+                effects.append(SpellEffect(heal=getattr(probe, attribute) * multiplier))
+        return effects
+
+    def cast_multiple(self, roll, count):
+        spell = self.DEFINITION.spells[roll]
+        if spell.heal is not None:
+            attribute, multiplier = spell.heal
+            for _ in range(count):
+                self.health += getattr(self, attribute) * multiplier
+        template = spell.phases[min(self.phase, len(spell.phases) - 1)]
+        return "BOSS SPELL> " + render_template(template, self, count)
+
+    def _spell(self, roll):
+        def cast():
+            return self.cast_multiple(roll, 1)
+
+        return cast
+
+    def render_key(self):
+        return (self.player_count, self.boss_name, self.phase)
+
+
+def _class_name(definition: BossDefinition) -> str:
+    return re.sub(r"\W", "", definition.name) or "DataBoss"
+
+
+def boss_class(definition: BossDefinition) -> Type[DataBoss]:
+    # Heals change the boss, and text that shows its health goes stale as soon as it takes damage
+    stateful = frozenset(
+        roll
+        for roll, spell in enumerate(definition.spells)
+        if spell.heal is not None
+        or any(placeholder[0] == "health" for phase in spell.phases for _, placeholder in phase[0])
+    )
+    hints = tuple(dict.fromkeys(spell.hint for spell in definition.spells if spell.hint))
+    roll_hints = tuple(1 << hints.index(spell.hint) if spell.hint else 0 for spell in definition.spells)
+    return type(
+        _class_name(definition),
+        (DataBoss,),
+        {"DEFINITION": definition, "STATEFUL_ROLLS": stateful, "HINTS": hints, "ROLL_HINTS": roll_hints},
+    )
+
+
+def load_bosses(path: str = WORKBOOK_PATH, cache_path: Optional[str] = None) -> Dict[str, Type[DataBoss]]:
+    """Boss classes for every boss in the workbook, keyed by the workbook's boss name."""
+    return {name: boss_class(definition) for name, definition in load_definitions(path, cache_path).items()}
+
+
+@lru_cache(maxsize=None)
+def _workbook_classes() -> Dict[str, Type[DataBoss]]:
+    return {boss_cls.__name__: boss_cls for boss_cls in load_bosses().values()}
+
+
+def workbook_bosses() -> List[BossInfo]:
+    """Registry entries for the default workbook's bosses. Only the definitions are read."""
+    bosses = []
+    for definition in load_definitions().values():
+        slug = re.sub(r"\W+", "-", definition.name.lower()).strip("-")
+        hints = tuple(dict.fromkeys(spell.hint for spell in definition.spells if spell.hint))
+        target = f"{__name__}:{_class_name(definition)}"
+        bosses.append(BossInfo(f"bossmaster-{slug}", f"{definition.name} (BossMaster)", target, hints))
+    return bosses
+
+
+def __getattr__(name: str) -> Type[DataBoss]:
+    # Resolves the workbook bosses' registry targets, such as "raid_boss.boss_data:ManaGod"
+    if not name.startswith("_"):
+        classes = _workbook_classes()
+        if name in classes:
+            return classes[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,96 @@
+"""Closed-form forecasts of what the boss will cast on a given turn.
+
+Every roll is an independent draw from the 2d6 distribution (values 0-10, indexed into
+``boss_funcs``), so a turn with ``k`` rolls is a k-fold convolution of that distribution.
+The quantities below follow from it directly without sampling and are memoized per
+(boss class, turn, player count, curve).
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Tuple, Type
+
+from raid_boss.boss import Boss
+from raid_boss.rolls import ROLL_WEIGHTS, RollCurve, normal_curve
+
+ROLL_PROBABILITIES = tuple(weight / 36 for weight in ROLL_WEIGHTS)
+
+
+@dataclass(frozen=True)
+class TurnForecast:
+    turn: int
+    rolls: int
+    heal_chance: float  # probability that at least one roll heals the boss
+    expected_heal: float
+    expected_tokens: Tuple[float, ...]  # expected tokens created by each roll value
+
+    @property
+    def expected_total_tokens(self) -> float:
+        return sum(self.expected_tokens)
+
+
+@lru_cache(maxsize=None)
+def _spell_table(boss_cls: Type[Boss], player_count: int) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+    effects = boss_cls.effect_table(player_count)
+    return tuple(effect.heal for effect in effects), tuple(effect.token_count for effect in effects)
+
+
+def forecast_turn(boss_cls: Type[Boss], turn: int, player_count: int, curve: RollCurve = normal_curve) -> TurnForecast:
+    """Forecast one turn of ``boss_cls`` at ``player_count`` players."""
+    return _forecast_turn(boss_cls, turn, player_count, curve)
+
+
+@lru_cache(maxsize=4096)
+def _forecast_turn(boss_cls: Type[Boss], turn: int, player_count: int, curve: RollCurve) -> TurnForecast:
+    heals, tokens = _spell_table(boss_cls, player_count)
+    rolls = curve(turn)
+    heal_probability = sum(p for p, heal in zip(ROLL_PROBABILITIES, heals) if heal)
+    return TurnForecast(
+        turn=turn,
+        rolls=rolls,
+        heal_chance=1.0 - (1.0 - heal_probability) ** rolls,
+        expected_heal=rolls * sum(p * heal for p, heal in zip(ROLL_PROBABILITIES, heals)),
+        expected_tokens=tuple(rolls * p * count for p, count in zip(ROLL_PROBABILITIES, tokens)),
+    )
+
+
+def forecast_for(boss: Boss, turn: int, curve: RollCurve = normal_curve) -> TurnForecast:
+    """Forecast a turn for a boss that is already in play."""
+    return forecast_turn(type(boss), turn, boss.player_count, curve)
+
+
+def _convolve(a: Dict[int, float], b: Dict[int, float]) -> Dict[int, float]:
+    result: Dict[int, float] = {}
+    for heal_a, p_a in a.items():
+        for heal_b, p_b in b.items():
+            result[heal_a + heal_b] = result.get(heal_a + heal_b, 0.0) + p_a * p_b
+    return result
+
+
+def heal_distribution(
+    boss_cls: Type[Boss], turn: int, player_count: int, curve: RollCurve = normal_curve
+) -> Tuple[Tuple[int, float], ...]:
+    """Exact distribution of the total boss heal on a turn, as sorted (heal, probability) pairs."""
+    return _heal_distribution(boss_cls, turn, player_count, curve)
+
+
+@lru_cache(maxsize=1024)
+def _heal_distribution(
+    boss_cls: Type[Boss], turn: int, player_count: int, curve: RollCurve
+) -> Tuple[Tuple[int, float], ...]:
+    heals, _ = _spell_table(boss_cls, player_count)
+    single: Dict[int, float] = {}
+    for p, heal in zip(ROLL_PROBABILITIES, heals):
+        single[heal] = single.get(heal, 0.0) + p
+
+    # Raise the single roll distribution to the k-th convolution power by squaring
+    result = {0: 1.0}
+    power = single
+    rolls = curve(turn)
+    while rolls:
+        if rolls & 1:
+            result = _convolve(result, power)
+        rolls >>= 1
+        if rolls:
+            power = _convolve(power, power)
+    return tuple(sorted(result.items()))
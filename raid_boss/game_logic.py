@@ -1,14 +1,101 @@
-from typing import Optional, Tuple, Any, Callable
+from contextlib import nullcontext
+from functools import wraps
+from typing import Iterable, Optional, Tuple, Any, Callable
+from raid_boss.forecast import forecast_for
 from raid_boss.game_state import GameState
-from raid_boss.ui_components import GameOutput, TextType
-from raid_boss.game_text import GameTextManager
+from raid_boss.game_text import MESSAGES, TextType
+from raid_boss.journal import GameJournal
+from raid_boss.players import MAX_PLAYERS, parse_hit
+from raid_boss.sinks import MemorySink, OutputSink
+
+
+def batched(handler):
+    """Send everything a handler writes to the output in one batch."""
+
+    @wraps(handler)
+    def wrapper(self, *args, **kwargs):
+        batch = getattr(self.output, "batch", None)
+        with batch() if batch is not None else nullcontext():
+            return handler(self, *args, **kwargs)
+
+    return wrapper
 
 
 class GameLogic:
-    def __init__(self, game_state: GameState, output: GameOutput):
+    # Timed when metrics are turned on; see raid_boss/metrics.py
+    METERED = (
+        "handle_input",
+        "handle_player_count",
+        "handle_boss_name",
+        "handle_boss_selection",
+        "handle_player_damage",
+        "handle_defeated_players",
+        "_process_boss_attacks",
+        "_show_boss_hints",
+    )
+
+    def __init__(self, game_state: GameState, output: OutputSink, journal: Optional[GameJournal] = None):
         self.game_state = game_state
         self.output = output
-        self.text_manager = GameTextManager()
+        # Every answer handled through handle_input is journaled so the game can be resumed
+        self.journal = journal
+        self.text_manager = MESSAGES
+        # Phase handlers, built once; phase 6 (game over) takes no more input
+        self._phase_handlers = {
+            0: self.handle_player_count,
+            1: self.handle_boss_name,
+            2: self.handle_boss_selection,
+            3: self.handle_player_damage,
+            5: self.handle_defeated_players,
+        }
+
+    def handle_input(self, user_input: str) -> bool:
+        """Pass input to the current phase's handler. Returns False if the phase takes no input."""
+        handler = self._phase_handlers.get(self.game_state.phase)
+        if handler is None:
+            return False
+        handler(user_input)
+        if self.journal is not None:
+            self.journal.record(user_input, self.game_state)
+        return True
+
+    def replay(self, answers: Iterable[str]) -> None:
+        """Re-apply journaled answers without showing their output or journaling them again."""
+        output, journal = self.output, self.journal
+        self.output, self.journal = MemorySink(), None
+        try:
+            for answer in answers:
+                self.handle_input(answer)
+        finally:
+            self.output, self.journal = output, journal
+
+    @batched
+    def show_resume(self) -> None:
+        """Tell the players where a resumed game left off and ask the current phase's question."""
+        state = self.game_state
+        if state.boss is not None:
+            self.output.add_text(
+                f"Resuming the battle against {state.boss_name}: turn {state.boss.turn_count}, "
+                f"boss health {state.boss.health}.",
+                TextType.GAME_STATE,
+            )
+        else:
+            self.output.add_text("Resuming your game.", TextType.GAME_STATE)
+
+        if state.phase == 0:
+            self.output.add_text("How many people are playing?", TextType.PROMPT)
+        elif state.phase == 1:
+            self.output.add_text(self.text_manager.get_boss_name_prompt().content, TextType.PROMPT)
+        elif state.phase == 2:
+            for text in self.text_manager.get_boss_selection_menu(self.game_state.registry.menu_options()).values():
+                self.output.add_text(text.content, text.text_type)
+        elif state.phase == 3:
+            self.output.add_text(
+                self.text_manager.get_next_player_turn(state.active_player() + 1).content,
+                TextType.PROMPT,
+            )
+        elif state.phase == 5:
+            self.output.add_text(self.text_manager.get_defeated_players_prompt().content, TextType.PROMPT)
 
     def _validate_int_input(
         self, user_input: str, min_val: int, max_val: Optional[int] = None
@@ -24,28 +111,34 @@ class GameLogic:
         except ValueError:
             return False, None
 
-    def _handle_invalid_input(self, error_msg: str, prompt: str) -> None:
-        """Display error message and prompt for new input."""
-        self.output.add_text(error_msg, TextType.ERROR)
+    def _handle_invalid_input(self, error_key: str, **fields) -> None:
+        """Display the error message ``error_key``; it is only built when input is rejected."""
+        self.output.add_text(self.text_manager.get_error(error_key, **fields).content, TextType.ERROR)
 
     def _get_valid_input(
-        self, user_input: str, validator: Callable[[str], Tuple[bool, Any]], error_msg: str, prompt: str
+        self, user_input: str, validator: Callable[[str], Tuple[bool, Any]], error_key: str, **fields
     ) -> Tuple[bool, Any]:
         """Get and validate input, handling errors."""
         is_valid, value = validator(user_input)
         if not is_valid:
-            self._handle_invalid_input(error_msg, prompt)
+            self._handle_invalid_input(error_key, **fields)
         return is_valid, value
 
-    def handle_player_count(self, user_input: str) -> None:
-        def validate_players(input_str: str) -> Tuple[bool, Optional[int]]:
-            return self._validate_int_input(input_str, min_val=1)
+    def _validate_player_count(self, user_input: str) -> Tuple[bool, Optional[int]]:
+        return self._validate_int_input(user_input, min_val=1, max_val=MAX_PLAYERS)
+
+    @staticmethod
+    def _validate_damage(user_input: str) -> Tuple[bool, Optional[Tuple[int, int]]]:
+        hit = parse_hit(user_input)
+        return hit is not None, hit
+
+    def _validate_defeated(self, user_input: str) -> Tuple[bool, Optional[int]]:
+        return self._validate_int_input(user_input, min_val=0, max_val=self.game_state.num_players)
 
+    @batched
+    def handle_player_count(self, user_input: str) -> None:
         is_valid, player_count = self._get_valid_input(
-            user_input,
-            validate_players,
-            self.text_manager.get_error_messages()["invalid_player_count"].content,
-            self.text_manager.get_boss_name_prompt().content,
+            user_input, self._validate_player_count, "invalid_player_count", max_players=MAX_PLAYERS
         )
 
         if is_valid:
@@ -56,30 +149,26 @@ class GameLogic:
             self.output.add_text(self.text_manager.get_boss_name_prompt().content, TextType.PROMPT)
             self.game_state.phase = 1
 
+    @batched
     def handle_boss_name(self, user_input: str) -> None:
         if not user_input.strip():
-            self._handle_invalid_input(
-                self.text_manager.get_error_messages()["invalid_boss_name"].content,
-                self.text_manager.get_boss_name_prompt().content,
-            )
+            self._handle_invalid_input("invalid_boss_name")
             return
 
         self.game_state.boss_name = user_input
         self.output.add_text(self.text_manager.get_boss_introduction(user_input).content, TextType.GAME_STATE)
 
         # Display boss selection menu
-        menu = self.text_manager.get_boss_selection_menu()
+        menu = self.text_manager.get_boss_selection_menu(self.game_state.registry.menu_options())
         for text in menu.values():
             self.output.add_text(text.content, text.text_type)
 
         self.game_state.phase = 2
 
+    @batched
     def handle_boss_selection(self, user_input: str) -> None:
-        if user_input not in ["1", "2", "3"]:
-            self._handle_invalid_input(
-                self.text_manager.get_error_messages()["invalid_boss_selection"].content,
-                self.text_manager.get_boss_selection_menu()["prompt"].content,
-            )
+        if self.game_state.registry.find(user_input) is None:
+            self._handle_invalid_input("invalid_boss_selection", boss_count=len(self.game_state.registry))
             return
 
         self.game_state.initialize_boss(user_input)
@@ -95,21 +184,13 @@ class GameLogic:
 
         self.game_state.phase = 3
 
+    @batched
     def handle_player_damage(self, user_input: str) -> None:
-        def validate_damage(input_str: str) -> Tuple[bool, Optional[int]]:
-            return self._validate_int_input(input_str, min_val=0)
-
-        is_valid, damage = self._get_valid_input(
-            user_input,
-            validate_damage,
-            self.text_manager.get_error_messages()["invalid_damage"].content,
-            self.text_manager.get_next_player_turn(
-                self.game_state.boss.turn_count % self.game_state.num_players + 1
-            ).content,
-        )
+        is_valid, hit = self._get_valid_input(user_input, self._validate_damage, "invalid_damage")
 
         if is_valid:
-            self.game_state.process_damage(damage)
+            damage, poison = hit
+            self.game_state.process_damage(damage, poison)
 
             # Display damage report
             damage_report = self.text_manager.get_damage_report(
@@ -117,12 +198,20 @@ class GameLogic:
             )
             for text in damage_report.values():
                 self.output.add_text(text.content, text.text_type)
+            if poison:
+                self.output.add_text(
+                    self.text_manager.get_poison_report(
+                        self.game_state.boss_name, self.game_state.boss.poison, self.game_state.poison_needed
+                    ).content,
+                    TextType.GAME_STATE,
+                )
 
             if self.game_state.boss.health <= self.game_state.boss.health / 2:
                 self.output.add_text(self.text_manager.get_boss_rage().content, TextType.BOSS_ATTACK)
 
-            self.game_state.boss.current_attacks = self.game_state.store_prerolls[self.game_state.boss.turn_count]
-            self.game_state.boss.next_attacks = self.game_state.store_prerolls[self.game_state.boss.turn_count + 1]
+            turn_count = self.game_state.boss.turn_count
+            self.game_state.boss.current_attacks = self.game_state.lookahead.advance(turn_count).rolls
+            self.game_state.boss.next_attacks = self.game_state.lookahead[turn_count + 1].rolls
 
             self._process_boss_attacks()
             self._show_boss_hints()
@@ -130,17 +219,10 @@ class GameLogic:
             self.output.add_text(self.text_manager.get_defeated_players_prompt().content, TextType.PROMPT)
             self.game_state.phase = 5
 
+    @batched
     def handle_defeated_players(self, user_input: str) -> None:
-        def validate_defeated(input_str: str) -> Tuple[bool, Optional[int]]:
-            return self._validate_int_input(input_str, min_val=0, max_val=self.game_state.num_players)
-
         is_valid, defeated = self._get_valid_input(
-            user_input,
-            validate_defeated,
-            self.text_manager.get_error_messages()["invalid_defeated_players"].content.format(
-                num_players=self.game_state.num_players
-            ),
-            self.text_manager.get_defeated_players_prompt().content,
+            user_input, self._validate_defeated, "invalid_defeated_players", num_players=self.game_state.num_players
         )
 
         if is_valid:
@@ -148,7 +230,7 @@ class GameLogic:
             self.game_state.boss.turn_count += 1
 
             # Check if all players are defeated
-            if defeated >= self.game_state.num_players:
+            if self.game_state.defeat_players(defeated) == 0:
                 self.output.add_text("\nAll players have been defeated! The boss wins!", TextType.GAME_STATE)
                 self.show_game_over()
                 return
@@ -157,9 +239,7 @@ class GameLogic:
                 self.show_game_over()
             else:
                 self.output.add_text(
-                    self.text_manager.get_next_player_turn(
-                        self.game_state.boss.turn_count % self.game_state.num_players + 1
-                    ).content,
+                    self.text_manager.get_next_player_turn(self.game_state.active_player() + 1).content,
                     TextType.PROMPT,
                 )
                 self.game_state.phase = 3  # Keep phase at 3 to accept damage input
@@ -179,21 +259,31 @@ class GameLogic:
         for text in turn_info.values():
             self.output.add_text(text.content, text.text_type)
 
-        if self.game_state.boss.turn_count != 1:
-            self.output.add_text(self.text_manager.get_boss_attack_announcement().content, TextType.BOSS_ATTACK)
-            for num in self.game_state.boss.current_attacks:
-                self.output.add_text(
-                    self.text_manager.get_boss_attack(str(self.game_state.boss.boss_funcs[num]())).content,
-                    TextType.BOSS_ATTACK,
-                )
+        self.output.add_text(self.text_manager.get_boss_attack_announcement().content, TextType.BOSS_ATTACK)
+        lookahead = self.game_state.lookahead
+        attacks = lookahead.render_attacks(
+            lookahead[self.game_state.boss.turn_count], aggregate=self.game_state.aggregate_spells
+        )
+        self.output.add_text(self.text_manager.get_boss_attack(attacks).content, TextType.BOSS_ATTACK)
 
     def _show_boss_hints(self) -> None:
         hint = self.text_manager.get_boss_hint()
         self.output.add_text(hint["header"].content, TextType.GAME_STATE)
-        self.output.add_text(
-            self.game_state.boss.get_attack_hint(self.game_state.boss.next_attacks), TextType.GAME_STATE
+        self.output.add_text(self.game_state.lookahead.hint(self.game_state.boss.turn_count + 1), TextType.GAME_STATE)
+
+        # Next turn's rolls are already known, so forecast the one after it
+        forecast = forecast_for(
+            self.game_state.boss, self.game_state.boss.turn_count + 2, self.game_state.schedule.curve
         )
+        if forecast.heal_chance > 0:
+            self.output.add_text(
+                self.text_manager.get_boss_forecast(
+                    self.game_state.boss_name, forecast.heal_chance, forecast.expected_heal
+                ).content,
+                TextType.GAME_STATE,
+            )
 
+    @batched
     def show_game_over(self) -> None:
         game_over = self.text_manager.get_game_over(self.game_state.boss_name, self.game_state.is_game_over())
         for text in game_over.values():
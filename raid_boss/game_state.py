@@ -1,9 +1,28 @@
 from dataclasses import dataclass
-from typing import List, Optional
-import math
+from typing import Optional, Tuple, Union
 import random
+import struct
 
-from raid_boss.boss import Boss, TheManaGod, HorrorfromtheDepths, LunarChanneler
+from raid_boss.boss import Boss
+from raid_boss.lookahead import Lookahead
+from raid_boss.players import PlayerTable
+from raid_boss.registry import BossRegistry, default_registry
+from raid_boss.rolls import ROLL_CURVES, ReplayLog, RollCurve, RollSchedule, new_seed
+
+
+def _pack_text(text: str) -> bytes:
+    encoded = text.encode("utf-8")
+    return struct.pack("<H", len(encoded)) + encoded
+
+
+def _unpack_text(data: bytes, position: int) -> Tuple[str, int]:
+    (length,) = struct.unpack_from("<H", data, position)
+    position += 2
+    return data[position : position + length].decode("utf-8"), position + length
+
+
+class UnknownBossError(ValueError):
+    """A saved game's boss is not in the registry, say because its pack was removed."""
 
 
 @dataclass
@@ -12,35 +31,188 @@ class GameState:
     boss_name: str = ""
     boss: Optional[Boss] = None
     phase: int = 0
-    store_prerolls: List[List[int]] = None
+    schedule: RollSchedule = None
     defeated_players: int = 0
+    seed: Optional[int] = None
+    replay_log: Optional[ReplayLog] = None
+    lookahead: Optional[Lookahead] = None
+    boss_type: str = ""
+    players: Optional[PlayerTable] = None
+    # Show each distinct spell of a turn once with a multiplier; a display choice, so not saved
+    aggregate_spells: bool = False
 
-    def __init__(self):
-        self.store_prerolls = self._preroll_boss_actions()
-
-    def _preroll_boss_actions(self) -> List[List[int]]:
-        return [
-            [self._roll() for _ in range(math.floor(0.5 * i))]
-            for i in range(100)
-        ]
+    MAGIC = b"RBGS"
+    VERSION = 3
+    # magic, version, phase, num_players, defeated_players, replaying, has boss
+    _HEADER = struct.Struct("<4sBBII??")
+    # health, poison, turn_count, player_count
+    _BOSS = struct.Struct("<qqii")
+    # Mersenne Twister state: version, word count, then the words and the cached gauss value
+    _RNG = struct.Struct("<BH")
+    _GAUSS = struct.Struct("<?d")
 
-    @staticmethod
-    def _roll() -> int:
-        DICE_ROLL = [0, 1, 2, 3, 4, 5]
-        return random.choice(DICE_ROLL) + random.choice(DICE_ROLL)
+    def __init__(
+        self,
+        curve: Union[str, RollCurve] = "normal",
+        seed: Optional[int] = None,
+        replay: Optional[ReplayLog] = None,
+        registry: Optional[BossRegistry] = None,
+    ):
+        self.registry = registry if registry is not None else default_registry()
+        if replay is not None:
+            # Play the recorded rolls back instead of rolling
+            self.seed = replay.seed
+            self.rng = None
+            self.replay_log = replay
+            self.schedule = replay.schedule()
+        else:
+            self.seed = new_seed() if seed is None else seed
+            self.rng = random.Random(self.seed)
+            self.replay_log = ReplayLog(self.seed)
+            self.schedule = RollSchedule(curve, rng=self.rng, log=self.replay_log)
+            self.replay_log.curve_name = self.schedule.curve_name
 
     def initialize_boss(self, boss_type: str) -> None:
-        boss_map = {
-            "1": TheManaGod,
-            "2": HorrorfromtheDepths,
-            "3": LunarChanneler
-        }
-        if boss_type in boss_map:
-            self.boss = boss_map[boss_type](player_count=self.num_players, boss_name=self.boss_name)
-
-    def process_damage(self, damage: int) -> None:
+        """Start the battle against the boss with this menu number or registry key."""
+        info = self.registry.find(boss_type)
+        if info is not None:
+            # The key, unlike the menu number, does not change when boss packs come and go
+            self.boss_type = info.key
+            self.boss = info.load()(player_count=self.num_players, boss_name=self.boss_name)
+            self.lookahead = Lookahead(self.boss, self.schedule)
+            self.players = PlayerTable(self.num_players)
+
+    def active_player(self) -> int:
+        """Seat of the player whose turn it is (0-based).
+
+        Turns go round the players still alive, starting with player 1 on turn 1.
+        """
+        alive = list(self.players.alive_players())
+        if not alive:
+            return 0
+        return alive[(self.boss.turn_count - 1) % len(alive)]
+
+    def process_damage(self, damage: int, poison: int = 0, player: Optional[int] = None) -> None:
+        """Deal damage and poison to the boss, credited to ``player`` (the active player by default)."""
         if self.boss:
             self.boss.health -= damage
+            self.boss.poison += poison
+            self.players.deal(self.active_player() if player is None else player, damage, poison)
+
+    def defeat_players(self, count: int) -> int:
+        """Mark ``count`` more players defeated; the boss casts for the players still standing.
+
+        Returns how many players are still alive.
+        """
+        self.players.defeat_count(count)
+        if self.players.alive_count:
+            self.boss.player_count = self.players.alive_count
+        return self.players.alive_count
+
+    @property
+    def poison_needed(self) -> int:
+        return self.boss.POISON_PER_PLAYER * self.num_players
 
     def is_game_over(self) -> bool:
-        return self.boss and self.boss.health <= 0
+        """Whether the players have won, by damage or by poison."""
+        return self.boss and (self.boss.health <= 0 or self.boss.poison >= self.poison_needed)
+
+    def to_bytes(self) -> bytes:
+        """A compact snapshot of the game: enough to carry on exactly where it stopped.
+
+        Besides the boss, it holds the random generator's state and the turns the schedule
+        has already drawn, so the boss goes on to roll what it would have rolled anyway.
+        The replay log is included so a resumed game can still be recorded in full.
+        """
+        if self.schedule.curve_name not in ROLL_CURVES:
+            raise ValueError(f"Games with the custom roll curve {self.schedule.curve_name!r} cannot be saved")
+        parts = [
+            self._HEADER.pack(
+                self.MAGIC,
+                self.VERSION,
+                self.phase,
+                self.num_players,
+                self.defeated_players,
+                self.rng is None,
+                self.boss is not None,
+            ),
+            _pack_text(self.boss_name),
+            _pack_text(self.boss_type),
+            _pack_text(self.schedule.curve_name),
+        ]
+        if self.boss is not None:
+            boss = self.boss
+            parts.append(self._BOSS.pack(boss.health, boss.poison, boss.turn_count, boss.player_count))
+            parts.append(self.players.to_bytes())
+        if self.rng is not None:
+            version, words, gauss = self.rng.getstate()
+            parts.append(self._RNG.pack(version, len(words)))
+            parts.append(struct.pack(f"<{len(words)}I", *words))
+            parts.append(self._GAUSS.pack(gauss is not None, gauss or 0.0))
+        window = self.schedule.window
+        parts.append(struct.pack("<IH", self.schedule.first_turn, len(window)))
+        for rolls in window:
+            parts.append(struct.pack("<H", len(rolls)) + rolls)
+        replay_log = self.replay_log.to_bytes()
+        parts.append(struct.pack("<I", len(replay_log)))
+        parts.append(replay_log)
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data: bytes, registry: Optional[BossRegistry] = None) -> "GameState":
+        magic, version, phase, num_players, defeated_players, replaying, has_boss = cls._HEADER.unpack_from(data)
+        # Version 1 snapshots were taken before players were tracked one by one, and version 2
+        # ones also stored a life total for each player
+        if magic != cls.MAGIC or version not in (1, 2, cls.VERSION):
+            raise ValueError("Not a Raid Boss game snapshot")
+        position = cls._HEADER.size
+        boss_name, position = _unpack_text(data, position)
+        boss_type, position = _unpack_text(data, position)
+        curve_name, position = _unpack_text(data, position)
+        boss_fields = None
+        if has_boss:
+            boss_fields = cls._BOSS.unpack_from(data, position)
+            position += cls._BOSS.size
+            if version > 1:
+                players, position = PlayerTable.from_bytes(data, position, with_life=version == 2)
+        rng_state = None
+        if not replaying:
+            rng_version, word_count = cls._RNG.unpack_from(data, position)
+            position += cls._RNG.size
+            words = struct.unpack_from(f"<{word_count}I", data, position)
+            position += 4 * word_count
+            has_gauss, gauss = cls._GAUSS.unpack_from(data, position)
+            position += cls._GAUSS.size
+            rng_state = (rng_version, words, gauss if has_gauss else None)
+        first_turn, window_length = struct.unpack_from("<IH", data, position)
+        position += 6
+        window = []
+        for _ in range(window_length):
+            (length,) = struct.unpack_from("<H", data, position)
+            position += 2
+            window.append(bytes(data[position : position + length]))
+            position += length
+        (log_length,) = struct.unpack_from("<I", data, position)
+        position += 4
+        replay_log = ReplayLog.from_bytes(data[position : position + log_length])
+
+        if replaying:
+            state = cls(replay=replay_log, registry=registry)
+        else:
+            state = cls(curve=curve_name, seed=replay_log.seed, registry=registry)
+            state.rng.setstate(rng_state)
+            state.replay_log = replay_log
+            state.schedule = RollSchedule(curve_name, rng=state.rng, log=replay_log)
+        state.schedule.restore_window(first_turn, window)
+        state.phase = phase
+        state.num_players = num_players
+        state.defeated_players = defeated_players
+        state.boss_name = boss_name
+        if boss_fields is not None:
+            state.initialize_boss(boss_type)
+            if state.boss is None:
+                raise UnknownBossError(f"The saved game's boss {boss_type!r} is not installed")
+            state.boss.health, state.boss.poison, state.boss.turn_count, state.boss.player_count = boss_fields
+            if version > 1:
+                state.players = players
+        return state
@@ -1,7 +1,15 @@
+from bisect import bisect_right
+from collections import deque
 from dataclasses import dataclass
-from typing import Dict, Any, List
+from itertools import islice
+from functools import lru_cache
+from string import Formatter
+from time import time
+from types import MappingProxyType
+from typing import Deque, Dict, Any, List, Mapping, Sequence, Tuple
 from enum import Enum, auto
 
+
 class TextType(Enum):
     GAME_STATE = auto()
     BOSS_ATTACK = auto()
@@ -9,198 +17,339 @@ class TextType(Enum):
     ERROR = auto()
     PROMPT = auto()
 
-@dataclass
+
+@dataclass(slots=True)
 class GameText:
     content: str
     text_type: TextType
     timestamp: float
     priority: int = 0  # Higher priority text appears first
 
-class GameTextManager:
-    """Centralized manager for all game text content."""
 
-    def __init__(self):
-        self.text_buffer: List[GameText] = []
-        self.max_buffer_size = 1000  # Prevent memory issues with very long games
-        self._output_callback = None
-        self._text_templates = {
-            "welcome": "Welcome to Raid Boss! How many people are playing? > ",
-            "player_count": "Wonderful! {num_players} player(s) are ready to slay some spells!",
-            "boss_name": "Who have you come here to slay? > ",
-            "boss_intro": "\nHere comes {boss_name} now! Prepare thyselves for a whimsical battle! Best of luck!",
-            "boss_selection": {
-                "header": "\nChoose your boss:",
-                "options": ["1. TheManaGod", "2. HorrorfromtheDepths", "3. LunarChanneler"],
-                "prompt": "\nEnter your choice (1-3) > "
-            },
-            "boss_confirm": "\nYou have chosen {boss_name}!",
-            "battle_start": {
-                "announcement": "The battle begins!",
-                "health": "\n{boss_name}'s Health: {health}",
-                "prompt": "PLAYER 1 TURN: Enter damage dealt! (Even if it's zero) and press enter! > "
-            },
-            "damage_report": {
-                "damage": "\nDamage dealt: {damage}",
-                "health": "{boss_name}'s Health: {health}"
-            },
-            "boss_rage": "\nThe boss unleashes a hellish energy...",
-            "boss_turn": {
-                "attack_count": "\n{boss_name} gets {attack_count} roll(s) this turn! Brace yourself!",
-                "turn_count": "TURN COUNT: {turn_count}"
-            },
-            "boss_attack": {
-                "announcement": "\nTHE BOSS ATTACKS!",
-                "attack": "\n{attack_text}"
-            },
-            "boss_hint": {
-                "header": "\nArcane intuition tells you...",
-                "hint": ""
-            },
-            "defeated_prompt": "\nHow many players were defeated this turn? (enter 0 if no one was defeated) > ",
-            "next_turn": "\nPLAYER {player_number} TURN: Enter damage dealt! (Even if it's zero) and press enter! > ",
-            "game_over": {
-                "victory": {
-                    "congrats": "\nCongratulations! You have defeated {boss_name}!",
-                    "flavor": "They cower away from your SUPREME WHIMSY!",
-                    "thanks": "Thanks for playing!"
-                },
-                "defeat": {
-                    "retry": "\nRetry? Run the program again!"
-                }
-            },
-            "errors": {
-                "invalid_player_count": "Please enter a positive number for the number of players.",
-                "invalid_boss_name": "Please enter a name for the boss.",
-                "invalid_boss_selection": "Please enter 1, 2, or 3 to select your boss.",
-                "invalid_damage": "Please enter a non-negative number for damage.",
-                "invalid_defeated_players": "Please enter a number between 0 and {num_players} for defeated players."
-            }
-        }
+# Every entry is followed by a blank line except prompts, which the player answers on the next line
+_TEXT_SUFFIXES = {TextType.PROMPT: "\n"}
 
-    def set_output_callback(self, callback):
-        """Set the callback function to update the UI when text changes."""
-        self._output_callback = callback
 
-    def add_text(self, content: str, text_type: TextType, priority: int = 0) -> None:
-        """Add new text to the buffer and update the display."""
-        from time import time
-        new_text = GameText(content=content, text_type=text_type, timestamp=time(), priority=priority)
-        self.text_buffer.append(new_text)
-        if len(self.text_buffer) > self.max_buffer_size:
-            self.text_buffer = self.text_buffer[-self.max_buffer_size:]
-        self._update_display()
+def line_suffix(text_type: TextType) -> str:
+    """What follows a line of ``text_type`` in a plain text transcript."""
+    return _TEXT_SUFFIXES.get(text_type, "\n\n")
 
-    def clear(self) -> None:
-        """Clear all text from the buffer."""
-        self.text_buffer.clear()
-        self._update_display()
 
-    def _update_display(self) -> None:
-        """Update the display with formatted text."""
-        if self._output_callback is None:
-            return
-        sorted_text = sorted(self.text_buffer, key=lambda x: x.timestamp)
-        format_map = {
-            TextType.ERROR: lambda t: f"{t.content}\n\n",
-            TextType.BOSS_ATTACK: lambda t: f"{t.content}\n\n",
-            TextType.PROMPT: lambda t: f"{t.content}\n",
-        }
-        formatted_text = ""
-        for text in sorted_text:
-            formatter = format_map.get(text.text_type, lambda t: f"{t.content}\n\n")
-            formatted_text += formatter(text)
-        self._output_callback(formatted_text)
-
-    def _create_text(self, template: str, text_type: TextType, **kwargs) -> GameText:
-        """Helper method to create GameText from template."""
-        from time import time
-        content = template.format(**kwargs) if kwargs else template
-        return GameText(content=content, text_type=text_type, timestamp=time())
-
-    def _create_text_dict(self, template_dict: Dict[str, Any], text_type: TextType, **kwargs) -> Dict[str, GameText]:
-        """Helper method to create dictionary of GameText from template dictionary."""
-        return {
-            key: self._create_text(template, text_type, **kwargs)
-            for key, template in template_dict.items()
-        }
+def _tail(items: Deque, count: int) -> list:
+    """The last ``count`` items of a deque, walking in from whichever end is closer."""
+    if count * 2 >= len(items):
+        return list(islice(items, len(items) - count, None))
+    return list(islice(reversed(items), count))[::-1]
+
+
+def _format_text(text: GameText) -> str:
+    return text.content + line_suffix(text.text_type)
+
+
+_TEXT_TEMPLATES = {
+    "welcome": "Welcome to Raid Boss! How many people are playing? > ",
+    "player_count": "Wonderful! {num_players} player(s) are ready to slay some spells!",
+    "boss_name": "Who have you come here to slay? > ",
+    "boss_intro": "\nHere comes {boss_name} now! Prepare thyselves for a whimsical battle! Best of luck!",
+    "boss_selection": {"header": "\nChoose your boss:", "prompt": "\nEnter your choice (1-{boss_count}) > "},
+    "boss_confirm": "\nYou have chosen {boss_name}!",
+    "battle_start": {
+        "announcement": "The battle begins!",
+        "health": "\n{boss_name}'s Health: {health}",
+        "prompt": "PLAYER 1 TURN: Enter damage dealt! (Even if it's zero) and press enter! > ",
+    },
+    "damage_report": {"damage": "\nDamage dealt: {damage}", "health": "{boss_name}'s Health: {health}"},
+    "poison_report": "{boss_name} has {poison} of {poison_needed} poison counters.",
+    "boss_rage": "\nThe boss unleashes a hellish energy...",
+    "boss_turn": {
+        "attack_count": "\n{boss_name} gets {attack_count} roll(s) this turn! Brace yourself!",
+        "turn_count": "TURN COUNT: {turn_count}",
+    },
+    "boss_attack": {"announcement": "\nTHE BOSS ATTACKS!", "attack": "\n{attack_text}"},
+    "boss_hint": {"header": "\nArcane intuition tells you...", "hint": ""},
+    "boss_forecast": "The stars whisper of a {heal_chance:.0%} chance {boss_name} heals in two turns (about {expected_heal:.0f} health on average).",
+    "defeated_prompt": "\nHow many players were defeated this turn? (enter 0 if no one was defeated) > ",
+    "next_turn": "\nPLAYER {player_number} TURN: Enter damage dealt! (Even if it's zero) and press enter! > ",
+    "game_over": {
+        "victory": {
+            "congrats": "\nCongratulations! You have defeated {boss_name}!",
+            "flavor": "They cower away from your SUPREME WHIMSY!",
+            "thanks": "Thanks for playing!",
+        },
+        "defeat": {"retry": "\nRetry? Run the program again!"},
+    },
+    "errors": {
+        "invalid_player_count": "Please enter a number from 1 to {max_players} for the number of players.",
+        "invalid_boss_name": "Please enter a name for the boss.",
+        "invalid_boss_selection": "Please enter a number from 1 to {boss_count} to select your boss.",
+        "invalid_damage": "Please enter a non-negative number for damage, with poison as e.g. 3p.",
+        "invalid_defeated_players": "Please enter a number between 0 and {num_players} for defeated players.",
+    },
+}
+
+
+class _Message:
+    """A compiled message: one shared GameText if the template has no fields, else its formatter."""
+
+    __slots__ = ("text", "format", "text_type")
+
+    def __init__(self, template: str, text_type: TextType):
+        self.text_type = text_type
+        if any(field is not None for _, field, _, _ in Formatter().parse(template)):
+            self.text, self.format = None, template.format
+        else:
+            self.text, self.format = GameText(template, text_type, 0.0), None
+
+    def __call__(self, **kwargs) -> GameText:
+        if self.text is not None:
+            return self.text
+        return GameText(self.format(**kwargs), self.text_type, 0.0)
+
+
+def _compile_group(templates: Dict[str, str], text_type: TextType) -> Tuple[Tuple[str, _Message], ...]:
+    return tuple((key, _Message(template, text_type)) for key, template in templates.items())
+
+
+def _group_texts(group: Tuple[Tuple[str, _Message], ...], **kwargs) -> Dict[str, GameText]:
+    return {key: message(**kwargs) for key, message in group}
+
+
+def _shared(group: Tuple[Tuple[str, _Message], ...]) -> Mapping[str, GameText]:
+    """A group of messages without fields, built once."""
+    return MappingProxyType(_group_texts(group))
+
+
+@lru_cache(maxsize=64)
+def _boss_menu(options: Tuple[str, ...]) -> Mapping[str, GameText]:
+    templates = _TEXT_TEMPLATES["boss_selection"]
+    menu = {
+        "header": GameText(templates["header"], TextType.GAME_STATE, 0.0),
+        "prompt": GameText(templates["prompt"].format(boss_count=len(options)), TextType.PROMPT, 0.0),
+    }
+    for i, option in enumerate(options, 1):
+        menu[f"option{i}"] = GameText(option, TextType.GAME_STATE, 0.0)
+    return MappingProxyType(menu)
+
+
+class MessageCatalog:
+    """Every message the game shows, compiled once when this module is imported.
+
+    Messages without fields are built once and shared, so treat what these methods return
+    as read-only. The others format a precompiled template into a new GameText. Catalog
+    texts carry no timestamp; the output stamps lines as they are added.
+    """
+
+    _welcome = _Message(_TEXT_TEMPLATES["welcome"], TextType.PROMPT)
+    _player_count = _Message(_TEXT_TEMPLATES["player_count"], TextType.GAME_STATE)
+    _boss_name = _Message(_TEXT_TEMPLATES["boss_name"], TextType.PROMPT)
+    _boss_intro = _Message(_TEXT_TEMPLATES["boss_intro"], TextType.GAME_STATE)
+    _boss_confirm = _Message(_TEXT_TEMPLATES["boss_confirm"], TextType.GAME_STATE)
+    _battle_start = _compile_group(_TEXT_TEMPLATES["battle_start"], TextType.GAME_STATE)
+    _damage_report = _compile_group(_TEXT_TEMPLATES["damage_report"], TextType.GAME_STATE)
+    _poison_report = _Message(_TEXT_TEMPLATES["poison_report"], TextType.GAME_STATE)
+    _boss_rage = _Message(_TEXT_TEMPLATES["boss_rage"], TextType.BOSS_ATTACK)
+    _boss_turn = _compile_group(_TEXT_TEMPLATES["boss_turn"], TextType.GAME_STATE)
+    _boss_attack_announcement = _Message(_TEXT_TEMPLATES["boss_attack"]["announcement"], TextType.BOSS_ATTACK)
+    _boss_attack = _Message(_TEXT_TEMPLATES["boss_attack"]["attack"], TextType.BOSS_ATTACK)
+    _boss_hint = _shared(_compile_group(_TEXT_TEMPLATES["boss_hint"], TextType.GAME_STATE))
+    _boss_forecast = _Message(_TEXT_TEMPLATES["boss_forecast"], TextType.GAME_STATE)
+    _defeated_prompt = _Message(_TEXT_TEMPLATES["defeated_prompt"], TextType.PROMPT)
+    _next_turn = _Message(_TEXT_TEMPLATES["next_turn"], TextType.PROMPT)
+    _victory = _compile_group(_TEXT_TEMPLATES["game_over"]["victory"], TextType.GAME_STATE)
+    _defeat = _compile_group(_TEXT_TEMPLATES["game_over"]["defeat"], TextType.GAME_STATE)
+    # Error templates as they are, for callers that fill them in themselves
+    _error_templates = MappingProxyType(
+        {key: GameText(template, TextType.ERROR, 0.0) for key, template in _TEXT_TEMPLATES["errors"].items()}
+    )
+    _errors = dict(_compile_group(_TEXT_TEMPLATES["errors"], TextType.ERROR))
 
     # Public methods for game text generation
     def get_welcome_message(self) -> GameText:
-        return self._create_text(self._text_templates["welcome"], TextType.PROMPT)
+        return self._welcome()
 
     def get_player_count_confirmation(self, num_players: int) -> GameText:
-        return self._create_text(self._text_templates["player_count"], TextType.GAME_STATE, num_players=num_players)
+        return self._player_count(num_players=num_players)
 
     def get_boss_name_prompt(self) -> GameText:
-        return self._create_text(self._text_templates["boss_name"], TextType.PROMPT)
+        return self._boss_name()
 
     def get_boss_introduction(self, boss_name: str) -> GameText:
-        return self._create_text(self._text_templates["boss_intro"], TextType.GAME_STATE, boss_name=boss_name)
-
-    def get_boss_selection_menu(self) -> Dict[str, GameText]:
-        templates = self._text_templates["boss_selection"]
-        result = {
-            "header": self._create_text(templates["header"], TextType.GAME_STATE),
-            "prompt": self._create_text(templates["prompt"], TextType.PROMPT)
-        }
-        for i, option in enumerate(templates["options"], 1):
-            result[f"option{i}"] = self._create_text(option, TextType.GAME_STATE)
-        return result
+        return self._boss_intro(boss_name=boss_name)
+
+    def get_boss_selection_menu(self, options: Sequence[str]) -> Mapping[str, GameText]:
+        return _boss_menu(tuple(options))
 
     def get_boss_selection_confirmation(self, boss_name: str) -> GameText:
-        return self._create_text(self._text_templates["boss_confirm"], TextType.GAME_STATE, boss_name=boss_name)
+        return self._boss_confirm(boss_name=boss_name)
 
     def get_battle_start(self, boss_name: str, health: int) -> Dict[str, GameText]:
-        return self._create_text_dict(
-            self._text_templates["battle_start"],
-            TextType.GAME_STATE,
-            boss_name=boss_name,
-            health=health
-        )
+        return _group_texts(self._battle_start, boss_name=boss_name, health=health)
 
     def get_damage_report(self, damage: int, boss_name: str, health: int) -> Dict[str, GameText]:
-        return self._create_text_dict(
-            self._text_templates["damage_report"],
-            TextType.GAME_STATE,
-            damage=damage,
-            boss_name=boss_name,
-            health=health
-        )
+        return _group_texts(self._damage_report, damage=damage, boss_name=boss_name, health=health)
+
+    def get_poison_report(self, boss_name: str, poison: int, poison_needed: int) -> GameText:
+        return self._poison_report(boss_name=boss_name, poison=poison, poison_needed=poison_needed)
 
     def get_boss_rage(self) -> GameText:
-        return self._create_text(self._text_templates["boss_rage"], TextType.BOSS_ATTACK)
+        return self._boss_rage()
 
     def get_boss_turn_info(self, boss_name: str, attack_count: int, turn_count: int) -> Dict[str, GameText]:
-        return self._create_text_dict(
-            self._text_templates["boss_turn"],
-            TextType.GAME_STATE,
-            boss_name=boss_name,
-            attack_count=attack_count,
-            turn_count=turn_count
-        )
+        return _group_texts(self._boss_turn, boss_name=boss_name, attack_count=attack_count, turn_count=turn_count)
 
     def get_boss_attack_announcement(self) -> GameText:
-        return self._create_text(self._text_templates["boss_attack"]["announcement"], TextType.BOSS_ATTACK)
+        return self._boss_attack_announcement()
 
     def get_boss_attack(self, attack_text: str) -> GameText:
-        return self._create_text(self._text_templates["boss_attack"]["attack"], TextType.BOSS_ATTACK, attack_text=attack_text)
+        return self._boss_attack(attack_text=attack_text)
+
+    def get_boss_hint(self) -> Mapping[str, GameText]:
+        return self._boss_hint
 
-    def get_boss_hint(self) -> Dict[str, GameText]:
-        return self._create_text_dict(self._text_templates["boss_hint"], TextType.GAME_STATE)
+    def get_boss_forecast(self, boss_name: str, heal_chance: float, expected_heal: float) -> GameText:
+        return self._boss_forecast(boss_name=boss_name, heal_chance=heal_chance, expected_heal=expected_heal)
 
     def get_defeated_players_prompt(self) -> GameText:
-        return self._create_text(self._text_templates["defeated_prompt"], TextType.PROMPT)
+        return self._defeated_prompt()
 
     def get_next_player_turn(self, player_number: int) -> GameText:
-        return self._create_text(self._text_templates["next_turn"], TextType.PROMPT, player_number=player_number)
+        return self._next_turn(player_number=player_number)
 
     def get_game_over(self, boss_name: str, victory: bool) -> Dict[str, GameText]:
-        template_key = "victory" if victory else "defeat"
-        return self._create_text_dict(
-            self._text_templates["game_over"][template_key],
-            TextType.GAME_STATE,
-            boss_name=boss_name
-        )
-
-    def get_error_messages(self) -> Dict[str, GameText]:
-        return self._create_text_dict(self._text_templates["errors"], TextType.ERROR)
+        return _group_texts(self._victory if victory else self._defeat, boss_name=boss_name)
+
+    def get_error_messages(self) -> Mapping[str, GameText]:
+        return self._error_templates
+
+    def get_error(self, key: str, **kwargs) -> GameText:
+        """The error message ``key`` with its fields filled in."""
+        return self._errors[key](**kwargs)
+
+
+# Shared by every game; it holds no state of its own
+MESSAGES = MessageCatalog()
+
+
+class GameTextManager(MessageCatalog):
+    """Centralized manager for all game text content."""
+
+    def __init__(self):
+        # Imported here because transcript.py imports this module; this runs once per manager
+        from raid_boss.transcript import Transcript
+
+        # Only the newest 1000 entries stay in memory; older ones are archived to disk
+        self.text_buffer = Transcript(capacity=1000)
+        self._output_callback = None
+        # Formatted text of the entries from _rendered_start on; entries from _dirty_from on need formatting
+        self._rendered: Deque[str] = deque()
+        self._rendered_start = 0
+        self._dirty_from = 0
+        self._joined = ""
+        self._joined_count = 0
+        self._joined_trim = 0
+
+    def set_output_callback(self, callback):
+        """Set the callback function to update the UI when text changes.
+
+        The callback is called as ``callback(text, append)``. When ``append`` is true,
+        ``text`` holds only the newly added entries and should be appended to what is on
+        screen. Otherwise ``text`` is the whole transcript and replaces it.
+        """
+        self._output_callback = callback
+
+    @property
+    def max_buffer_size(self) -> int:
+        """How many entries are kept in memory before older ones are archived."""
+        return self.text_buffer.capacity
+
+    @max_buffer_size.setter
+    def max_buffer_size(self, size: int) -> None:
+        self.text_buffer.capacity = size
+        self._forget_archived()
+
+    def add_text(self, content: str, text_type: TextType, priority: int = 0) -> None:
+        """Add new text to the buffer and update the display."""
+        new_text = GameText(content, text_type, time(), priority)
+        buffer = self.text_buffer
+        if buffer.recent and new_text.timestamp < buffer.recent[-1].timestamp:
+            # The clock went backwards; keep the buffer in timestamp order and redraw from there
+            position = buffer.first_in_memory + bisect_right(
+                buffer.recent, new_text.timestamp, key=lambda text: text.timestamp
+            )
+            buffer.insert(position, new_text)
+            self._dirty_from = min(self._dirty_from, position)
+        else:
+            buffer.append(new_text)
+        self._forget_archived()
+        self._update_display()
+
+    def history(self, start: int = 0, stop: int = None) -> List[GameText]:
+        """Entries of the whole game by position, paging archived ones back in from disk."""
+        return self.text_buffer[start:stop]
+
+    def clear(self) -> None:
+        """Clear all text from the buffer."""
+        self.text_buffer.clear()
+        rendered = bool(self._rendered)
+        self._rendered.clear()
+        self._rendered_start = self._dirty_from = 0
+        self._reset_joined()
+        if rendered and self._output_callback is not None:
+            self._output_callback("", False)
+
+    def _reset_joined(self) -> None:
+        self._joined, self._joined_count, self._joined_trim = "", 0, 0
+
+    def _forget_archived(self) -> None:
+        """Drop the formatted text of entries that moved to the archive.
+
+        The display keeps showing them; they are only forgotten here.
+        """
+        first = self.text_buffer.first_in_memory
+        while self._rendered and self._rendered_start < first:
+            piece = self._rendered.popleft()
+            self._rendered_start += 1
+            if self._joined_count:
+                self._joined_count -= 1
+                self._joined_trim += len(piece)
+
+    @property
+    def rendered_text(self) -> str:
+        """The formatted text of the rendered entries that are still in memory."""
+        if self._joined_trim:
+            self._joined = self._joined[self._joined_trim :]
+            self._joined_trim = 0
+        if self._joined_count != len(self._rendered):
+            self._joined += "".join(_tail(self._rendered, len(self._rendered) - self._joined_count))
+            self._joined_count = len(self._rendered)
+        return self._joined
+
+    def _update_display(self) -> None:
+        """Format the entries added since the last update and send them to the display."""
+        if self._output_callback is None:
+            return
+        buffer = self.text_buffer
+        first = buffer.first_in_memory
+        end = self._rendered_start + len(self._rendered)
+        start = max(min(self._dirty_from, end), first)
+        if start > end:
+            # Entries were archived before anything rendered them
+            self._rendered.clear()
+            self._rendered_start = end = start
+            self._reset_joined()
+        appended = start == end
+        if appended and start == len(buffer):
+            return
+        if not appended:
+            keep = start - self._rendered_start
+            while len(self._rendered) > keep:
+                self._rendered.pop()
+            if self._joined_count > keep:
+                self._reset_joined()
+        delta = [_format_text(text) for text in _tail(buffer.recent, len(buffer) - start)]
+        self._rendered.extend(delta)
+        self._dirty_from = self._rendered_start + len(self._rendered)
+        if appended:
+            self._output_callback("".join(delta), True)
+        else:
+            self._output_callback(self.rendered_text, False)
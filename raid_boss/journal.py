@@ -0,0 +1,197 @@
+"""Crash-safe saves: a snapshot of the game plus a journal of every answer since.
+
+A save is two files in one directory. ``<name>.snapshot`` holds a ``GameState`` snapshot
+and the sequence number of the last answer it includes; it is replaced atomically.
+``<name>.journal`` is append-only. Each record is an answer given to the game, with a
+sequence number and a CRC. To resume, restore the snapshot and replay the answers that
+come after it.
+
+All file work happens on a background thread, so recording an answer never waits on the
+disk. The thread writes whatever has queued up and then fsyncs it in one go.
+"""
+
+import os
+import queue
+import struct
+import threading
+import warnings
+import zlib
+from typing import List, Optional, Tuple
+
+from raid_boss.game_state import GameState, UnknownBossError
+from raid_boss.registry import BossRegistry
+
+# Answers between snapshots; each snapshot empties the journal. 0 leaves snapshots to the caller.
+CHECKPOINT_EVERY = 16
+
+
+def default_save_dir() -> str:
+    return os.environ.get("RAID_BOSS_SAVE_DIR") or os.path.join(os.path.expanduser("~"), ".raid_boss")
+
+
+class GameJournal:
+    _SNAPSHOT_HEADER = struct.Struct("<4sQ")  # magic, sequence of the last answer included
+    _SNAPSHOT_MAGIC = b"RBSN"
+    _RECORD = struct.Struct("<IQH")  # CRC of the rest, sequence, answer length
+
+    # Operations for the writer thread
+    _APPEND, _SNAPSHOT, _DISCARD, _SYNC, _CLOSE = range(5)
+
+    def __init__(self, directory: str, name: str = "game", checkpoint_every: int = CHECKPOINT_EVERY):
+        os.makedirs(directory, exist_ok=True)
+        self.snapshot_path = os.path.join(directory, name + ".snapshot")
+        self.journal_path = os.path.join(directory, name + ".journal")
+        self.checkpoint_every = checkpoint_every
+        self.sequence = 0
+        self._since_checkpoint = 0
+        # The first error the writer thread hit; the game carries on without saving
+        self.error: Optional[OSError] = None
+        # Why load() threw the save away, for the front end to tell the player
+        self.dropped: Optional[str] = None
+        self._file = open(self.journal_path, "a+b")
+        self._queue: "queue.SimpleQueue[tuple]" = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._write_loop, name="raid-boss-journal", daemon=True)
+        self._thread.start()
+
+    def load(self, registry: Optional[BossRegistry] = None) -> Optional[Tuple[GameState, List[str]]]:
+        """The saved game and the answers to replay on top of it, or None if there is no save.
+
+        Call this before recording anything. A torn record at the end of the journal, left
+        by a crash mid-write, is dropped. A save that cannot be restored, because it is
+        damaged or its boss is no longer installed, is discarded with the reason in ``dropped``.
+        """
+        try:
+            with open(self.snapshot_path, "rb") as snapshot_file:
+                data = snapshot_file.read()
+        except FileNotFoundError:
+            return None
+        try:
+            magic, sequence = self._SNAPSHOT_HEADER.unpack_from(data)
+            if magic != self._SNAPSHOT_MAGIC:
+                raise ValueError(f"{self.snapshot_path} is not a Raid Boss save")
+            game_state = GameState.from_bytes(data[self._SNAPSHOT_HEADER.size :], registry)
+        except UnknownBossError as error:
+            self.dropped = f"{error}, so a new game is starting."
+            self.discard()
+            return None
+        except (ValueError, struct.error) as error:
+            # The save is there to survive crashes; it must never stop the game from starting
+            warnings.warn(f"Discarding unreadable save {self.snapshot_path}: {error}")
+            self.dropped = "The saved game could not be read, so a new game is starting."
+            self.discard()
+            return None
+
+        answers = []
+        self.sequence = sequence
+        for record_sequence, answer in self._scan():
+            # Records up to the snapshot survive a crash between writing it and emptying the journal
+            if record_sequence > sequence:
+                answers.append(answer)
+                self.sequence = record_sequence
+        self._since_checkpoint = len(answers)
+        return game_state, answers
+
+    def _scan(self) -> List[Tuple[int, str]]:
+        self._file.seek(0)
+        data = self._file.read()
+        records = []
+        position = 0
+        while position + self._RECORD.size <= len(data):
+            crc, sequence, length = self._RECORD.unpack_from(data, position)
+            end = position + self._RECORD.size + length
+            if end > len(data) or zlib.crc32(data[position + 4 : end]) != crc:
+                break
+            records.append((sequence, data[position + self._RECORD.size : end].decode("utf-8")))
+            position = end
+        if position != len(data):
+            self._file.truncate(position)
+        return records
+
+    def record(self, answer: str, game_state: GameState) -> None:
+        """Journal an answer the game has just handled, taking a snapshot every so often."""
+        if game_state.phase == 6:
+            # Nothing left to resume once the game is over
+            self.discard()
+            return
+        self.sequence += 1
+        encoded = answer.encode("utf-8")
+        body = struct.pack("<QH", self.sequence, len(encoded)) + encoded
+        self._queue.put((self._APPEND, struct.pack("<I", zlib.crc32(body)) + body))
+        self._since_checkpoint += 1
+        if self.checkpoint_every and self._since_checkpoint >= self.checkpoint_every:
+            self.checkpoint(game_state)
+
+    def checkpoint(self, game_state: GameState) -> None:
+        """Snapshot the game now; the journal is emptied once the snapshot is on disk."""
+        snapshot = self._SNAPSHOT_HEADER.pack(self._SNAPSHOT_MAGIC, self.sequence) + game_state.to_bytes()
+        self._queue.put((self._SNAPSHOT, snapshot))
+        self._since_checkpoint = 0
+
+    def discard(self) -> None:
+        """Forget the saved game."""
+        self._queue.put((self._DISCARD,))
+        self._since_checkpoint = 0
+
+    def sync(self) -> None:
+        """Wait until everything recorded so far is on disk."""
+        done = threading.Event()
+        self._queue.put((self._SYNC, done))
+        done.wait()
+
+    def close(self) -> None:
+        if self._thread.is_alive():
+            self._queue.put((self._CLOSE,))
+            self._thread.join()
+
+    def _write_loop(self) -> None:
+        while True:
+            operations = [self._queue.get()]
+            # Group everything that queued up while the last fsync ran
+            while True:
+                try:
+                    operations.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            waiting = []
+            closing = False
+            for operation in operations:
+                kind = operation[0]
+                if kind == self._SYNC:
+                    waiting.append(operation[1])
+                elif kind == self._CLOSE:
+                    closing = True
+                elif self.error is None:
+                    try:
+                        self._apply(kind, operation)
+                    except OSError as error:
+                        self.error = error
+            if self.error is None:
+                try:
+                    self._file.flush()
+                    os.fsync(self._file.fileno())
+                except OSError as error:
+                    self.error = error
+            for done in waiting:
+                done.set()
+            if closing:
+                self._file.close()
+                return
+
+    def _apply(self, kind: int, operation: tuple) -> None:
+        if kind == self._APPEND:
+            self._file.write(operation[1])
+        elif kind == self._SNAPSHOT:
+            # Everything the snapshot covers is already written, so the journal can go once it lands
+            temporary_path = self.snapshot_path + ".tmp"
+            with open(temporary_path, "wb") as snapshot_file:
+                snapshot_file.write(operation[1])
+                snapshot_file.flush()
+                os.fsync(snapshot_file.fileno())
+            os.replace(temporary_path, self.snapshot_path)
+            self._file.truncate(0)
+        elif kind == self._DISCARD:
+            try:
+                os.remove(self.snapshot_path)
+            except FileNotFoundError:
+                pass
+            self._file.truncate(0)
@@ -0,0 +1,133 @@
+"""Load generator for the Raid Boss server.
+
+Plays scripted games against ``server.py`` with many sessions in flight at once. It
+reports the latency of every answer (from sending the line until the end-of-response
+marker arrives) and the overall throughput.
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+# Add the parent directory to the sys.path to handle standalone execution
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from raid_boss.server import DEFAULT_HOST, DEFAULT_PORT, END_OF_RESPONSE, GameServer
+
+_MARKER = END_OF_RESPONSE.encode("utf-8")
+# A response that takes longer than this counts the session as failed
+RESPONSE_TIMEOUT = 30.0
+
+
+def game_script(session: int, turns: int) -> List[str]:
+    """Inputs for one synthetic game: setup, then light damage and no defeats each turn."""
+    boss = str(session % 3 + 1)
+    return ["4", f"Load Boss {session}", boss] + ["5", "0"] * turns
+
+
+@dataclass
+class LoadReport:
+    sessions: int = 0
+    failed: int = 0
+    elapsed: float = 0.0
+    latencies: List[float] = field(default_factory=list)
+
+    @property
+    def inputs(self) -> int:
+        return len(self.latencies)
+
+    def percentile(self, q: float) -> float:
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        return ordered[min(int(len(ordered) * q / 100), len(ordered) - 1)]
+
+    def format(self) -> str:
+        return "\n".join(
+            [
+                f"sessions: {self.sessions} ({self.failed} failed) in {self.elapsed:.2f}s",
+                f"throughput: {self.inputs / self.elapsed:,.0f} inputs/s, {self.sessions / self.elapsed:,.1f} sessions/s",
+                "latency: "
+                + "  ".join(f"p{q}={self.percentile(q) * 1000:.2f}ms" for q in (50, 90, 99))
+                + f"  max={max(self.latencies, default=0) * 1000:.2f}ms",
+            ]
+        )
+
+
+async def _read_response(reader: asyncio.StreamReader) -> bytes:
+    return await asyncio.wait_for(reader.readuntil(_MARKER), RESPONSE_TIMEOUT)
+
+
+async def play_session(host: str, port: int, script: List[str], latencies: List[float]) -> None:
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        await _read_response(reader)
+        for line in script:
+            start = time.perf_counter()
+            writer.write(line.encode("utf-8") + b"\n")
+            await writer.drain()
+            try:
+                await _read_response(reader)
+            except asyncio.IncompleteReadError:
+                # The server hangs up once the game is over
+                break
+            latencies.append(time.perf_counter() - start)
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+
+async def generate_load(
+    host: str, port: int, sessions: int, concurrency: int, turns: int, report: Optional[LoadReport] = None
+) -> LoadReport:
+    report = report if report is not None else LoadReport()
+    limit = asyncio.Semaphore(concurrency)
+
+    async def run_one(session: int) -> None:
+        async with limit:
+            try:
+                await play_session(host, port, game_script(session, turns), report.latencies)
+                report.sessions += 1
+            except (ConnectionError, asyncio.IncompleteReadError, asyncio.TimeoutError, OSError):
+                report.failed += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(run_one(session) for session in range(sessions)))
+    report.elapsed = time.perf_counter() - start
+    return report
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Drive synthetic games against a Raid Boss server.")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--sessions", type=int, default=1000, help="games to play in total")
+    parser.add_argument("--concurrency", type=int, default=200, help="games in flight at once")
+    parser.add_argument("--turns", type=int, default=20, help="boss turns per game")
+    parser.add_argument(
+        "--local", action="store_true", help="start a server in this process (shares the event loop and CPU)"
+    )
+    args = parser.parse_args(argv)
+
+    async def run() -> LoadReport:
+        server = None
+        port = args.port
+        if args.local:
+            server = GameServer(args.host, 0, seed=0)
+            await server.start()
+            port = server.port
+        try:
+            return await generate_load(args.host, port, args.sessions, args.concurrency, args.turns)
+        finally:
+            if server is not None:
+                await server.close()
+
+    print(asyncio.run(run()).format())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from raid_boss.boss import Boss
+from raid_boss.rolls import RollSchedule
+
+DEFAULT_DEPTH = 3
+
+
+@dataclass(frozen=True)
+class TurnPlan:
+    turn: int
+    rolls: bytes
+    hint_mask: int
+    hint: str
+    # Pre-rendered spell text per roll; None where the spell is stateful and must be cast live
+    texts: Tuple[Optional[str], ...]
+    render_key: tuple
+
+
+class Lookahead:
+    """Hints and spell text for the boss's upcoming turns, built a few turns ahead.
+
+    Plans are filled in lazily up to ``depth`` turns past the turn being played, so the
+    per-turn work in the game loop is a dictionary lookup. Turns before the last one
+    played are released along with the roll schedule's copy.
+    """
+
+    def __init__(self, boss: Boss, schedule: RollSchedule, depth: int = DEFAULT_DEPTH):
+        self.boss = boss
+        self.schedule = schedule
+        self.depth = depth
+        self._plans: Dict[int, TurnPlan] = {}
+
+    def _build(self, turn: int) -> TurnPlan:
+        boss = self.boss
+        rolls = self.schedule[turn]
+        mask = boss.hint_mask(rolls)
+        return TurnPlan(
+            turn=turn,
+            rolls=rolls,
+            hint_mask=mask,
+            hint=boss.hint_text(mask),
+            texts=tuple(None if roll in boss.STATEFUL_ROLLS else boss.render(roll) for roll in rolls),
+            render_key=boss.render_key(),
+        )
+
+    def __getitem__(self, turn: int) -> TurnPlan:
+        plan = self._plans.get(turn)
+        if plan is None or plan.render_key != self.boss.render_key():
+            plan = self._plans[turn] = self._build(turn)
+        return plan
+
+    def advance(self, turn: int) -> TurnPlan:
+        """Move the game to ``turn``: drop older plans and plan ``depth`` turns ahead."""
+        for old_turn in [planned for planned in self._plans if planned < turn]:
+            del self._plans[old_turn]
+        self.schedule.release(turn)
+        for upcoming in range(turn + 1, turn + self.depth + 1):
+            if upcoming not in self._plans:
+                self._plans[upcoming] = self._build(upcoming)
+        return self[turn]
+
+    def hint(self, turn: int) -> str:
+        return self[turn].hint
+
+    def render_attacks(self, plan: TurnPlan, separator: str = "\n\n\n", aggregate: bool = False) -> str:
+        """The turn's spell text, casting the stateful spells now so their effects apply.
+
+        ``aggregate`` shows each distinct spell once with a multiplier (see ``Boss.render_turn``).
+        """
+        boss = self.boss
+        if aggregate:
+            return boss.render_turn(plan.rolls, separator, aggregate=True)
+        if plan.render_key != boss.render_key():
+            plan = self[plan.turn]
+        return separator.join(
+            [text if text is not None else boss.render(roll) for roll, text in zip(plan.rolls, plan.texts)]
+        )
@@ -1,73 +1,157 @@
 import os
 import sys
+import time
+
+STARTED = time.perf_counter()
 
 # Add the project root to Python path
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
+from raid_boss.startup import PROFILE_FLAG, StartupProfile, pop_flag, pop_option
+
+NEW_GAME_FLAG = "--new-game"
+AGGREGATE_FLAG = "--aggregate-spells"
+BATCH_FLAG = "--batch"
+METRICS_OPTION = "--metrics"
+# Seconds between metrics writes while the game runs, so a dashboard sees them live
+METRICS_INTERVAL = 10
+
+if __name__ == "__main__" and pop_flag(sys.argv, BATCH_FLAG):
+    # Scripted games through the GameLogic state machine, without starting Kivy
+    from raid_boss.batch import main
+
+    sys.exit(main(sys.argv[1:], engine="logic"))
+
+# Kivy parses sys.argv on import and rejects options it does not know
+PROFILE = StartupProfile(STARTED, enabled=pop_flag(sys.argv, PROFILE_FLAG))
+NEW_GAME = pop_flag(sys.argv, NEW_GAME_FLAG)
+AGGREGATE_SPELLS = pop_flag(sys.argv, AGGREGATE_FLAG)
+METRICS_PATH = pop_option(sys.argv, METRICS_OPTION)
+
 # Now we can import from raid_boss
-from kivy.app import App
-from kivy.core.clipboard import Clipboard
-from kivy.core.clipboard.clipboard_sdl2 import ClipboardSDL2
-from kivy.core.clipboard.clipboard_dummy import ClipboardDummy
-from raid_boss.game_state import GameState
-from raid_boss.ui_components import GameInterface, TextType
-from raid_boss.game_logic import GameLogic
+with PROFILE.phase("import kivy"):
+    from kivy.app import App
+    from kivy.clock import Clock
+with PROFILE.phase("import engine"):
+    from raid_boss.game_state import GameState
+    from raid_boss.game_logic import GameLogic
+    from raid_boss.journal import GameJournal, default_save_dir
+    from raid_boss.metrics import METRICS
+with PROFILE.phase("import interface"):
+    from raid_boss.ui_components import GameInterface, GameOutput, TextType
 
 
 class RaidBossApp(App):
+    METERED = ("on_enter",)
+
+    def __init__(self, save_dir=None, new_game=False, aggregate_spells=False, metrics_path=None, **kwargs):
+        super().__init__(**kwargs)
+        # Games are only saved when given a directory to save them in
+        self.save_dir = save_dir
+        self.new_game = new_game
+        self.aggregate_spells = aggregate_spells
+        # Handler timings are written here when the game was started with --metrics
+        self.metrics_path = metrics_path
+        self.journal = None
+
     def build(self):
-        # Initialize game state and interface
-        self.game_state = GameState()
-        self.interface = GameInterface()
-        self.game_logic = GameLogic(self.game_state, self.interface.output)
+        with PROFILE.phase("build interface"):
+            self.interface = GameInterface()
 
-        # Bind input box events
-        self.interface.input_box.bind(on_text_validate=self.on_enter)
+            # Bind input box events
+            self.interface.input_box.bind(on_text_validate=self.on_enter)
 
-        # Set up clipboard with fallback options
-        self._setup_clipboard()
+        with PROFILE.phase("load save"):
+            if self.save_dir:
+                self.journal = GameJournal(self.save_dir, "main")
+            saved = self.journal.load() if self.journal is not None and not self.new_game else None
 
-        # Add welcome message
-        self.interface.output.add_text("Welcome to Raid Boss!", TextType.GAME_STATE)
-        self.interface.output.add_text("How many people are playing?", TextType.PROMPT)
+            if saved is not None:
+                # Pick up a game that was interrupted
+                self.game_state, answers = saved
+                self.game_state.aggregate_spells = self.aggregate_spells
+                self.game_logic = GameLogic(self.game_state, self.interface.output, self.journal)
+                self.game_logic.replay(answers)
+                self.interface.output.add_text("Welcome back to Raid Boss!", TextType.GAME_STATE)
+                self.game_logic.show_resume()
+            else:
+                # Initialize game state
+                self.game_state = GameState()
+                self.game_state.aggregate_spells = self.aggregate_spells
+                self.game_logic = GameLogic(self.game_state, self.interface.output, self.journal)
+                if self.journal is not None:
+                    self.journal.checkpoint(self.game_state)
+                    if self.journal.dropped:
+                        self.interface.output.add_text(self.journal.dropped, TextType.ERROR)
+
+                # Add welcome message
+                self.interface.output.add_texts(
+                    [("Welcome to Raid Boss!", TextType.GAME_STATE), ("How many people are playing?", TextType.PROMPT)]
+                )
+
+        # Clipboard is only needed for copy and paste, so set it up once the first prompt is on screen
+        from kivy.core.window import Window
+
+        Window.bind(on_flip=self._on_first_frame)
+        if self.metrics_path:
+            Clock.schedule_interval(lambda dt: METRICS.write(self.metrics_path), METRICS_INTERVAL)
 
         return self.interface
 
+    def _on_first_frame(self, window):
+        window.unbind(on_flip=self._on_first_frame)
+        PROFILE.mark("first prompt drawn")
+        Clock.schedule_once(lambda dt: self._setup_clipboard())
+        if PROFILE.enabled:
+            print(PROFILE.report())
+
     def _setup_clipboard(self):
         """Set up clipboard with fallback options."""
-        try:
-            # Try SDL2 first
-            Clipboard.register("text", ClipboardSDL2)
-        except Exception:
+        with PROFILE.phase("clipboard"):
+            from kivy.core.clipboard import Clipboard
+
             try:
-                # Fall back to dummy clipboard
-                Clipboard.register("text", ClipboardDummy)
+                # Try SDL2 first
+                from kivy.core.clipboard.clipboard_sdl2 import ClipboardSDL2
+
+                Clipboard.register("text", ClipboardSDL2)
             except Exception:
-                # If all else fails, just ignore clipboard errors
-                pass
+                try:
+                    # Fall back to dummy clipboard
+                    from kivy.core.clipboard.clipboard_dummy import ClipboardDummy
+
+                    Clipboard.register("text", ClipboardDummy)
+                except Exception:
+                    # If all else fails, just ignore clipboard errors
+                    pass
 
     def on_enter(self, instance):
         """Handle text input validation."""
-        # Process input through game logic
-        phase_handlers = {
-            0: self.game_logic.handle_player_count,
-            1: self.game_logic.handle_boss_name,
-            2: self.game_logic.handle_boss_selection,
-            3: self.game_logic.handle_player_damage,
-            5: self.game_logic.handle_defeated_players,
-            6: lambda _: App.get_running_app().stop()
-        }
-        
-        handler = phase_handlers.get(self.game_state.phase)
-        if handler:
-            handler(instance.text)
+        # Process input through game logic; once the game is over, Enter exits
+        if not self.game_logic.handle_input(instance.text) and self.game_state.phase == 6:
+            App.get_running_app().stop()
 
         # Clear input box
         instance.text = ""
 
+    def on_stop(self):
+        if self.journal is not None:
+            self.journal.close()
+        if self.metrics_path:
+            METRICS.write(self.metrics_path)
+
 
 if __name__ == "__main__":
-    # Run the app
-    RaidBossApp().run()
+    if METRICS_PATH:
+        # Before anything is built, so every handler and callback picks up the timed methods
+        for metered in (RaidBossApp, GameLogic, GameOutput):
+            METRICS.instrument(metered)
+    # Run the app, resuming the last game unless --new-game was given
+    RaidBossApp(
+        save_dir=default_save_dir(),
+        new_game=NEW_GAME,
+        aggregate_spells=AGGREGATE_SPELLS,
+        metrics_path=METRICS_PATH,
+    ).run()
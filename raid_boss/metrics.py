@@ -0,0 +1,157 @@
+"""Opt-in latency metrics for the game's handlers.
+
+Classes list the methods worth timing in a ``METERED`` tuple. Nothing is timed until
+``METRICS.instrument(cls)`` swaps those methods for timed wrappers, so a game that is
+not being measured runs exactly the code it always did. Instrument before creating
+instances: ``GameLogic`` keeps bound handlers, and Kivy binds callbacks when the
+interface is built.
+
+Each method gets a call count and a latency histogram. They can be written as JSON or
+as a Prometheus text file (for node_exporter's textfile collector, say)::
+
+    raid_boss_handler_seconds_bucket{handler="GameLogic.handle_player_damage",le="0.001"} 41
+"""
+
+import json
+import os
+import time
+from array import array
+from bisect import bisect_left
+from functools import wraps
+from typing import Dict, List, Optional, Tuple
+
+# Upper bounds of the histogram buckets in seconds, from 10us up to a 1s stall
+BUCKETS = (0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+
+PROMETHEUS_METRIC = "raid_boss_handler_seconds"
+
+
+class LatencyHistogram:
+    __slots__ = ("counts", "sum")
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self) -> None:
+        # One count per bucket plus one for anything slower than the last bound
+        self.counts = array("Q", bytes(8 * (len(BUCKETS) + 1)))
+        self.sum = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect_left(BUCKETS, seconds)] += 1
+        self.sum += seconds
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts)
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        """(bucket bound, observations at or below it), ending with "+Inf", as Prometheus counts them."""
+        total = 0
+        buckets = []
+        for bound, count in zip(BUCKETS + (float("inf"),), self.counts):
+            total += count
+            buckets.append(("+Inf" if bound == float("inf") else repr(bound), total))
+        return buckets
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Upper bound of the bucket holding the ``q`` quantile (0 to 1); None if it is past the last one."""
+        target = q * self.count
+        total = 0
+        for bound, count in zip(BUCKETS, self.counts):
+            total += count
+            if total >= target and total:
+                return bound
+        return None
+
+
+class Instrumentation:
+    def __init__(self):
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        # (class, method name, original attribute) for every method swapped out
+        self._patched: List[Tuple[type, str, object]] = []
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._patched)
+
+    def instrument(self, cls: type) -> None:
+        """Time every method ``cls`` lists in ``METERED``, as "<class>.<method>"."""
+        if any(patched is cls for patched, _, _ in self._patched):
+            return
+        for name in cls.METERED:
+            original = cls.__dict__[name]
+            histogram = self.histograms.setdefault(f"{cls.__name__}.{name}", LatencyHistogram())
+            setattr(cls, name, self._timed(original, histogram))
+            self._patched.append((cls, name, original))
+
+    def uninstrument(self) -> None:
+        """Put back the original methods. The recorded metrics are kept."""
+        for cls, name, original in reversed(self._patched):
+            setattr(cls, name, original)
+        self._patched.clear()
+
+    def reset(self) -> None:
+        # Cleared in place, as the wrappers hold on to their histograms
+        for histogram in self.histograms.values():
+            histogram.clear()
+
+    @staticmethod
+    def _timed(method, histogram: LatencyHistogram):
+        observe = histogram.observe
+        clock = time.perf_counter
+
+        @wraps(method)
+        def wrapper(*args, **kwargs):
+            start = clock()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                observe(clock() - start)
+
+        return wrapper
+
+    def to_dict(self) -> dict:
+        return {
+            "buckets": list(BUCKETS),
+            "handlers": {
+                name: {
+                    "count": histogram.count,
+                    "sum": histogram.sum,
+                    "p50": histogram.quantile(0.5),
+                    "p99": histogram.quantile(0.99),
+                    "counts": list(histogram.counts),
+                }
+                for name, histogram in sorted(self.histograms.items())
+            },
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), indent=2)
+
+    def to_prometheus(self) -> str:
+        lines = [
+            f"# HELP {PROMETHEUS_METRIC} Time spent in each game handler.",
+            f"# TYPE {PROMETHEUS_METRIC} histogram",
+        ]
+        for name, histogram in sorted(self.histograms.items()):
+            for bound, count in histogram.cumulative():
+                lines.append(f'{PROMETHEUS_METRIC}_bucket{{handler="{name}",le="{bound}"}} {count}')
+            lines.append(f'{PROMETHEUS_METRIC}_sum{{handler="{name}"}} {histogram.sum!r}')
+            lines.append(f'{PROMETHEUS_METRIC}_count{{handler="{name}"}} {histogram.count}')
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str) -> None:
+        """Write the metrics to ``path``: Prometheus text for a .prom file, JSON otherwise.
+
+        The file is replaced atomically, so a collector never reads half of it.
+        """
+        text = self.to_prometheus() if path.endswith(".prom") else self.to_json()
+        temporary_path = path + ".tmp"
+        with open(temporary_path, "w", encoding="utf-8") as metrics_file:
+            metrics_file.write(text)
+        os.replace(temporary_path, path)
+
+
+# The one set of metrics every instrumented class reports to
+METRICS = Instrumentation()
@@ -0,0 +1,127 @@
+"""Per-player state: poison and damage dealt to the boss, and who is still alive.
+
+Players are kept as parallel columns rather than one object each, so a big convention
+raid is a handful of flat arrays: every update is a single index, and totals and the top
+damage dealers are one pass in C over a column.
+"""
+
+import heapq
+import struct
+import sys
+from array import array
+from typing import Iterator, List, Optional, Tuple
+
+# Largest table the game will set up; every player costs a slot in each column
+MAX_PLAYERS = 64
+
+
+def is_number(text: str) -> bool:
+    """Whether ``text`` is a whole number in ASCII digits. isdigit() also passes "²", which int() rejects."""
+    return text.isascii() and text.isdecimal()
+
+
+def parse_hit(text: str) -> Optional[Tuple[int, int]]:
+    """Read a player's turn as (damage, poison): "12", "3p" or "12 3p". None if it is not valid."""
+    damage = poison = None
+    for part in text.lower().split():
+        if part.endswith("p"):
+            if poison is not None or not is_number(part[:-1]):
+                return None
+            poison = int(part[:-1])
+        else:
+            if damage is not None or not is_number(part):
+                return None
+            damage = int(part)
+    if damage is None and poison is None:
+        return None
+    return damage or 0, poison or 0
+
+
+class PlayerTable:
+    _HEADER = struct.Struct("<I")
+
+    def __init__(self, count: int):
+        self.poison = array("q", bytes(8 * count))
+        self.damage = array("q", bytes(8 * count))
+        self.alive = bytearray(b"\x01") * count
+        self.alive_count = count
+
+    def __len__(self) -> int:
+        return len(self.alive)
+
+    def deal(self, player: int, damage: int = 0, poison: int = 0) -> None:
+        """Credit ``player`` with damage and poison dealt to the boss."""
+        self.damage[player] += damage
+        self.poison[player] += poison
+
+    def defeat(self, player: int) -> None:
+        if self.alive[player]:
+            self.alive[player] = 0
+            self.alive_count -= 1
+
+    def defeat_count(self, count: int) -> int:
+        """Mark ``count`` more players defeated, returning how many were still alive to defeat.
+
+        The game only asks how many players fell, so the last seats still alive go first.
+        """
+        defeated = 0
+        player = len(self.alive)
+        while defeated < count and self.alive_count:
+            player = self.alive.rindex(1, 0, player)
+            self.defeat(player)
+            defeated += 1
+        return defeated
+
+    def alive_players(self) -> Iterator[int]:
+        """Seats of the players still alive, in order."""
+        return (player for player, alive in enumerate(self.alive) if alive)
+
+    @property
+    def total_damage(self) -> int:
+        return sum(self.damage)
+
+    @property
+    def total_poison(self) -> int:
+        return sum(self.poison)
+
+    def top_damage(self, count: int = 1) -> List[Tuple[int, int]]:
+        """The ``count`` players who dealt the most damage, as (seat, damage), most first."""
+        return heapq.nlargest(count, enumerate(self.damage), key=lambda seat: seat[1])
+
+    def to_bytes(self) -> bytes:
+        return b"".join(
+            [
+                self._HEADER.pack(len(self)),
+                self._little_endian(self.poison).tobytes(),
+                self._little_endian(self.damage).tobytes(),
+                bytes(self.alive),
+            ]
+        )
+
+    @classmethod
+    def from_bytes(cls, data: bytes, position: int = 0, with_life: bool = False) -> Tuple["PlayerTable", int]:
+        """The table stored at ``position`` and the position just past it.
+
+        ``with_life`` reads a table saved with the life column it once had, which is skipped.
+        """
+        (count,) = cls._HEADER.unpack_from(data, position)
+        position += cls._HEADER.size
+        if with_life:
+            position += 8 * count
+        table = cls(0)
+        for name in ("poison", "damage"):
+            column = array("q")
+            column.frombytes(data[position : position + 8 * count])
+            setattr(table, name, cls._little_endian(column))
+            position += 8 * count
+        table.alive = bytearray(data[position : position + count])
+        table.alive_count = sum(table.alive)
+        return table, position + count
+
+    @staticmethod
+    def _little_endian(column: array) -> array:
+        if sys.byteorder == "little":
+            return column
+        swapped = array(column.typecode, column)
+        swapped.byteswap()
+        return swapped
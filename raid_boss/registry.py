@@ -0,0 +1,171 @@
+"""The bosses players can pick, and where they come from.
+
+Besides the built-in bosses and the ones compiled from ``data/BossMaster.xlsx``, boss
+packs can add their own in two ways:
+
+* an installed package with an entry point in the ``raid_boss.bosses`` group, pointing at
+  a ``BossInfo`` (or a list of them) in a small module that does not import the boss;
+* a JSON manifest in the plugins directory (``$RAID_BOSS_PLUGIN_DIR``, or
+  ``~/.raid_boss/plugins``) next to the Python file that defines the boss::
+
+      {"bosses": [{"key": "kraken", "name": "The Kraken", "module": "kraken.py",
+                   "class": "Kraken", "hints": ["tides", "tentacles"]}]}
+
+Only this metadata is read at startup. A boss's module is imported the first time that
+boss is picked, so the menu costs the same however many packs are installed.
+"""
+
+import importlib
+import importlib.util
+import json
+import os
+import sys
+import warnings
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Type
+
+from raid_boss.boss import Boss
+from raid_boss.players import is_number
+
+ENTRY_POINT_GROUP = "raid_boss.bosses"
+
+
+def default_plugin_dir() -> str:
+    return os.environ.get("RAID_BOSS_PLUGIN_DIR") or os.path.join(os.path.expanduser("~"), ".raid_boss", "plugins")
+
+
+@dataclass(frozen=True)
+class BossInfo:
+    key: str  # stable id, stored in saves
+    name: str  # shown in the boss menu
+    target: str  # "package.module:Class", or "path/to/file.py:Class"
+    hints: Tuple[str, ...] = ()  # what the boss's arcane intuition hints can warn about
+
+    def load(self) -> Type[Boss]:
+        """Import the boss class, the first time it is needed."""
+        return _load_target(self.target)
+
+
+@lru_cache(maxsize=None)
+def _load_target(target: str) -> Type[Boss]:
+    # rpartition, as a Windows path has a colon of its own
+    module_name, _, attribute = target.rpartition(":")
+    if module_name.endswith(".py"):
+        name = "raid_boss_plugins." + os.path.splitext(os.path.basename(module_name))[0]
+        spec = importlib.util.spec_from_file_location(name, module_name)
+        module = importlib.util.module_from_spec(spec)
+        # Registered before running it so the boss's source can be found (the tuner hashes it)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+    else:
+        module = importlib.import_module(module_name)
+    return getattr(module, attribute)
+
+
+BUILTIN_BOSSES = (
+    BossInfo("mana-god", "TheManaGod", "raid_boss.boss:TheManaGod", ("energy", "armies", "heals")),
+    BossInfo("horror", "HorrorfromtheDepths", "raid_boss.boss:HorrorfromtheDepths", ("energy", "beasts", "tides")),
+    BossInfo("lunar-channeler", "LunarChanneler", "raid_boss.boss:LunarChanneler", ("moon", "entities", "emrakul")),
+)
+
+
+class BossRegistry:
+    """Bosses in menu order. Each can be picked by its menu number (from 1) or its key."""
+
+    def __init__(self, bosses: Iterable[BossInfo] = BUILTIN_BOSSES):
+        self._bosses: List[BossInfo] = []
+        self._by_key: Dict[str, BossInfo] = {}
+        self._menu: Optional[Tuple[str, ...]] = None
+        # Packs whose bosses are only looked up the first time the registry is read
+        self._pending: List[Tuple[str, Callable[[], Iterable[BossInfo]]]] = []
+        for info in bosses:
+            self.register(info)
+
+    def register(self, info: BossInfo) -> None:
+        if info.key in self._by_key:
+            raise ValueError(f"A boss with the key {info.key!r} is already registered")
+        self._bosses.append(info)
+        self._by_key[info.key] = info
+        self._menu = None
+
+    def add_pack(self, name: str, load: Callable[[], Iterable[BossInfo]]) -> None:
+        """Register the bosses ``load`` returns, but only once the registry is first read."""
+        self._pending.append((name, load))
+        self._menu = None
+
+    def _load_pending(self) -> None:
+        while self._pending:
+            name, load = self._pending.pop(0)
+            try:
+                for info in load():
+                    self.register(info)
+            except Exception as error:
+                warnings.warn(f"Skipping boss pack {name!r}: {error}")
+
+    def __iter__(self) -> Iterator[BossInfo]:
+        self._load_pending()
+        return iter(self._bosses)
+
+    def __len__(self) -> int:
+        self._load_pending()
+        return len(self._bosses)
+
+    def find(self, choice: str) -> Optional[BossInfo]:
+        """The boss for a menu number or key, or None."""
+        self._load_pending()
+        if is_number(choice) and 1 <= int(choice) <= len(self._bosses):
+            return self._bosses[int(choice) - 1]
+        return self._by_key.get(choice)
+
+    def menu_options(self) -> Tuple[str, ...]:
+        self._load_pending()
+        if self._menu is None:
+            self._menu = tuple(f"{number}. {info.name}" for number, info in enumerate(self._bosses, 1))
+        return self._menu
+
+    def load_entry_points(self, group: str = ENTRY_POINT_GROUP) -> None:
+        # importlib.metadata is slow to import, so it waits until packs are looked up
+        from importlib.metadata import entry_points
+
+        for entry_point in sorted(entry_points(group=group), key=lambda entry_point: entry_point.name):
+            try:
+                found = entry_point.load()
+                for info in [found] if isinstance(found, BossInfo) else found:
+                    self.register(info)
+            except Exception as error:
+                # One broken pack should not keep the game from starting
+                warnings.warn(f"Skipping boss pack {entry_point.name!r}: {error}")
+
+    def load_plugin_dir(self, directory: str) -> None:
+        try:
+            names = sorted(name for name in os.listdir(directory) if name.endswith(".json"))
+        except FileNotFoundError:
+            return
+        for name in names:
+            path = os.path.join(directory, name)
+            try:
+                with open(path, encoding="utf-8") as manifest_file:
+                    manifest = json.load(manifest_file)
+                for entry in manifest["bosses"]:
+                    target = os.path.join(directory, entry["module"]) + ":" + entry["class"]
+                    self.register(BossInfo(entry["key"], entry["name"], target, tuple(entry.get("hints", ()))))
+            except (OSError, ValueError, KeyError, TypeError) as error:
+                warnings.warn(f"Skipping boss manifest {path}: {error}")
+
+
+def _workbook_pack() -> List[BossInfo]:
+    from raid_boss.boss_data import workbook_bosses
+
+    return workbook_bosses()
+
+
+@lru_cache(maxsize=None)
+def default_registry() -> BossRegistry:
+    """The built-in bosses, then installed packs, the plugins directory and the workbook's bosses."""
+    registry = BossRegistry()
+    registry.load_entry_points()
+    registry.load_plugin_dir(default_plugin_dir())
+    # Reading the workbook waits until the boss menu is needed
+    registry.add_pack("BossMaster.xlsx", _workbook_pack)
+    return registry
@@ -0,0 +1,257 @@
+from array import array
+from collections import deque
+from typing import Callable, Deque, Iterable, Optional, Tuple, Union
+import math
+import random
+import struct
+import sys
+
+DICE_ROLL = [0, 1, 2, 3, 4, 5]
+# Ways (out of 36) to roll each value 0-10 with two 0-5 dice.
+ROLL_WEIGHTS = (1, 2, 3, 4, 5, 6, 5, 4, 3, 2, 1)
+
+# Maps a random byte to a 2d6 roll (two 0-5 dice summed). Bytes 0-251 cover the 36 dice
+# outcomes exactly seven times each; 252-255 map to _REJECT and are redrawn.
+_REJECT = 0xFF
+_BYTE_TO_ROLL = bytes((byte % 36) // 6 + (byte % 6) if byte < 252 else _REJECT for byte in range(256))
+_REJECT_BYTE = bytes([_REJECT])
+
+
+def new_seed() -> int:
+    """Pick a fresh 64-bit seed from the operating system."""
+    return random.SystemRandom().getrandbits(64)
+
+
+def draw_rolls(count: int, rng=random) -> bytes:
+    """Draw ``count`` 2d6 rolls in bulk from ``rng.randbytes``."""
+    rolls = b""
+    while len(rolls) < count:
+        needed = count - len(rolls)
+        rolls += rng.randbytes(needed + needed // 32 + 1).translate(_BYTE_TO_ROLL).replace(_REJECT_BYTE, b"")
+    return rolls[:count]
+
+
+RollCurve = Callable[[int], int]
+
+
+def normal_curve(turn: int) -> int:
+    """Roll 2d6 per the turn number divided by 2, rounded down."""
+    return math.floor(0.5 * turn)
+
+
+def hard_curve(turn: int) -> int:
+    """Hard mode: roll 2d6 per the turn number."""
+    return turn
+
+
+ROLL_CURVES = {
+    "normal": normal_curve,
+    "hard": hard_curve,
+}
+
+
+class RollSchedule:
+    """Boss rolls for every turn, generated on demand.
+
+    Turns are drawn strictly in order, so a seeded ``rng`` gives the same rolls no matter
+    how far ahead the schedule is read. Each turn is an immutable ``bytes`` of roll values
+    (0-10, indexed into ``boss_funcs``). Turns before the last ``release()`` are dropped,
+    so a long game only holds the turns that are still ahead of it.
+    """
+
+    def __init__(self, curve: Union[str, RollCurve] = "normal", rng=random, log: Optional["ReplayLog"] = None):
+        if isinstance(curve, str):
+            if curve not in ROLL_CURVES:
+                raise ValueError(f"Unknown roll curve {curve!r}, expected one of {sorted(ROLL_CURVES)}")
+            self.curve_name = curve
+            self.curve = ROLL_CURVES[curve]
+        else:
+            self.curve_name = getattr(curve, "__name__", "custom")
+            self.curve = curve
+        self._rng = rng
+        self._log = log
+        self._first_turn = 0
+        self._turns: Deque[bytes] = deque()
+
+    def _draw_turn(self, turn: int) -> bytes:
+        count = self.curve(turn)
+        if count < 0:
+            raise ValueError(f"Roll curve {self.curve_name!r} returned {count} rolls for turn {turn}")
+        rolls = draw_rolls(count, self._rng)
+        if self._log is not None:
+            self._log.record(rolls)
+        return rolls
+
+    def __getitem__(self, turn: int) -> bytes:
+        if turn < self._first_turn:
+            raise IndexError(f"Turn {turn} has already been released")
+        while self._first_turn + len(self._turns) <= turn:
+            self._turns.append(self._draw_turn(self._first_turn + len(self._turns)))
+        return self._turns[turn - self._first_turn]
+
+    def release(self, turn: int) -> None:
+        """Forget every turn before ``turn``."""
+        while self._first_turn < turn:
+            if self._turns:
+                self._turns.popleft()
+            else:
+                # Keep the draw order intact even for turns nobody looked at
+                self._draw_turn(self._first_turn)
+            self._first_turn += 1
+
+    @property
+    def first_turn(self) -> int:
+        return self._first_turn
+
+    @property
+    def window(self) -> Tuple[bytes, ...]:
+        """Turns drawn but not yet released, starting at ``first_turn``."""
+        return tuple(self._turns)
+
+    def restore_window(self, first_turn: int, turns: Iterable[bytes]) -> None:
+        """Pick up where a saved schedule left off; the rng must be restored to match."""
+        self._first_turn = first_turn
+        self._turns = deque(turns)
+
+
+# Packs two rolls (0-10) into one byte, high nibble first.
+_UNPACK = [bytes((byte >> 4, byte & 0x0F)) for byte in range(256)]
+
+
+class ReplayLog:
+    """Every turn's boss rolls in the order they were drawn, two rolls per byte.
+
+    Together with the seed and curve name this is enough to replay a recorded game's boss
+    turns exactly, without touching a random number generator.
+    """
+
+    MAGIC = b"RBRL"
+    VERSION = 1
+    _HEADER = struct.Struct("<4sBH")
+
+    def __init__(self, seed: Optional[int] = None, curve_name: str = "normal"):
+        self.seed = seed
+        self.curve_name = curve_name
+        self.counts = array("I")
+        self.offsets = array("I", [0])
+        self.packed = bytearray()
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+    def record(self, rolls: bytes) -> None:
+        """Append the next turn's rolls."""
+        padded = rolls + b"\x00" if len(rolls) % 2 else rolls
+        self.packed += bytes(high << 4 | low for high, low in zip(padded[::2], padded[1::2]))
+        self.counts.append(len(rolls))
+        self.offsets.append(len(self.packed))
+
+    def __getitem__(self, turn: int) -> bytes:
+        if not 0 <= turn < len(self):
+            raise IndexError(f"Turn {turn} was not recorded")
+        packed = self.packed[self.offsets[turn] : self.offsets[turn + 1]]
+        return b"".join(_UNPACK[byte] for byte in packed)[: self.counts[turn]]
+
+    def schedule(self) -> "ReplaySchedule":
+        """A roll schedule that serves the recorded turns instead of rolling."""
+        return ReplaySchedule(self)
+
+    def to_bytes(self) -> bytes:
+        seed = b"" if self.seed is None else str(self.seed).encode("ascii")
+        curve_name = self.curve_name.encode("utf-8")
+        return b"".join(
+            [
+                self._HEADER.pack(self.MAGIC, self.VERSION, len(seed)),
+                seed,
+                struct.pack("<H", len(curve_name)),
+                curve_name,
+                struct.pack("<I", len(self.counts)),
+                self._little_endian(self.counts).tobytes(),
+                bytes(self.packed),
+            ]
+        )
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "ReplayLog":
+        magic, version, seed_length = cls._HEADER.unpack_from(data)
+        if magic != cls.MAGIC or version != cls.VERSION:
+            raise ValueError("Not a Raid Boss replay log")
+        position = cls._HEADER.size
+        seed = data[position : position + seed_length]
+        position += seed_length
+        (curve_length,) = struct.unpack_from("<H", data, position)
+        position += 2
+        curve_name = data[position : position + curve_length].decode("utf-8")
+        position += curve_length
+        (turns,) = struct.unpack_from("<I", data, position)
+        position += 4
+
+        log = cls(int(seed) if seed else None, curve_name)
+        log.counts.frombytes(data[position : position + turns * log.counts.itemsize])
+        log.counts = cls._little_endian(log.counts)
+        position += turns * log.counts.itemsize
+        for count in log.counts:
+            log.offsets.append(log.offsets[-1] + (count + 1) // 2)
+        log.packed = bytearray(data[position:])
+        if len(log.packed) != log.offsets[-1]:
+            raise ValueError("Replay log is truncated")
+        return log
+
+    @staticmethod
+    def _little_endian(counts: array) -> array:
+        if sys.byteorder == "little":
+            return counts
+        swapped = array(counts.typecode, counts)
+        swapped.byteswap()
+        return swapped
+
+    def save(self, path: str) -> None:
+        with open(path, "wb") as replay_file:
+            replay_file.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: str) -> "ReplayLog":
+        with open(path, "rb") as replay_file:
+            return cls.from_bytes(replay_file.read())
+
+
+class ReplaySchedule(RollSchedule):
+    """Roll schedule that plays back a ``ReplayLog`` turn by turn.
+
+    The log only holds the turns the recorded game drew, but a replayed game can play on
+    longer. Past the end of the log the rolls carry on as the recorded game's would have,
+    from a ``RollSchedule`` rebuilt from the log's seed and curve; the new turns are added
+    to the log. A log without a seed or with a custom curve cannot be carried on.
+    """
+
+    def __init__(self, log: ReplayLog):
+        super().__init__(ROLL_CURVES.get(log.curve_name, self._recorded_count))
+        self.curve_name = log.curve_name
+        self.replay_log = log
+        self._continuation: Optional[RollSchedule] = None
+
+    def _recorded_count(self, turn: int) -> int:
+        # Custom curves cannot be restored, so forecasts use the recorded roll counts
+        if turn >= len(self.replay_log):
+            self._cannot_continue(turn)
+        return self.replay_log.counts[turn]
+
+    def _cannot_continue(self, turn: int) -> None:
+        raise ValueError(
+            f"The replay ends after turn {len(self.replay_log) - 1} and cannot be carried on to turn {turn}: "
+            f"it has no seed or uses a custom roll curve"
+        )
+
+    def _draw_turn(self, turn: int) -> bytes:
+        if turn < len(self.replay_log):
+            return self.replay_log[turn]
+        if self._continuation is None:
+            if self.replay_log.seed is None or self.curve_name not in ROLL_CURVES:
+                self._cannot_continue(turn)
+            # Drawing the recorded turns again brings the generator to where the recording stopped
+            self._continuation = RollSchedule(self.curve_name, rng=random.Random(self.replay_log.seed))
+            self._continuation.release(len(self.replay_log))
+        rolls = self._continuation[turn]
+        self._continuation.release(turn + 1)
+        self.replay_log.record(rolls)
+        return rolls
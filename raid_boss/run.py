@@ -1,111 +1,178 @@
+import argparse
+import atexit
 import random
-import math
 import sys
 import os
 
 # Add the parent directory to the sys.path to handle standalone execution
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from raid_boss import boss
+from raid_boss.game_state import GameState
+from raid_boss.journal import GameJournal, default_save_dir
+from raid_boss.players import MAX_PLAYERS, is_number, parse_hit
+from raid_boss.rolls import DICE_ROLL, ReplayLog
+from raid_boss.startup import pop_flag
 
+BATCH_FLAG = "--batch"
 
-DICE_ROLL = [0, 1, 2, 3, 4, 5]
 
+def roll(rng=random):
+    return rng.choice(DICE_ROLL) + rng.choice(DICE_ROLL)
 
-def roll():
-    return random.choice(DICE_ROLL) + random.choice(DICE_ROLL)
 
+def play(game_state, ask, journal=None, aggregate_spells=False, setup=input):
+    """Play the game in ``game_state`` to the end, returning whether the players won.
 
-store_prerolls = []
-for i in range(100):
-    innerlist = []
-    reps = math.floor(0.5 * i)
-    for ii in range(reps):
-        innerlist.append(roll())
-    store_prerolls.append(innerlist)
-
-if __name__ == "__main__":
-    num_players = int(input("Welcome to Raid Boss! How many people are playing? > "))
-    boss_name = str(
-        input(f"Ahh! Welcome to the dungeon, ye {num_players} brave wizard(s)! Who have you come here to slay? > ")
-    )
+    ``ask`` asks the battle's questions and ``setup`` the two setup questions. The batch
+    driver passes in scripted answers for both.
+    """
+    if game_state.boss is None:
+        # Setup answers are not journaled; the first snapshot is taken as soon as the battle starts
+        answer = setup("Welcome to Raid Boss! How many people are playing? > ")
+        while not (is_number(answer) and 1 <= int(answer) <= MAX_PLAYERS):
+            answer = setup(f"Please enter a number from 1 to {MAX_PLAYERS}. How many people are playing? > ")
+        game_state.num_players = int(answer)
+        game_state.boss_name = str(
+            setup(
+                f"Ahh! Welcome to the dungeon, ye {game_state.num_players} brave wizard(s)! "
+                "Who have you come here to slay? > "
+            )
+        )
+        game_state.initialize_boss("lunar-channeler")
+        game_state.phase = 3
+    num_players = game_state.num_players
+    boss_name = game_state.boss_name
     print(f"\nHere comes {boss_name} now! Prepare thyselves for a whimsical battle! Best of luck!")
 
-    boss_list = [boss.TheManaGod, boss.HorrorfromtheDepths, boss.LunarChanneler]
-    stinky = boss.LunarChanneler(player_count=num_players, boss_name=boss_name)
+    stinky = game_state.boss
+    lookahead = game_state.lookahead
 
-    BOSS_HEALTH = stinky.health
+    BOSS_HEALTH = num_players * stinky.BASE_HEALTH
     EVENT_TRIGGER_AMOUNT = BOSS_HEALTH / 2
-    trigger = True
-    boss_funcs = [
-        stinky.two,
-        stinky.three,
-        stinky.four,
-        stinky.five,
-        stinky.six,
-        stinky.seven,
-        stinky.eight,
-        stinky.nine,
-        stinky.ten,
-        stinky.eleven,
-        stinky.twelve,
-    ]
-
-    while stinky.health > 0:
+    # Only damage lowers this boss's health, so a resumed game has already seen the event if it is below half
+    trigger = stinky.health > EVENT_TRIGGER_AMOUNT
+    players = game_state.players
+    while not game_state.is_game_over():
         if stinky.health <= EVENT_TRIGGER_AMOUNT and trigger:
             print("The boss unleashes a hellish energy...")
             trigger = False
 
-        for i in range(0, stinky.player_count):
-            try:
-                damage_done = int(
-                    input(f"\n\nPLAYER {i+1} TURN: Enter damage dealt! (Even if it's zero) and press enter!> ")
-                )
-                stinky.health -= damage_done
-            except ValueError:
+        # Snapshot at the start of every round; the journal holds the answers given since
+        if journal is not None:
+            journal.checkpoint(game_state)
+
+        for i in list(players.alive_players()):
+            hit = parse_hit(
+                ask(f"\n\nPLAYER {i+1} TURN: Enter damage dealt! (Even if it's zero, add e.g. 3p for poison)> ")
+            )
+            if hit is None:
                 print("Invalid response, I'll assume you meant 0!")
-                damage_done = 0
+                hit = (0, 0)
+            game_state.process_damage(*hit, player=i)
             print(f"Boss health at {stinky.health}")
-            if stinky.health <= 0:
+            if hit[1]:
+                print(f"Boss poison at {stinky.poison} of {game_state.poison_needed}")
+            if game_state.is_game_over():
                 break
 
-        if stinky.health <= 0:
+        if game_state.is_game_over():
             break
 
-        stinky.current_attacks = store_prerolls[stinky.turn_count]
-        stinky.next_attacks = store_prerolls[stinky.turn_count + 1]
+        plan = lookahead.advance(stinky.turn_count)
+        stinky.current_attacks = plan.rolls
+        stinky.next_attacks = lookahead[stinky.turn_count + 1].rolls
 
-        if len(store_prerolls[stinky.turn_count]) == 0:
+        if len(stinky.current_attacks) == 0:
             print(f"\n\n{boss_name} cannot attack on turn 1! You're safe until next turn.")
-        for num in stinky.current_attacks:
-            stinky.text_result += "\n" + str(boss_funcs[num]()) + "\n"
+        if stinky.current_attacks:
+            stinky.text_result = "\n" + lookahead.render_attacks(plan, "\n\n", aggregate=aggregate_spells) + "\n"
 
         print("The boss gets " + str(len(stinky.current_attacks)) + " roll(s) this turn! Brace yourself!")
         print("TURN COUNT: " + str(stinky.turn_count))
-        if stinky.turn_count != 1:
-            print(
-                f"""\n\nTHE BOSS ATTACKS!
+        if stinky.current_attacks:
+            print(f"""\n\nTHE BOSS ATTACKS!
                 {stinky.text_result}
-            """
-            )
+            """)
         print("Arcane intuition tells you...")
-        print(stinky.get_attack_hint(stinky.next_attacks))
+        print(lookahead.hint(stinky.turn_count + 1))
 
         try:
-            death_count = int(input("How many players were defeated this turn? (enter 0 if no one was defeated) > "))
-            stinky.player_count -= death_count
+            death_count = int(ask("How many players were defeated this turn? (enter 0 if no one was defeated) > "))
+            game_state.defeat_players(max(death_count, 0))
         except ValueError:
             print("Invalid response! I'm going to assume everyone is still in the fight!")
-        if stinky.player_count <= 0:
+        if players.alive_count <= 0:
             print(f"{boss_name} has defeated you!!!! Retreat and come back- next time cast better spells!")
             break
 
         stinky.turn_count += 1
         stinky.text_result = ""
 
-    if stinky.health < 0:
+    if journal is not None:
+        journal.discard()
+
+    if game_state.is_game_over():
+        seat, damage = players.top_damage()[0]
+        if damage:
+            print(f"PLAYER {seat + 1} dealt the most damage: {damage} of {players.total_damage}.")
         print(
             f"Congratulations! You have defeated {boss_name}! They cower away from your SUPREME WHIMSY! Thanks for playing!"
         )
     else:
         print("Retry? Run the program again!")
+    return game_state.is_game_over()
+
+
+if __name__ == "__main__":
+    if pop_flag(sys.argv, BATCH_FLAG):
+        # Scripted games through this file's game loop; see raid_boss/batch.py
+        from raid_boss.batch import main
+
+        sys.exit(main(sys.argv[1:], engine="run"))
+
+    parser = argparse.ArgumentParser(description="Play Raid Boss in the terminal.")
+    parser.add_argument("--hard", action="store_true", help="hard mode: roll 2d6 per the turn number")
+    parser.add_argument("--seed", type=int, default=None, help="seed for the boss rolls")
+    parser.add_argument("--record", metavar="FILE", help="save the boss rolls to a replay log")
+    parser.add_argument("--replay", metavar="FILE", help="play the boss rolls back from a replay log")
+    parser.add_argument("--new-game", action="store_true", help="start over instead of resuming the saved game")
+    parser.add_argument(
+        "--aggregate-spells", action="store_true", help="show repeated spells once per turn with a multiplier"
+    )
+    parser.add_argument("--no-save", action="store_true", help="do not save the game as it is played")
+    args = parser.parse_args()
+
+    # The game is saved as it is played so it can be resumed after a crash or a closed terminal
+    journal = None if args.no_save else GameJournal(default_save_dir(), "run", checkpoint_every=0)
+    saved = journal.load() if journal is not None and not args.new_game else None
+    if saved is not None:
+        game_state, answers = saved
+        print("Resuming your saved game. Run with --new-game to start over.")
+    else:
+        if journal is not None and journal.dropped:
+            print(journal.dropped)
+        answers = []
+        replay = ReplayLog.load(args.replay) if args.replay else None
+        game_state = GameState("hard" if args.hard else "normal", args.seed, replay)
+        if journal is not None:
+            journal.discard()
+    if journal is not None:
+        # Waits for the last answers to reach the disk
+        atexit.register(journal.close)
+    replay_log = game_state.replay_log
+    print(f"Game seed: {replay_log.seed}")
+
+    def ask(prompt):
+        """input() that answers from the saved game first, journaling every answer."""
+        if answers:
+            answer = answers.pop(0)
+            print(prompt + answer)
+        else:
+            answer = input(prompt)
+        if journal is not None:
+            journal.record(answer, game_state)
+        return answer
+
+    play(game_state, ask, journal, args.aggregate_spells)
+    if args.record:
+        replay_log.save(args.record)
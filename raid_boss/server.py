@@ -0,0 +1,155 @@
+"""Asyncio server that hosts many independent Raid Boss games in one process.
+
+Every TCP connection gets its own session: a ``GameState``, a ``GameLogic`` and an
+in-memory sink. Each line the client sends is one answer to the current prompt. The
+server replies with that input's output and then a line holding only the ASCII
+record separator (``\\x1e``), which marks that it is waiting for the next answer. The
+separator does not show up in most terminals, so ``nc localhost 8765`` works as a client.
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+from typing import Dict, Optional
+
+# Add the parent directory to the sys.path to handle standalone execution
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from raid_boss.game_logic import GameLogic
+from raid_boss.game_state import GameState
+from raid_boss.game_text import TextType
+from raid_boss.rolls import new_seed
+from raid_boss.sinks import MemorySink
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+# Accept-queue length; bursts of connections beyond it are silently dropped by the kernel
+DEFAULT_BACKLOG = 1024
+END_OF_RESPONSE = "\x1e\n"
+
+
+class Session:
+    """One game, driven a line at a time."""
+
+    def __init__(self, session_id: int, curve: str = "normal", seed: Optional[int] = None):
+        self.id = session_id
+        self.game_state = GameState(curve=curve, seed=seed)
+        self.output = MemorySink()
+        self.logic = GameLogic(self.game_state, self.output)
+
+    @property
+    def finished(self) -> bool:
+        return self.game_state.phase == 6
+
+    def welcome(self) -> str:
+        self.output.add_texts(
+            [
+                (f"Session {self.id}, game seed {self.game_state.seed}", TextType.GAME_STATE),
+                ("Welcome to Raid Boss!", TextType.GAME_STATE),
+                ("How many people are playing?", TextType.PROMPT),
+            ]
+        )
+        return self._take_output()
+
+    def handle(self, line: str) -> str:
+        self.logic.handle_input(line)
+        return self._take_output()
+
+    def _take_output(self) -> str:
+        text = self.output.text
+        self.output.clear()
+        return text
+
+
+class GameServer:
+    def __init__(
+        self,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        curve: str = "normal",
+        seed=None,
+        backlog: int = DEFAULT_BACKLOG,
+    ):
+        self.host = host
+        self.port = port
+        self.backlog = backlog
+        self.curve = curve
+        # With a seed, session N plays with seed + N so a night of games can be replayed
+        self.seed = seed
+        self.sessions: Dict[int, Session] = {}
+        self.sessions_started = 0
+        self.inputs_handled = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    def new_session(self) -> Session:
+        self.sessions_started += 1
+        session_id = self.sessions_started
+        seed = new_seed() if self.seed is None else self.seed + session_id
+        session = self.sessions[session_id] = Session(session_id, self.curve, seed)
+        return session
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._serve_client, self.host, self.port, backlog=self.backlog)
+        # Port 0 picks a free port; report the real one
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def _serve_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        session = self.new_session()
+        try:
+            writer.write((session.welcome() + END_OF_RESPONSE).encode("utf-8"))
+            await writer.drain()
+            while not session.finished:
+                line = await reader.readline()
+                if not line:
+                    break
+                response = session.handle(line.decode("utf-8", errors="replace").rstrip("\r\n"))
+                self.inputs_handled += 1
+                writer.write((response + END_OF_RESPONSE).encode("utf-8"))
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            del self.sessions[session.id]
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Host Raid Boss games over TCP.")
+    parser.add_argument("--host", default=DEFAULT_HOST, help="use 0.0.0.0 to accept players from the LAN")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--hard", action="store_true", help="hard mode: roll 2d6 per the turn number")
+    parser.add_argument("--seed", type=int, default=None, help="base seed; session N uses seed + N")
+    parser.add_argument("--backlog", type=int, default=DEFAULT_BACKLOG, help="pending connections to queue")
+    args = parser.parse_args(argv)
+
+    server = GameServer(args.host, args.port, "hard" if args.hard else "normal", args.seed, args.backlog)
+
+    async def run() -> None:
+        await server.start()
+        print(f"Raid Boss server listening on {server.host}:{server.port}")
+        await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        print(f"\nServed {server.sessions_started} session(s) and {server.inputs_handled} input(s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,291 @@
+"""Headless Monte Carlo encounter simulator.
+
+Plays complete boss encounters in NumPy batches so encounters can be tuned without
+going through the interactive ``run.py`` loop. Each simulated turn follows the table
+rules: every player deals damage (and optionally poison), the boss dies if its health
+drops to zero or its poison reaches the limit, and otherwise it rolls
+``floor(0.5 * turn)`` times 2d6 and resolves any heals.
+"""
+
+import argparse
+import math
+import os
+import sys
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Optional, Tuple, Type
+
+import numpy as np
+
+# Add the parent directory to the sys.path to handle standalone execution
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from raid_boss.boss import Boss, TheManaGod, HorrorfromtheDepths, LunarChanneler
+from raid_boss.rolls import ROLL_WEIGHTS
+
+BOSSES = (TheManaGod, HorrorfromtheDepths, LunarChanneler)
+
+# Probability of each roll value (two 0-5 dice summed), indexed like ``boss_funcs``.
+ROLL_PROBABILITIES = np.array(ROLL_WEIGHTS, dtype=np.float64) / 36
+
+DEFAULT_MAX_TURNS = 60
+DEFAULT_BATCH_SIZE = 250_000
+
+# A damage model receives the generator, the turn number and the (games, players) shape
+# of the still-running games, and returns the damage each player deals this turn.
+DamageModel = Callable[[np.random.Generator, int, Tuple[int, int]], np.ndarray]
+
+
+def constant_damage(amount: int) -> DamageModel:
+    """Every player deals the same damage every turn."""
+
+    def model(rng: np.random.Generator, turn: int, shape: Tuple[int, int]) -> np.ndarray:
+        return np.full(shape, amount, dtype=np.int64)
+
+    return model
+
+
+def poisson_damage(mean: float, growth: float = 0.0) -> DamageModel:
+    """Poisson damage per player whose mean grows linearly with the turn number."""
+
+    def model(rng: np.random.Generator, turn: int, shape: Tuple[int, int]) -> np.ndarray:
+        return rng.poisson(max(mean + growth * (turn - 1), 0.0), size=shape)
+
+    return model
+
+
+def heal_table(boss_cls: Type[Boss], player_count: int) -> np.ndarray:
+    """Return how much each roll value heals the boss, as measured by ``Boss.heal_table``."""
+    return np.array(boss_cls.heal_table(player_count), dtype=np.int64)
+
+
+@dataclass
+class SimulationReport:
+    boss: str
+    player_count: int
+    games: int
+    wins: int
+    turns_to_kill: np.ndarray  # turns_to_kill[t] = games won on turn t
+    heal_totals: np.ndarray  # heal_totals[h] = games in which the boss healed h in total
+    poison_wins: int = 0  # wins where poison, not damage, finished the boss
+
+    @property
+    def win_rate(self) -> float:
+        return self.wins / self.games if self.games else 0.0
+
+    @property
+    def mean_turns_to_kill(self) -> float:
+        if not self.wins:
+            return math.nan
+        return float(np.arange(self.turns_to_kill.size) @ self.turns_to_kill) / self.wins
+
+    def turns_to_kill_percentile(self, q: float) -> int:
+        """Turn by which ``q`` percent of the won games were over."""
+        return _histogram_percentile(self.turns_to_kill, q)
+
+    @property
+    def mean_heal(self) -> float:
+        return float(np.arange(self.heal_totals.size) @ self.heal_totals) / self.games if self.games else 0.0
+
+    def heal_percentile(self, q: float) -> int:
+        return _histogram_percentile(self.heal_totals, q)
+
+    def merge(self, other: "SimulationReport") -> "SimulationReport":
+        return SimulationReport(
+            boss=self.boss,
+            player_count=self.player_count,
+            games=self.games + other.games,
+            wins=self.wins + other.wins,
+            turns_to_kill=_add_histograms(self.turns_to_kill, other.turns_to_kill),
+            heal_totals=_add_histograms(self.heal_totals, other.heal_totals),
+            poison_wins=self.poison_wins + other.poison_wins,
+        )
+
+
+def _add_histograms(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    if a.size < b.size:
+        a, b = b, a
+    result = a.copy()
+    result[: b.size] += b
+    return result
+
+
+def _histogram_percentile(histogram: np.ndarray, q: float) -> int:
+    total = histogram.sum()
+    if not total:
+        return 0
+    return int(np.searchsorted(np.cumsum(histogram), total * q / 100.0))
+
+
+def _heal_rolls(heals: np.ndarray) -> Tuple[Tuple[int, float, int], ...]:
+    return tuple((roll, ROLL_PROBABILITIES[roll], int(heals[roll])) for roll in np.flatnonzero(heals))
+
+
+def _simulate_batch(
+    rng: np.random.Generator,
+    games: int,
+    player_count: int,
+    heals: np.ndarray,
+    damage_model: DamageModel,
+    max_turns: int,
+    base_health: int = Boss.BASE_HEALTH,
+    poison_model: Optional[DamageModel] = None,
+    poison_limit: int = 0,
+) -> Tuple[np.ndarray, np.ndarray, int]:
+    health = np.full(games, player_count * base_health, dtype=np.int64)
+    healed = np.zeros(games, dtype=np.int64)
+    kill_turn = np.zeros(games, dtype=np.int64)
+    poison = np.zeros(games, dtype=np.int64) if poison_model is not None else None
+    poisoned = 0
+    active = np.arange(games)
+    heal_rolls = _heal_rolls(heals)
+
+    for turn in range(1, max_turns + 1):
+        damage = np.asarray(damage_model(rng, turn, (active.size, player_count))).sum(axis=1)
+        remaining = health[active] - damage
+        killed = remaining <= 0
+        if poison is not None:
+            dosed = poison[active] + np.asarray(poison_model(rng, turn, (active.size, player_count))).sum(axis=1)
+            poison[active] = dosed
+            poisoned += int(np.count_nonzero((dosed >= poison_limit) & ~killed))
+            killed |= dosed >= poison_limit
+        kill_turn[active[killed]] = turn
+        health[active] = remaining
+        active = active[~killed]
+        if not active.size:
+            break
+
+        rolls = math.floor(0.5 * turn)
+        if not rolls or not heal_rolls:
+            continue
+        # Only the heal spells change the boss' health, so draw the multinomial counts of
+        # those roll values one binomial at a time instead of rolling every die.
+        left = np.full(active.size, rolls, dtype=np.int64)
+        left_probability = 1.0
+        turn_heal = np.zeros(active.size, dtype=np.int64)
+        for roll, probability, amount in heal_rolls:
+            hits = rng.binomial(left, min(probability / left_probability, 1.0))
+            turn_heal += hits * amount
+            left -= hits
+            left_probability -= probability
+        health[active] += turn_heal
+        healed[active] += turn_heal
+
+    return kill_turn, healed, poisoned
+
+
+def simulate(
+    boss_cls: Type[Boss],
+    player_count: int,
+    games: int,
+    damage_model: DamageModel,
+    max_turns: int = DEFAULT_MAX_TURNS,
+    seed: Optional[int] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    base_health: Optional[int] = None,
+    heal_scale: float = 1.0,
+    poison_model: Optional[DamageModel] = None,
+    poison_per_player: Optional[int] = None,
+) -> SimulationReport:
+    """Simulate ``games`` encounters against one boss at one player count.
+
+    A game counts as a win when the boss is killed within ``max_turns`` turns. The boss's
+    ``BASE_HEALTH`` and ``POISON_PER_PLAYER`` can be overridden and its heals scaled, to
+    try out changes before making them. Poison only counts when a ``poison_model`` says
+    how much the players deal.
+    """
+    rng = np.random.default_rng(seed)
+    heals = heal_table(boss_cls, player_count)
+    if heal_scale != 1.0:
+        heals = np.rint(heals * heal_scale).astype(np.int64)
+    base_health = boss_cls.BASE_HEALTH if base_health is None else base_health
+    poison_limit = player_count * (boss_cls.POISON_PER_PLAYER if poison_per_player is None else poison_per_player)
+    report = SimulationReport(
+        boss=boss_cls.__name__,
+        player_count=player_count,
+        games=0,
+        wins=0,
+        turns_to_kill=np.zeros(max_turns + 1, dtype=np.int64),
+        heal_totals=np.zeros(1, dtype=np.int64),
+    )
+    remaining = games
+    while remaining > 0:
+        size = min(batch_size, remaining)
+        kill_turn, healed, poisoned = _simulate_batch(
+            rng, size, player_count, heals, damage_model, max_turns, base_health, poison_model, poison_limit
+        )
+        won = kill_turn > 0
+        report = report.merge(
+            SimulationReport(
+                boss=report.boss,
+                player_count=player_count,
+                games=size,
+                wins=int(won.sum()),
+                turns_to_kill=np.bincount(kill_turn[won], minlength=max_turns + 1),
+                heal_totals=np.bincount(healed),
+                poison_wins=poisoned,
+            )
+        )
+        remaining -= size
+    return report
+
+
+def simulate_encounters(
+    games: int,
+    damage_model: DamageModel,
+    bosses: Iterable[Type[Boss]] = BOSSES,
+    player_counts: Iterable[int] = range(1, 7),
+    max_turns: int = DEFAULT_MAX_TURNS,
+    seed: Optional[int] = None,
+) -> Dict[Tuple[str, int], SimulationReport]:
+    """Simulate every boss at every player count, keyed by (boss class name, player count)."""
+    seeds = np.random.SeedSequence(seed)
+    bosses = tuple(bosses)
+    player_counts = tuple(player_counts)
+    streams = iter(seeds.spawn(len(bosses) * len(player_counts)))
+    return {
+        (boss_cls.__name__, player_count): simulate(
+            boss_cls, player_count, games, damage_model, max_turns=max_turns, seed=next(streams)
+        )
+        for boss_cls in bosses
+        for player_count in player_counts
+    }
+
+
+def format_report(report: SimulationReport) -> str:
+    return (
+        f"{report.boss:<22} players={report.player_count:<3} games={report.games:<9} "
+        f"win rate={report.win_rate:6.1%}  "
+        f"turns to kill mean={report.mean_turns_to_kill:5.2f} "
+        f"p50={report.turns_to_kill_percentile(50)} p90={report.turns_to_kill_percentile(90)}  "
+        f"boss heals mean={report.mean_heal:7.1f} p90={report.heal_percentile(90)}"
+    )
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Simulate Raid Boss encounters.")
+    parser.add_argument("--games", type=int, default=100_000, help="games per boss and player count")
+    parser.add_argument("--players", type=int, nargs="+", default=[2, 3, 4, 5, 6])
+    parser.add_argument("--damage", type=float, default=30.0, help="mean damage per player per turn")
+    parser.add_argument("--growth", type=float, default=2.0, help="extra mean damage per player each turn")
+    parser.add_argument("--max-turns", type=int, default=DEFAULT_MAX_TURNS)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    reports = simulate_encounters(
+        args.games,
+        poisson_damage(args.damage, args.growth),
+        player_counts=args.players,
+        max_turns=args.max_turns,
+        seed=args.seed,
+    )
+    elapsed = time.perf_counter() - start
+    for report in reports.values():
+        print(format_report(report))
+    total = sum(report.games for report in reports.values())
+    print(f"\n{total} games in {elapsed:.2f}s ({total / elapsed * 60:,.0f} games/minute)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Output sinks the game engine writes to.
+
+``GameLogic`` only needs an object with ``add_text``. Sinks that also provide
+``batch()`` get each handler's output in one batch. The Kivy ``GameOutput`` widget is
+one sink; the ones here need nothing beyond the standard library, so the engine can be
+driven from scripts, servers and tests without a GUI.
+"""
+
+import sys
+from contextlib import contextmanager
+from typing import Iterable, List, Optional, Protocol, TextIO, Tuple
+
+from raid_boss.game_text import TextType, line_suffix
+
+
+class OutputSink(Protocol):
+    def add_text(self, content: str, text_type: TextType, priority: int = 0) -> None: ...
+
+
+# Terminal colours matching the ones GameOutput draws in
+ANSI_COLORS = {
+    TextType.ERROR: "\033[91m",
+    TextType.BOSS_ATTACK: "\033[33m",
+    TextType.PROMPT: "\033[92m",
+}
+ANSI_RESET = "\033[0m"
+
+
+class MemorySink:
+    """Keeps every line in a list."""
+
+    def __init__(self):
+        self.lines: List[Tuple[str, TextType]] = []
+
+    def add_text(self, content: str, text_type: TextType, priority: int = 0) -> None:
+        self.lines.append((content, text_type))
+
+    def add_texts(self, texts: Iterable[Tuple[str, TextType]]) -> None:
+        self.lines.extend(texts)
+
+    @contextmanager
+    def batch(self):
+        yield self
+
+    @property
+    def text(self) -> str:
+        """The plain transcript, formatted the same way as ``GameOutput.text``."""
+        return "".join(content + line_suffix(text_type) for content, text_type in self.lines)
+
+    def clear(self) -> None:
+        self.lines.clear()
+
+
+class StdoutSink:
+    """Writes lines to a text stream, once per batch when used with ``batch()``."""
+
+    def __init__(self, stream: Optional[TextIO] = None, color: bool = False):
+        self._stream = stream
+        self.color = color
+        self._pending: List[str] = []
+        self._batch_depth = 0
+
+    @property
+    def stream(self) -> TextIO:
+        # Looked up on every write so redirected or captured stdout is honoured
+        return self._stream if self._stream is not None else sys.stdout
+
+    def _format(self, content: str, text_type: TextType) -> str:
+        if self.color and text_type in ANSI_COLORS:
+            content = ANSI_COLORS[text_type] + content + ANSI_RESET
+        return content + line_suffix(text_type)
+
+    def add_text(self, content: str, text_type: TextType, priority: int = 0) -> None:
+        self._pending.append(self._format(content, text_type))
+        if not self._batch_depth:
+            self.flush()
+
+    def add_texts(self, texts: Iterable[Tuple[str, TextType]]) -> None:
+        self._pending.extend(self._format(content, text_type) for content, text_type in texts)
+        if not self._batch_depth:
+            self.flush()
+
+    @contextmanager
+    def batch(self):
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self.flush()
+
+    def flush(self) -> None:
+        if self._pending:
+            self.stream.write("".join(self._pending))
+            self._pending.clear()
+        self.stream.flush()
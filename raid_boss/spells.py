@@ -0,0 +1,53 @@
+"""What boss spells do, as data.
+
+Every spell has prose for the players and a ``SpellEffect`` that says the same thing in
+numbers: tokens created, heals, and what players sacrifice, discard or have bounced.
+The simulator and forecasts read effects instead of casting spells, and the spell text
+is filled in from them.
+"""
+
+from dataclasses import dataclass, replace
+from typing import Optional, Tuple
+
+# Count for effects that hit every permanent ("return all nonland permanents")
+ALL = -1
+
+
+@dataclass(frozen=True, slots=True)
+class Token:
+    name: str
+    count: int
+    # None where the spell does not fix them (X/X creatures, noncreature tokens)
+    power: Optional[int] = None
+    toughness: Optional[int] = None
+    keywords: Tuple[str, ...] = ()
+    creature: bool = True
+
+
+@dataclass(frozen=True, slots=True)
+class SpellEffect:
+    tokens: Tuple[Token, ...] = ()
+    heal: int = 0
+    sacrifice: int = 0
+    discard: int = 0
+    bounce: int = 0
+    # Auras attached to a random player
+    auras: Tuple[str, ...] = ()
+
+    @property
+    def token_count(self) -> int:
+        return sum(token.count for token in self.tokens)
+
+    def times(self, count: int) -> "SpellEffect":
+        """The combined effect of casting this spell ``count`` times."""
+        return SpellEffect(
+            tokens=tuple(replace(token, count=token.count * count) for token in self.tokens),
+            heal=self.heal * count,
+            sacrifice=self.sacrifice * count,
+            discard=self.discard * count,
+            bounce=ALL if self.bounce == ALL else self.bounce * count,
+            auras=self.auras * count,
+        )
+
+
+NO_EFFECT = SpellEffect()
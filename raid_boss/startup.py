@@ -0,0 +1,67 @@
+"""Startup timing for ``main.py --startup-profile``.
+
+Each phase of a launch (the big imports, building the interface, the first frame) is
+timed from the moment ``main.py`` started running, together with how many modules it
+loaded, so a slow time-to-first-prompt can be pinned on a phase.
+"""
+
+import sys
+import time
+from contextlib import contextmanager
+from typing import List, Optional, Tuple
+
+PROFILE_FLAG = "--startup-profile"
+
+
+def pop_flag(argv: List[str], flag: str) -> bool:
+    """Remove ``flag`` from ``argv`` before Kivy parses it, returning whether it was there."""
+    if flag not in argv:
+        return False
+    while flag in argv:
+        argv.remove(flag)
+    return True
+
+
+def pop_option(argv: List[str], option: str) -> Optional[str]:
+    """Remove ``option VALUE`` (or ``option=VALUE``) from ``argv``, returning the value or None."""
+    value = None
+    for index, argument in enumerate(argv):
+        if argument == option and index + 1 < len(argv):
+            value = argv[index + 1]
+            del argv[index : index + 2]
+            break
+        if argument.startswith(option + "="):
+            value = argument[len(option) + 1 :]
+            del argv[index]
+            break
+    return value
+
+
+class StartupProfile:
+    def __init__(self, started: Optional[float] = None, enabled: bool = False):
+        self.started = time.perf_counter() if started is None else started
+        self.enabled = enabled
+        # (name, offset from start, duration, modules loaded)
+        self.phases: List[Tuple[str, float, float, int]] = []
+
+    @contextmanager
+    def phase(self, name: str):
+        modules = len(sys.modules)
+        begin = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, begin - self.started, time.perf_counter() - begin, len(sys.modules) - modules))
+
+    def mark(self, name: str) -> None:
+        """Record a point in time, such as the first prompt being drawn."""
+        self.phases.append((name, time.perf_counter() - self.started, 0.0, 0))
+
+    def report(self) -> str:
+        lines = ["Startup profile (ms from launch):"]
+        for name, offset, duration, modules in self.phases:
+            if duration:
+                lines.append(f"  {name:<24} {offset * 1000:8.1f} +{duration * 1000:7.1f}  {modules:4d} modules")
+            else:
+                lines.append(f"  {name:<24} {offset * 1000:8.1f}")
+        return "\n".join(lines)
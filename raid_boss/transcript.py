@@ -0,0 +1,232 @@
+"""Game transcripts that keep a bounded number of entries in memory.
+
+The newest ``capacity`` entries live in a ring buffer. Older entries are spilled, in
+order, to an append-only archive of zlib-compressed pages, and are paged back in when
+something (usually scrolling up) asks for them.
+"""
+
+import os
+import struct
+import zlib
+from array import array
+from bisect import bisect_right
+from collections import OrderedDict, deque
+from typing import Callable, Deque, Iterator, List, Optional, Union
+
+from raid_boss.game_text import GameText, TextType
+
+DEFAULT_CAPACITY = 1000
+
+
+def make_entry(content: str, text_type: TextType, timestamp: float, priority: int = 0) -> GameText:
+    """A transcript entry.
+
+    Catalog messages are already one shared string each, and the rest (damage, names)
+    rarely repeats, so content is not interned: interned strings are never freed.
+    """
+    return GameText(content=content, text_type=text_type, timestamp=timestamp, priority=priority)
+
+
+class TranscriptArchive:
+    """Append-only file of compressed transcript pages.
+
+    Each page is a ``<II`` header (compressed size, entry count) followed by the zlib
+    compressed entries. Entries are buffered until a full page is ready. Only the page
+    index and a few decoded pages are held in memory.
+    """
+
+    PAGE_SIZE = 256
+    CACHED_PAGES = 4
+    _PAGE_HEADER = struct.Struct("<II")
+    _ENTRY = struct.Struct("<dhBI")  # timestamp, priority, text type, content length
+
+    def __init__(self, path: Optional[str] = None, page_size: int = PAGE_SIZE):
+        self.path = path
+        self.page_size = page_size
+        if path:
+            self._file = open(path, "a+b")
+        else:
+            # Imported here since most games never fill the ring buffer
+            import tempfile
+
+            self._file = tempfile.TemporaryFile()
+        self._page_offsets = array("q")
+        self._page_starts = array("q")
+        self._archived = 0
+        self._pending: List[GameText] = []
+        self._cache: "OrderedDict[int, List[GameText]]" = OrderedDict()
+        if path:
+            self._scan()
+
+    def __len__(self) -> int:
+        return self._archived + len(self._pending)
+
+    def _scan(self) -> None:
+        """Rebuild the page index of an existing archive, ignoring a torn last page."""
+        size = os.fstat(self._file.fileno()).st_size
+        offset = 0
+        self._file.seek(0)
+        while offset + self._PAGE_HEADER.size <= size:
+            length, count = self._PAGE_HEADER.unpack(self._file.read(self._PAGE_HEADER.size))
+            if offset + self._PAGE_HEADER.size + length > size:
+                break
+            self._page_offsets.append(offset)
+            self._page_starts.append(self._archived)
+            self._archived += count
+            offset += self._PAGE_HEADER.size + length
+            self._file.seek(offset)
+        if offset != size:
+            self._file.truncate(offset)
+
+    def append(self, entry: GameText) -> None:
+        self._pending.append(entry)
+        if len(self._pending) >= self.page_size:
+            self._write_page()
+
+    def _write_page(self) -> None:
+        payload = bytearray()
+        for entry in self._pending:
+            content = entry.content.encode("utf-8")
+            payload += self._ENTRY.pack(entry.timestamp, entry.priority, entry.text_type.value, len(content))
+            payload += content
+        compressed = zlib.compress(bytes(payload))
+        self._file.seek(0, os.SEEK_END)
+        self._page_offsets.append(self._file.tell())
+        self._page_starts.append(self._archived)
+        self._file.write(self._PAGE_HEADER.pack(len(compressed), len(self._pending)))
+        self._file.write(compressed)
+        self._archived += len(self._pending)
+        self._pending = []
+
+    def _read_page(self, page: int) -> List[GameText]:
+        entries = self._cache.get(page)
+        if entries is not None:
+            self._cache.move_to_end(page)
+            return entries
+        self._file.flush()
+        self._file.seek(self._page_offsets[page])
+        length, count = self._PAGE_HEADER.unpack(self._file.read(self._PAGE_HEADER.size))
+        payload = zlib.decompress(self._file.read(length))
+        entries = []
+        position = 0
+        for _ in range(count):
+            timestamp, priority, text_type, content_length = self._ENTRY.unpack_from(payload, position)
+            position += self._ENTRY.size
+            content = payload[position : position + content_length].decode("utf-8")
+            position += content_length
+            entries.append(make_entry(content, TextType(text_type), timestamp, priority))
+        self._cache[page] = entries
+        if len(self._cache) > self.CACHED_PAGES:
+            self._cache.popitem(last=False)
+        return entries
+
+    def __getitem__(self, index: int) -> GameText:
+        if not 0 <= index < len(self):
+            raise IndexError(f"Entry {index} is not in the archive")
+        if index >= self._archived:
+            return self._pending[index - self._archived]
+        page = bisect_right(self._page_starts, index) - 1
+        return self._read_page(page)[index - self._page_starts[page]]
+
+    def flush(self) -> None:
+        """Write out a partial page so everything archived so far is on disk."""
+        if self._pending:
+            self._write_page()
+        self._file.flush()
+
+    def clear(self) -> None:
+        self._file.truncate(0)
+        self._page_offsets = array("q")
+        self._page_starts = array("q")
+        self._archived = 0
+        self._pending = []
+        self._cache.clear()
+
+    def close(self) -> None:
+        self.flush()
+        self._file.close()
+
+
+class Transcript:
+    """Every entry of a game, with only the newest ``capacity`` of them kept in memory.
+
+    Entries are addressed by their position in the whole game. Appending is O(1): once
+    the ring buffer is full, its oldest entry moves to the archive, which is created on
+    first use (a temporary file unless ``archive_factory`` says otherwise).
+    """
+
+    def __init__(
+        self,
+        capacity: int = DEFAULT_CAPACITY,
+        archive_factory: Callable[[], TranscriptArchive] = TranscriptArchive,
+    ):
+        if capacity < 1:
+            raise ValueError("Transcript capacity must be at least 1")
+        self._capacity = capacity
+        self._archive_factory = archive_factory
+        self.archive: Optional[TranscriptArchive] = None
+        self.recent: Deque[GameText] = deque()
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @capacity.setter
+    def capacity(self, capacity: int) -> None:
+        if capacity < 1:
+            raise ValueError("Transcript capacity must be at least 1")
+        self._capacity = capacity
+        while len(self.recent) > capacity:
+            self._spill()
+
+    @property
+    def first_in_memory(self) -> int:
+        """Position of the oldest entry still in the ring buffer."""
+        return len(self.archive) if self.archive is not None else 0
+
+    def __len__(self) -> int:
+        return self.first_in_memory + len(self.recent)
+
+    def _spill(self) -> GameText:
+        if self.archive is None:
+            self.archive = self._archive_factory()
+        entry = self.recent.popleft()
+        self.archive.append(entry)
+        return entry
+
+    def append(self, entry: GameText) -> Optional[GameText]:
+        """Add an entry; returns the entry that was moved to the archive, if any."""
+        self.recent.append(entry)
+        if len(self.recent) > self._capacity:
+            return self._spill()
+        return None
+
+    def insert(self, position: int, entry: GameText) -> Optional[GameText]:
+        """Insert an entry at a position within the ring buffer."""
+        self.recent.insert(max(position - self.first_in_memory, 0), entry)
+        if len(self.recent) > self._capacity:
+            return self._spill()
+        return None
+
+    def __getitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f"Transcript entry {index} does not exist")
+        first = self.first_in_memory
+        if index >= first:
+            return self.recent[index - first]
+        return self.archive[index]
+
+    def __iter__(self) -> Iterator[GameText]:
+        if self.archive is not None:
+            for index in range(len(self.archive)):
+                yield self.archive[index]
+        yield from self.recent
+
+    def clear(self) -> None:
+        self.recent.clear()
+        if self.archive is not None:
+            self.archive.clear()
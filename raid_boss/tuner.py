@@ -0,0 +1,340 @@
+"""Difficulty tuner: searches boss health, heal and poison settings with the simulator.
+
+For every boss and player count, each candidate setting is simulated and scored by how
+far its win rate and mean turns-to-kill land from the targets. Trials run in parallel
+worker processes. Every trial has its own random stream, seeded from the base seed and
+the trial itself, so results do not depend on how trials are spread over workers.
+
+Results are cached on disk. The key covers a hash of the boss definition (the source of
+its class and base classes, or the workbook definition for data bosses) and the trial
+settings. After one boss's spells change, only that boss is simulated again.
+"""
+
+import argparse
+import hashlib
+import inspect
+import itertools
+import marshal
+import math
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Type
+
+import numpy as np
+
+# Add the parent directory to the sys.path to handle standalone execution
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from raid_boss.boss import Boss
+from raid_boss.boss_data import DATA_DIR
+from raid_boss.simulator import BOSSES, poisson_damage, simulate
+from raid_boss.spells import SpellEffect
+
+DEFAULT_CACHE_PATH = os.path.join(DATA_DIR, "tuner.cache")
+DEFAULT_GAMES = 20_000
+# The simulator does not model players being defeated, so a boss still standing after
+# this many turns counts as a loss
+DEFAULT_MAX_TURNS = 15
+
+_CACHE_MAGIC = b"RBTC"
+_CACHE_VERSION = 1
+
+
+@dataclass(frozen=True)
+class Settings:
+    """One candidate difficulty: the values a boss would be given."""
+
+    base_health: int
+    heal_scale: float = 1.0
+    poison_per_player: int = Boss.POISON_PER_PLAYER
+
+
+@dataclass(frozen=True)
+class Target:
+    win_rate: float = 0.75
+    turns: float = 10.0
+    # How far off counts as one unit of miss for each goal
+    win_rate_tolerance: float = 0.05
+    turns_tolerance: float = 1.0
+
+
+@dataclass(frozen=True)
+class PlayerModel:
+    """Mean damage (and poison) each player deals per turn, growing linearly."""
+
+    damage: float = 30.0
+    growth: float = 2.0
+    poison: float = 0.0
+    poison_growth: float = 0.0
+
+
+@dataclass(frozen=True)
+class Trial:
+    boss: str
+    player_count: int
+    settings: Settings
+    games: int
+    wins: int
+    mean_turns: float
+    poison_wins: int
+
+    @property
+    def win_rate(self) -> float:
+        return self.wins / self.games if self.games else 0.0
+
+    def score(self, target: Target) -> float:
+        """Squared distance from the target in tolerance units; lower is better."""
+        if math.isnan(self.mean_turns):
+            return math.inf
+        return ((self.win_rate - target.win_rate) / target.win_rate_tolerance) ** 2 + (
+            (self.mean_turns - target.turns) / target.turns_tolerance
+        ) ** 2
+
+
+@lru_cache(maxsize=None)
+def boss_fingerprint(boss_cls: Type[Boss]) -> str:
+    """Hash of everything that defines how a boss plays."""
+    digest = hashlib.sha256()
+    for cls in boss_cls.__mro__:
+        if cls is object:
+            break
+        try:
+            source = inspect.getsource(cls)
+        except (OSError, TypeError):
+            # Classes built at runtime, like the workbook bosses, have no source of their own
+            source = cls.__qualname__
+        digest.update(source.encode("utf-8"))
+        definition = cls.__dict__.get("DEFINITION")
+        if definition is not None:
+            digest.update(repr(definition).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def candidate_settings(
+    boss_cls: Type[Boss],
+    base_healths: Iterable[int],
+    heal_scales: Iterable[float],
+    poison_limits: Iterable[int],
+    player_model: PlayerModel,
+) -> List[Settings]:
+    """Every combination worth trying; heal and poison only vary where they can matter."""
+    if not any(boss_cls.heal_table()):
+        heal_scales = [1.0]
+    if not player_model.poison and not player_model.poison_growth:
+        poison_limits = [boss_cls.POISON_PER_PLAYER]
+    return [Settings(*combination) for combination in itertools.product(base_healths, heal_scales, poison_limits)]
+
+
+class TrialCache:
+    """Trial results on disk, keyed by a hash of the boss definition and the trial settings."""
+
+    def __init__(self, path: Optional[str] = DEFAULT_CACHE_PATH):
+        self.path = path
+        self.entries: Dict[str, tuple] = {}
+        self._dirty = False
+        if path:
+            try:
+                with open(path, "rb") as cache_file:
+                    if cache_file.read(len(_CACHE_MAGIC)) == _CACHE_MAGIC:
+                        version, entries = marshal.load(cache_file)
+                        if version == (_CACHE_VERSION, marshal.version):
+                            self.entries = entries
+            except (OSError, EOFError, ValueError, TypeError):
+                pass
+
+    def get(self, key: str) -> Optional[tuple]:
+        return self.entries.get(key)
+
+    def put(self, key: str, result: tuple) -> None:
+        self.entries[key] = result
+        self._dirty = True
+
+    def save(self) -> None:
+        if not self.path or not self._dirty:
+            return
+        try:
+            with open(self.path, "wb") as cache_file:
+                cache_file.write(_CACHE_MAGIC)
+                marshal.dump(((_CACHE_VERSION, marshal.version), self.entries), cache_file)
+            self._dirty = False
+        except OSError:
+            # Tuning still works without a writable cache, it just starts over next time
+            pass
+
+
+def _trial_key(
+    fingerprint: str,
+    player_count: int,
+    settings: Settings,
+    games: int,
+    player_model: PlayerModel,
+    max_turns: int,
+    seed: int,
+) -> str:
+    # The seed is part of the key, as it picks the trial's random stream
+    description = repr((fingerprint, player_count, settings, games, player_model, max_turns, seed))
+    return hashlib.sha256(description.encode("utf-8")).hexdigest()
+
+
+def _run_trial(
+    heals: Tuple[int, ...],
+    boss_settings: Tuple[int, int],
+    player_count: int,
+    settings: Settings,
+    games: int,
+    player_model: PlayerModel,
+    max_turns: int,
+    seed: np.random.SeedSequence,
+) -> tuple:
+    """Simulate one trial in a worker process; returns (games, wins, mean turns, poison wins)."""
+
+    # Workers only get plain data: heal-only effects stand in for the boss, whose class may
+    # not be importable (workbook bosses are built at runtime)
+    class TrialBoss(Boss):
+        BASE_HEALTH, POISON_PER_PLAYER = boss_settings
+
+        @classmethod
+        def spell_effects(cls, player_count):
+            return [SpellEffect(heal=heal) for heal in heals]
+
+    poisoned = player_model.poison or player_model.poison_growth
+    report = simulate(
+        TrialBoss,
+        player_count,
+        games,
+        poisson_damage(player_model.damage, player_model.growth),
+        max_turns=max_turns,
+        seed=seed,
+        base_health=settings.base_health,
+        heal_scale=settings.heal_scale,
+        poison_model=poisson_damage(player_model.poison, player_model.poison_growth) if poisoned else None,
+        poison_per_player=settings.poison_per_player,
+    )
+    return report.games, report.wins, report.mean_turns_to_kill, report.poison_wins
+
+
+@dataclass
+class TuningResult:
+    target: Target
+    trials: Dict[Tuple[str, int], List[Trial]]
+    computed: int = 0
+    cached: int = 0
+
+    def best(self, boss: str, player_count: int) -> Trial:
+        return min(self.trials[boss, player_count], key=lambda trial: trial.score(self.target))
+
+
+def tune(
+    bosses: Sequence[Type[Boss]] = BOSSES,
+    player_counts: Iterable[int] = range(2, 7),
+    target: Target = Target(),
+    player_model: PlayerModel = PlayerModel(),
+    base_healths: Iterable[int] = range(150, 651, 25),
+    heal_scales: Iterable[float] = (0.5, 0.75, 1.0, 1.25),
+    poison_limits: Iterable[int] = (30, 40, 50, 60, 70),
+    games: int = DEFAULT_GAMES,
+    max_turns: int = DEFAULT_MAX_TURNS,
+    seed: int = 0,
+    jobs: Optional[int] = None,
+    cache: Optional[TrialCache] = None,
+) -> TuningResult:
+    """Simulate every candidate setting for every boss and player count.
+
+    Trials already in ``cache`` are not run again. ``jobs`` is the number of worker
+    processes (default: one per CPU); ``jobs=1`` runs everything in this process.
+    """
+    cache = cache if cache is not None else TrialCache(None)
+    base_healths, heal_scales, poison_limits = tuple(base_healths), tuple(heal_scales), tuple(poison_limits)
+    result = TuningResult(target=target, trials={})
+    pending = []
+    for boss_cls in bosses:
+        fingerprint = boss_fingerprint(boss_cls)
+        for player_count in player_counts:
+            heals = tuple(boss_cls.heal_table(player_count))
+            boss_settings = (boss_cls.BASE_HEALTH, boss_cls.POISON_PER_PLAYER)
+            result.trials[boss_cls.__name__, player_count] = []
+            for settings in candidate_settings(boss_cls, base_healths, heal_scales, poison_limits, player_model):
+                key = _trial_key(fingerprint, player_count, settings, games, player_model, max_turns, seed)
+                cached = cache.get(key)
+                if cached is not None:
+                    result.trials[boss_cls.__name__, player_count].append(
+                        Trial(boss_cls.__name__, player_count, settings, *cached)
+                    )
+                    result.cached += 1
+                    continue
+                # The stream depends only on the seed and the trial, never on scheduling
+                stream = np.random.SeedSequence([seed, int(key[:16], 16)])
+                arguments = (heals, boss_settings, player_count, settings, games, player_model, max_turns, stream)
+                pending.append((boss_cls.__name__, player_count, settings, key, arguments))
+
+    if pending:
+        if jobs == 1:
+            outcomes = [_run_trial(*arguments) for *_, arguments in pending]
+        else:
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                futures = [executor.submit(_run_trial, *arguments) for *_, arguments in pending]
+                outcomes = [future.result() for future in futures]
+        for (boss, player_count, settings, key, _), outcome in zip(pending, outcomes):
+            cache.put(key, outcome)
+            result.trials[boss, player_count].append(Trial(boss, player_count, settings, *outcome))
+        result.computed = len(pending)
+    cache.save()
+    return result
+
+
+def format_trial(trial: Trial, target: Target) -> str:
+    settings = trial.settings
+    return (
+        f"{trial.boss:<22} players={trial.player_count:<3} "
+        f"health={settings.base_health}X heal scale={settings.heal_scale:<4} poison={settings.poison_per_player}X  "
+        f"win rate={trial.win_rate:6.1%} turns={trial.mean_turns:5.2f} "
+        f"poison wins={trial.poison_wins / trial.games:5.1%} score={trial.score(target):.2f}"
+    )
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Tune boss difficulty with the encounter simulator.")
+    parser.add_argument("--players", type=int, nargs="+", default=[2, 3, 4, 5, 6])
+    parser.add_argument("--win-rate", type=float, default=Target.win_rate, help="target player win rate")
+    parser.add_argument("--turns", type=float, default=Target.turns, help="target mean turns to kill the boss")
+    parser.add_argument("--damage", type=float, default=PlayerModel.damage, help="mean damage per player per turn")
+    parser.add_argument("--growth", type=float, default=PlayerModel.growth, help="extra damage per player each turn")
+    parser.add_argument("--poison", type=float, default=0.0, help="mean poison per player per turn")
+    parser.add_argument("--poison-growth", type=float, default=0.0, help="extra poison per player each turn")
+    parser.add_argument("--health", type=int, nargs="+", default=list(range(150, 651, 25)), help="BASE_HEALTH values")
+    parser.add_argument("--heal-scale", type=float, nargs="+", default=[0.5, 0.75, 1.0, 1.25])
+    parser.add_argument("--poison-limit", type=int, nargs="+", default=[30, 40, 50, 60, 70])
+    parser.add_argument("--games", type=int, default=DEFAULT_GAMES, help="games per trial")
+    parser.add_argument("--max-turns", type=int, default=DEFAULT_MAX_TURNS)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes (default: one per CPU)")
+    parser.add_argument("--cache", default=DEFAULT_CACHE_PATH, help="trial cache file ('' to disable)")
+    args = parser.parse_args(argv)
+
+    target = Target(win_rate=args.win_rate, turns=args.turns)
+    start = time.perf_counter()
+    result = tune(
+        player_counts=args.players,
+        target=target,
+        player_model=PlayerModel(args.damage, args.growth, args.poison, args.poison_growth),
+        base_healths=args.health,
+        heal_scales=args.heal_scale,
+        poison_limits=args.poison_limit,
+        games=args.games,
+        max_turns=args.max_turns,
+        seed=args.seed,
+        jobs=args.jobs,
+        cache=TrialCache(args.cache or None),
+    )
+    elapsed = time.perf_counter() - start
+    for boss, player_count in result.trials:
+        print(format_trial(result.best(boss, player_count), target))
+    print(f"\n{result.computed} trial(s) simulated, {result.cached} from the cache, in {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,22 +1,30 @@
 from kivy.uix.boxlayout import BoxLayout
-from kivy.uix.label import Label
 from kivy.uix.textinput import TextInput
 from kivy.uix.scrollview import ScrollView
-from kivy.properties import StringProperty
 from kivy.clock import Clock
 from kivy.core.window import Window
 from kivy.uix.widget import Widget
-from kivy.graphics import Color, Rectangle
+from kivy.graphics import Color, InstructionGroup, Rectangle
+from kivy.core.text import Label as CoreLabel
+from kivy.metrics import sp
 from kivy.resources import resource_find
-from typing import List, Optional
+from kivy.utils import get_color_from_hex
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Iterable, List, Optional, Tuple
 import os
 from dataclasses import dataclass
-from raid_boss.game_text import GameTextManager, GameText, TextType
+from time import time
+from raid_boss.game_text import GameTextManager, GameText, TextType, line_suffix
+from raid_boss.transcript import Transcript, make_entry
 
 # Get the path to the fonts directory in the root of the repo
 FONT_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "fonts")
 FONT_PATH = os.path.join(FONT_DIR, "Beleren2016-Bold.ttf")  # Replace with your font filename
 
+
 @dataclass
 class GameText:
     content: str
@@ -25,37 +33,64 @@ class GameText:
     priority: int = 0  # Higher priority text appears first
 
 
-class GameOutput(Label):
-    text = StringProperty("")
+TEXT_COLORS = {
+    TextType.ERROR: get_color_from_hex("ff4444"),
+    TextType.BOSS_ATTACK: get_color_from_hex("ffaa00"),
+    TextType.PROMPT: get_color_from_hex("44ff44"),
+}
+DEFAULT_TEXT_COLOR = get_color_from_hex("ffffff")
+
+
+class GameOutput(Widget):
+    """Scrollback transcript that only draws the lines inside the scroll view's viewport.
+
+    Each ``add_text`` call becomes one line entry. Lines are queued and laid out together
+    once per frame (or when a ``batch()`` block exits), and their heights are kept as
+    running offsets, so appending is constant time no matter how long the game has been
+    going. Textures are rendered lazily for the lines that scroll into view and kept in
+    a small LRU cache. Lines older than the last ``TRANSCRIPT_CAPACITY`` are archived to
+    disk and paged back in on scroll-up.
+    """
+
+    PADDING = 10
+    TEXTURE_CACHE_SIZE = 256
+    TRANSCRIPT_CAPACITY = 1000
+    # Timed when metrics are turned on; see raid_boss/metrics.py. add_text only queues the
+    # line, so flush is where the layout cost shows up
+    METERED = ("add_text", "flush")
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self._setup_label_properties()
+        self.size_hint_y = None
+        self.height = 2 * self.PADDING
+        self._wrap_width = None
         self._setup_font()
         self._setup_background()
         self._scroll_view = None
+        self._lines = Transcript(capacity=self.TRANSCRIPT_CAPACITY)
+        self._heights = array("i")
+        # _offsets[i] is the distance from the top padding to the top of line i
+        self._offsets = array("q", [0])
+        self._textures: "OrderedDict[int, object]" = OrderedDict()
+        self._visible = InstructionGroup()
+        self.canvas.add(self._visible)
+        self._pending: List[Tuple[str, TextType]] = []
+        self._batch_depth = 0
+        self._trigger_redraw = Clock.create_trigger(self._redraw)
+        self._trigger_flush = Clock.create_trigger(self.flush)
+        self._trigger_scroll = Clock.create_trigger(self._scroll_to_bottom)
         self.bind(pos=self._update_rect, size=self._update_rect)
 
-    def _setup_label_properties(self):
-        """Set up basic label properties."""
-        self.size_hint_y = None
-        self.text_size = (None, None)
-        self.halign = "left"
-        self.valign = "bottom"
-        self.bind(text=self._on_text_change)
-        self.color = (1, 1, 1, 1)
-        self.padding = [10, 10, 10, 10]
-        self.text_size = (self.width, None)
-        self.limit_render_to_text_bbox = False
-        self.markup = True
-
     def _setup_font(self):
         """Set up custom font if available."""
+        self.font_size = sp(15)
         if os.path.exists(FONT_PATH):
             self.font_name = FONT_PATH
         else:
             self.font_name = "RobotoMono"
             print(f"Warning: Custom font not found at {FONT_PATH}. Using system font.")
+        # Non-prompt entries are followed by a blank line, as in the original text log
+        self._blank_line_height = self._core_label(" ", None).render()[1]
 
     def _setup_background(self):
         """Set up dark background."""
@@ -63,50 +98,144 @@ class GameOutput(Label):
             Color(0.1, 0.1, 0.1, 1)
             self.rect = Rectangle(pos=self.pos, size=self.size)
 
-    def _format_text(self, content: str, text_type: TextType) -> str:
-        """Format text based on type with appropriate color."""
-        color_map = {
-            TextType.ERROR: "ff4444",
-            TextType.BOSS_ATTACK: "ffaa00",
-            TextType.PROMPT: "44ff44"
-        }
-        color = color_map.get(text_type, "ffffff")
-        return f"[color={color}]{content}[/color]"
-
-    def _update_text(self, new_text: str) -> None:
-        """Update the text property with new content."""
-        self.text = new_text
-        Clock.schedule_once(self._scroll_to_bottom, 0.1)
+    @property
+    def text(self) -> str:
+        """The plain transcript text, queued lines included; joins every line, so only use it for copying and tests.
+
+        Reading it lays nothing out; call ``flush()`` for that.
+        """
+        lines = [(line.content, line.text_type) for line in self._lines] + self._pending
+        return "".join(content + line_suffix(text_type) for content, text_type in lines)
+
+    @text.setter
+    def text(self, value: str) -> None:
+        self.clear()
+        if value:
+            self.add_text(value, TextType.GAME_STATE)
+
+    def _core_label(self, content: str, text_type: Optional[TextType]) -> CoreLabel:
+        label = CoreLabel(
+            text=content,
+            font_name=self.font_name,
+            font_size=self.font_size,
+            color=TEXT_COLORS.get(text_type, DEFAULT_TEXT_COLOR),
+            text_size=(self._wrap_width, None),
+        )
+        label.resolve_font_name()
+        return label
+
+    def _measure(self, index: int) -> int:
+        line = self._lines[index]
+        height = self._core_label(line.content, line.text_type).render()[1]
+        return height if line.text_type == TextType.PROMPT else height + self._blank_line_height
 
     def add_text(self, content: str, text_type: TextType, priority: int = 0) -> None:
-        """Add new text to the output."""
-        formatted_text = self._format_text(content, text_type)
-        suffix = "\n" if text_type == TextType.PROMPT else "\n\n"
-        self.text = self.text + formatted_text + suffix
-        Clock.schedule_once(self._scroll_to_bottom, 0.1)
+        """Queue new text; it is laid out with everything else added in the same frame."""
+        self._pending.append((content, text_type))
+        if not self._batch_depth:
+            self._trigger_flush()
+
+    def add_texts(self, texts: Iterable[Tuple[str, TextType]]) -> None:
+        """Queue several (content, text type) lines at once."""
+        self._pending.extend(texts)
+        if not self._batch_depth:
+            self._trigger_flush()
+
+    @contextmanager
+    def batch(self):
+        """Hold every line added inside the block and lay them out together when it exits."""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self.flush()
+
+    def flush(self, *args) -> None:
+        """Lay out the queued lines in one pass and scroll to the bottom once."""
+        if not self._pending:
+            return
+        start = len(self._lines)
+        now = time()
+        for content, text_type in self._pending:
+            self._lines.append(make_entry(content, text_type, now))
+        self._pending.clear()
+        if self._wrap_width is not None:
+            for index in range(start, len(self._lines)):
+                self._heights.append(self._measure(index))
+                self._offsets.append(self._offsets[-1] + self._heights[-1])
+            self.height = self._offsets[-1] + 2 * self.PADDING
+        self._trigger_redraw()
+        self._trigger_scroll()
 
     def clear(self) -> None:
         """Clear all text from the output."""
-        self.text = ""
-        Clock.schedule_once(self._scroll_to_bottom, 0.1)
+        self._pending.clear()
+        self._lines.clear()
+        self._heights = array("i")
+        self._offsets = array("q", [0])
+        self._textures.clear()
+        self.height = 2 * self.PADDING
+        self._trigger_redraw()
+        self._trigger_scroll()
+
+    def _relayout(self) -> None:
+        """Re-measure every line for a new wrap width. Only happens on resize."""
+        self._textures.clear()
+        self._heights = array("i", [self._measure(index) for index in range(len(self._lines))])
+        self._offsets = array("q", [0])
+        for height in self._heights:
+            self._offsets.append(self._offsets[-1] + height)
+        self.height = self._offsets[-1] + 2 * self.PADDING
+
+    def _texture(self, index: int):
+        texture = self._textures.get(index)
+        if texture is None:
+            line = self._lines[index]
+            label = self._core_label(line.content, line.text_type)
+            label.refresh()
+            texture = self._textures[index] = label.texture
+            if len(self._textures) > self.TEXTURE_CACHE_SIZE:
+                self._textures.popitem(last=False)
+        else:
+            self._textures.move_to_end(index)
+        return texture
+
+    def _visible_range(self) -> Tuple[int, int]:
+        """Indices of the first and one-past-last line inside the viewport."""
+        top, bottom = 0, self.height
+        scroll_view = self._scroll_view
+        if scroll_view is not None and self.height > scroll_view.height:
+            # scroll_y is 1 at the top of the content and 0 at the bottom
+            top = (1 - scroll_view.scroll_y) * (self.height - scroll_view.height)
+            bottom = top + scroll_view.height
+        first = max(bisect_right(self._offsets, top - self.PADDING) - 1, 0)
+        last = min(bisect_left(self._offsets, bottom - self.PADDING), len(self._heights))
+        return first, last
+
+    def _redraw(self, *args) -> None:
+        """Draw the cached textures of the lines in view."""
+        self._visible.clear()
+        first, last = self._visible_range()
+        top = self.top - self.PADDING
+        for index in range(first, last):
+            texture = self._texture(index)
+            y = top - self._offsets[index]
+            self._visible.add(Color(1, 1, 1, 1))
+            self._visible.add(
+                Rectangle(texture=texture, size=texture.size, pos=(self.x + self.PADDING, y - texture.height))
+            )
 
     def _update_rect(self, instance, value):
-        """Update the background rectangle and text size when position or size changes."""
+        """Update the background rectangle and re-wrap the lines when the width changes."""
         self.rect.pos = instance.pos
         self.rect.size = instance.size
-        self.text_size = (self.width, None)
-        Clock.schedule_once(self._update_height, 0.1)
-
-    def _update_height(self, dt):
-        """Update the height based on content."""
-        if self.texture_size[1] > 0:
-            self.height = self.texture_size[1] + 20
-            if self._scroll_view:
-                self._scroll_view.scroll_y = 0
-
-    def _on_text_change(self, instance, value):
-        """Handle text changes and update layout."""
-        Clock.schedule_once(self._update_height, 0.1)
+        wrap_width = max(self.width - 2 * self.PADDING, 1)
+        if wrap_width != self._wrap_width:
+            self._wrap_width = wrap_width
+            self._relayout()
+        self._trigger_redraw()
 
     def _scroll_to_bottom(self, dt):
         """Scroll to the bottom of the text."""
@@ -114,11 +243,13 @@ class GameOutput(Label):
             self._scroll_view.do_scroll_y = False
             self._scroll_view.do_scroll_y = True
             self._scroll_view.scroll_y = 0
-            Clock.schedule_once(lambda dt: setattr(self._scroll_view, "scroll_y", 0), 0.1)
 
     def set_scroll_view(self, scroll_view):
         """Set the scroll view reference."""
+        if self._scroll_view is not None:
+            self._scroll_view.unbind(scroll_y=self._trigger_redraw, size=self._trigger_redraw)
         self._scroll_view = scroll_view
+        scroll_view.bind(scroll_y=self._trigger_redraw, size=self._trigger_redraw)
 
 
 class GameInput(TextInput):
@@ -211,6 +342,6 @@ class GameInterface(BoxLayout):
         # Update scroll container size
         self.scroll_container.size = (width, height - self.input_box.height)
         # Ensure scroll position is updated
-        Clock.schedule_once(self.output._scroll_to_bottom, 0.1)
+        self.output._trigger_scroll()
         # Ensure input box maintains focus
         Clock.schedule_once(lambda dt: setattr(self.input_box, "focus", True), 0.1)
@@ -0,0 +1,31 @@
+"""Shared helpers for driving whole games in tests."""
+
+from typing import Iterable, List, Optional
+
+from raid_boss.game_logic import GameLogic
+from raid_boss.game_state import GameState
+from raid_boss.journal import GameJournal
+from raid_boss.sinks import MemorySink, OutputSink
+
+# Three players, the first boss, 20 damage and no defeats for 15 turns
+GAME = ["3", "Test Boss", "1"] + ["20", "0"] * 15
+
+
+def feed(
+    game_state: GameState,
+    inputs: Iterable[str],
+    output: Optional[OutputSink] = None,
+    journal: Optional[GameJournal] = None,
+) -> GameLogic:
+    """Give each input to the game through ``GameLogic.handle_input``, as the front ends do."""
+    logic = GameLogic(game_state, MemorySink() if output is None else output, journal)
+    for user_input in inputs:
+        logic.handle_input(user_input)
+    return logic
+
+
+def play(game_state: GameState, inputs: Iterable[str], journal: Optional[GameJournal] = None) -> List[str]:
+    """The lines the game showed in answer to ``inputs``."""
+    output = MemorySink()
+    feed(game_state, inputs, output, journal)
+    return [content for content, _ in output.lines]
@@ -0,0 +1,89 @@
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+
+from raid_boss.batch import main, parse_scripts, play_script, run_batch
+from raid_boss.game_state import GameState
+from tests.helpers import feed
+
+# GameLogic asks for the boss; the run.py loop always fights the Lunar Channeler
+WIN = ["2", "Test Boss", "1", "999", "0"]
+LOSS = ["1", "Test Boss", "1", "0", "1"]
+RUN_WIN = ["2", "Test Boss", "999"]
+
+
+class TestParseScripts(unittest.TestCase):
+
+    def test_games_comments_and_blank_lines(self):
+        """Test that scripts split on --- and skip comments and blank lines."""
+        text = "# tournament\n1\nBob\n\n1\n---\n---\n2\n  Zed  \n"
+        self.assertEqual(parse_scripts(text), [["1", "Bob", "1"], ["2", "Zed"]])
+
+
+class TestBatch(unittest.TestCase):
+
+    def test_logic_engine_plays_like_game_logic(self):
+        """Test that a scripted game gives the same result as playing it by hand."""
+        result = play_script(WIN + ["one answer too many"], seed=11)
+        self.assertTrue(result.finished and result.won)
+        self.assertIsNone(result.error)
+
+        game_state = GameState(seed=11)
+        feed(game_state, WIN)
+        self.assertEqual(result.boss_health, game_state.boss.health)
+        self.assertEqual(result.answers, len(WIN))  # answers after the game ends are left over
+
+    def test_loss(self):
+        """Test that a game where everyone falls is finished but not won."""
+        result = play_script(LOSS, seed=2)
+        self.assertTrue(result.finished)
+        self.assertFalse(result.won)
+
+    def test_run_engine(self):
+        """Test that the run.py loop plays scripts with its output captured."""
+        with redirect_stdout(StringIO()) as stdout:
+            result = play_script(RUN_WIN, seed=5, engine="run")
+        self.assertEqual(stdout.getvalue(), "")
+        self.assertTrue(result.won)
+        self.assertIn("Congratulations!", result.transcript)
+        self.assertIn("Enter damage dealt!", result.transcript)
+
+    def test_script_that_runs_out(self):
+        """Test that a script ending mid-game is reported, for both engines."""
+        for engine in ("logic", "run"):
+            result = play_script(["2", "Test Boss", "1", "5"], seed=1, engine=engine)
+            self.assertFalse(result.finished)
+            self.assertIn("ran out of answers", result.error)
+
+    def test_seeds_and_jobs(self):
+        """Test that game N uses seed + N and that worker processes give the same results."""
+        scripts = [WIN, LOSS, WIN]
+        inline = run_batch(scripts, seed=40)
+        self.assertEqual([result.seed for result in inline], [40, 41, 42])
+        pooled = run_batch(scripts, seed=40, jobs=2)
+        self.assertEqual([result.transcript for result in pooled], [result.transcript for result in inline])
+
+    def test_main_writes_transcripts_and_stats(self):
+        """Test the command line: summary, transcripts and JSON stats."""
+        with tempfile.TemporaryDirectory() as directory:
+            script_path = os.path.join(directory, "games.txt")
+            with open(script_path, "w") as script_file:
+                script_file.write("\n".join(WIN + ["---"] + LOSS))
+            stats_path = os.path.join(directory, "stats.json")
+            transcripts = os.path.join(directory, "transcripts")
+            with redirect_stdout(StringIO()) as stdout:
+                status = main([script_path, "--seed", "7", "--stats", stats_path, "--transcripts", transcripts])
+            self.assertEqual(status, 0)
+            self.assertIn("Wins:         1 (50.0% of finished games)", stdout.getvalue())
+            self.assertEqual(sorted(os.listdir(transcripts)), ["game-0001.txt", "game-0002.txt"])
+            with open(stats_path) as stats_file:
+                stats = json.load(stats_file)
+            self.assertEqual(stats["summary"]["games"], 2)
+            self.assertEqual([game["seed"] for game in stats["games"]], [7, 8])
+
+
+if __name__ == "__main__":
+    unittest.main()
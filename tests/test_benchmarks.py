@@ -0,0 +1,41 @@
+import os
+import tempfile
+import unittest
+from benchmarks import harness
+
+
+class TestBenchmarkHarness(unittest.TestCase):
+
+    def test_measure(self):
+        """Test that a benchmark is timed per call with a fresh callable per repeat."""
+        calls = []
+        bench = harness.Benchmark("noop", lambda: (lambda: calls.append(1)), number=10)
+        result = harness.measure(bench, repeat=3)
+        self.assertEqual(len(calls), 30)
+        self.assertEqual((result.number, result.repeat), (10, 3))
+        self.assertLessEqual(result.best, result.median)
+
+    def test_save_and_load(self):
+        """Test that results round-trip through the JSON baseline."""
+        results = {"a": harness.Result(best=1e-6, median=2e-6, number=100, repeat=5)}
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "baseline.json")
+            harness.save(path, results)
+            self.assertEqual(harness.load(path), results)
+
+    def test_compare(self):
+        """Test that only slowdowns beyond the threshold are flagged."""
+        baseline = {name: harness.Result(1.0, 1.0, 1, 1) for name in ("fast", "same", "slow", "removed")}
+        current = {
+            "fast": harness.Result(0.5, 0.5, 1, 1),
+            "same": harness.Result(1.1, 1.1, 1, 1),
+            "slow": harness.Result(1.5, 1.5, 1, 1),
+            "new": harness.Result(9.0, 9.0, 1, 1),
+        }
+        regressions = harness.compare(baseline, current, threshold=0.2)
+        self.assertEqual([regression.name for regression in regressions], ["slow"])
+        self.assertAlmostEqual(regressions[0].ratio, 1.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
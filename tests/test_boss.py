@@ -128,6 +128,47 @@ class TestBoss(unittest.TestCase):
         zombie_hints = boss.get_attack_hint([0])
         self.assertIn("ground begins to open", zombie_hints.lower())
 
+    def test_render_cache(self):
+        boss = HorrorfromtheDepths(boss_name="Horror", player_count=4)
+        first = boss.render(2)
+        self.assertEqual(first, boss.four())
+        self.assertIs(boss.render(2), first)
+
+        # Changing the player count or health invalidates the cache
+        boss.player_count = 2
+        self.assertIn("Return 2 nonland", boss.render(2))
+        cached = boss.render(2)
+        boss.health -= 10
+        self.assertIsNot(boss.render(2), cached)
+        boss.boss_name = "Kraken"
+        self.assertEqual(boss.render(2), boss.four())
+
+    def test_render_applies_heals_every_roll(self):
+        boss = TheManaGod(boss_name="Mana God", player_count=4)
+        boss.render(8)
+        boss.render(8)
+        self.assertEqual(boss.health, 1032)
+        heal = boss.render(10)
+        self.assertIn("health is now 1112", heal)
+
+    def test_render_turn(self):
+        boss = TheManaGod(boss_name="Mana God", player_count=2)
+        turn = boss.render_turn([2, 10, 2])
+        self.assertEqual(turn.count("goblin zombie"), 2)
+        self.assertEqual(turn.count("\n\n\n"), 2)
+        self.assertEqual(boss.health, 540)
+        self.assertEqual(boss.render_turn([]), "")
+
+    def test_render_turn_aggregated(self):
+        boss = TheManaGod(boss_name="Mana God", player_count=2)
+        turn = boss.render_turn(bytes([2, 10, 2, 2, 10, 5]), aggregate=True)
+        self.assertEqual(turn.count("BOSS SPELL"), 3)
+        self.assertTrue(turn.startswith("BOSS SPELL x3> Create 24 1/1 red goblin"))
+        self.assertIn("BOSS SPELL x2> Mana God heals 80", turn)
+        self.assertIn("health is now 580", turn)
+        self.assertEqual(boss.health, 580)
+        self.assertNotIn(" x1>", turn)
+
 
 if __name__ == "__main__":
     unittest.main()
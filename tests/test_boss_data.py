@@ -0,0 +1,99 @@
+import unittest
+import os
+import shutil
+import tempfile
+from unittest.mock import patch
+from raid_boss import boss_data
+from raid_boss.boss import TheManaGod
+from raid_boss.boss_data import compile_template, load_bosses, load_definitions, read_rows, render_template
+
+
+class TestBossData(unittest.TestCase):
+
+    def setUp(self):
+        """Copy the workbook so the cache is written to a scratch directory."""
+        self.tmp = tempfile.mkdtemp()
+        self.workbook = os.path.join(self.tmp, "BossMaster.xlsx")
+        shutil.copy(boss_data.WORKBOOK_PATH, self.workbook)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_read_rows(self):
+        """Test that the sheet is parsed into rows keyed by header."""
+        rows = list(read_rows(self.workbook))
+        self.assertEqual(len(rows), 22)
+        self.assertEqual(rows[0]["BossName"], "Mana God")
+        self.assertEqual(rows[0]["RollResult"], "2")
+        self.assertIn("Arcane Intuition", rows[0])
+
+    def test_definitions(self):
+        """Test that every boss gets eleven spells with hints."""
+        definitions = load_definitions(self.workbook)
+        self.assertEqual(set(definitions), {"Mana God", "Horror from the Depths"})
+        for definition in definitions.values():
+            self.assertEqual(len(definition.spells), 11)
+            self.assertTrue(all(spell.hint for spell in definition.spells))
+
+    def test_cache_skips_workbook(self):
+        """Test that a second load comes from the cache without parsing the workbook."""
+        first = load_definitions(self.workbook)
+        self.assertTrue(os.path.exists(os.path.join(self.tmp, "BossMaster.cache")))
+        with patch.object(boss_data, "read_rows", side_effect=AssertionError("workbook parsed")):
+            self.assertEqual(load_definitions(self.workbook), first)
+
+    def test_cache_invalidated_by_mtime(self):
+        """Test that touching the workbook recompiles it."""
+        load_definitions(self.workbook)
+        stat = os.stat(self.workbook)
+        os.utime(self.workbook, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        with patch.object(boss_data, "read_rows", wraps=read_rows) as parse:
+            load_definitions(self.workbook)
+        parse.assert_called_once()
+
+    def test_data_boss_matches_hand_written_heals(self):
+        """Test that the workbook Mana God heals like TheManaGod."""
+        mana_god = load_bosses(self.workbook)["Mana God"]
+        self.assertEqual(mana_god.heal_table(4), TheManaGod.heal_table(4))
+
+    def test_data_boss_spells(self):
+        """Test casting spells from the workbook."""
+        boss = load_bosses(self.workbook)["Mana God"](boss_name="Zed", player_count=3)
+        self.assertEqual(boss.health, 750)
+        self.assertIn("Create 12 1/1 red goblin", boss.boss_funcs[2]())
+        heal = boss.boss_funcs[10]()
+        self.assertEqual(boss.health, 810)
+        self.assertIn("Zed heals 60", heal)
+        self.assertIn("health is now 810", heal)
+        self.assertTrue(heal.startswith("BOSS SPELL> "))
+
+    def test_data_boss_aggregated_spells(self):
+        """Test that repeated workbook spells sum their per-player quantities."""
+        boss = load_bosses(self.workbook)["Mana God"](boss_name="Zed", player_count=3)
+        turn = boss.render_turn(bytes([2, 10, 2, 10]), aggregate=True)
+        self.assertIn("BOSS SPELL x2> Create 24 1/1 red goblin", turn)
+        self.assertIn("Zed heals 120", turn)
+        self.assertIn("health is now 870", turn)
+        self.assertEqual(boss.health, 870)
+
+    def test_data_boss_hints(self):
+        """Test that hints come from the Arcane Intuition column without repeats."""
+        boss = load_bosses(self.workbook)["Horror from the Depths"](player_count=2)
+        hint = boss.get_attack_hint([0, 10, 1])
+        self.assertEqual(hint.count("recoils"), 1)
+        self.assertIn("channeling dark energies", hint)
+
+    def test_templates(self):
+        """Test placeholder compilation and rejection of arbitrary code."""
+        boss = TheManaGod(boss_name="Zed", player_count=3)
+        self.assertEqual(
+            render_template(compile_template("{2 * self.player_count} for {self.boss_name}"), boss), "6 for Zed"
+        )
+        with self.assertRaises(ValueError):
+            compile_template("{__import__('os').getcwd()}")
+        with self.assertRaises(ValueError):
+            compile_template("{self.boss_name * 3}")
+
+
+if __name__ == "__main__":
+    unittest.main()
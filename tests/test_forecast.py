@@ -0,0 +1,84 @@
+import unittest
+import itertools
+import timeit
+from raid_boss.boss import TheManaGod, HorrorfromtheDepths, LunarChanneler
+from raid_boss.forecast import forecast_for, forecast_turn, heal_distribution
+from raid_boss.rolls import ROLL_WEIGHTS, hard_curve
+
+
+def brute_force_heals(boss_cls, rolls, player_count):
+    """Enumerate every combination of rolls to get the heal distribution."""
+    heals = boss_cls.heal_table(player_count)
+    result = {}
+    for combo in itertools.product(range(11), repeat=rolls):
+        probability = 1.0
+        for roll in combo:
+            probability *= ROLL_WEIGHTS[roll] / 36
+        total = sum(heals[roll] for roll in combo)
+        result[total] = result.get(total, 0.0) + probability
+    return result
+
+
+class TestForecast(unittest.TestCase):
+
+    def test_heal_chance(self):
+        """Test the chance of at least one heal against the closed form."""
+        # Rolls 8 and 10 heal: 3/36 + 1/36
+        forecast = forecast_turn(TheManaGod, 6, 4)
+        self.assertEqual(forecast.rolls, 3)
+        self.assertAlmostEqual(forecast.heal_chance, 1 - (32 / 36) ** 3)
+
+    def test_expected_heal(self):
+        """Test the expected heal from ten() and twelve()."""
+        forecast = forecast_turn(TheManaGod, 4, 4)
+        self.assertAlmostEqual(forecast.expected_heal, 2 * (3 / 36 * 16 + 1 / 36 * 80))
+
+    def test_no_heal_bosses(self):
+        """Test that bosses without heals never forecast one."""
+        for boss_cls in (HorrorfromtheDepths, LunarChanneler):
+            forecast = forecast_turn(boss_cls, 20, 4)
+            self.assertEqual(forecast.heal_chance, 0.0)
+            self.assertEqual(forecast.expected_heal, 0.0)
+
+    def test_turn_one_is_quiet(self):
+        """Test that the boss cannot do anything on turn 1."""
+        forecast = forecast_turn(TheManaGod, 1, 4)
+        self.assertEqual(forecast.rolls, 0)
+        self.assertEqual(forecast.heal_chance, 0.0)
+        self.assertEqual(forecast.expected_total_tokens, 0.0)
+
+    def test_expected_tokens(self):
+        """Test the expected token count per spell."""
+        forecast = forecast_turn(TheManaGod, 2, 3)
+        # One roll; four() makes 4 goblins per player on a 2 (3/36)
+        self.assertAlmostEqual(forecast.expected_tokens[2], 3 / 36 * 12)
+        self.assertEqual(forecast.expected_tokens[0], 0.0)
+
+    def test_hard_curve(self):
+        """Test that forecasts follow the roll curve."""
+        self.assertEqual(forecast_turn(TheManaGod, 6, 4, hard_curve).rolls, 6)
+
+    def test_heal_distribution_matches_enumeration(self):
+        """Test the convolved heal distribution against brute force."""
+        for turn in (2, 4, 6, 8):
+            expected = brute_force_heals(TheManaGod, turn // 2, 2)
+            distribution = dict(heal_distribution(TheManaGod, turn, 2))
+            self.assertEqual(set(distribution), set(expected))
+            for heal, probability in expected.items():
+                self.assertAlmostEqual(distribution[heal], probability)
+
+    def test_heal_distribution_sums_to_one(self):
+        """Test that a long turn's distribution is still a distribution."""
+        distribution = heal_distribution(TheManaGod, 60, 4)
+        self.assertAlmostEqual(sum(p for _, p in distribution), 1.0)
+        self.assertEqual(distribution[0][0], 0)
+
+    def test_forecast_for_boss(self):
+        """Test forecasting from a boss in play and that lookups are memoized."""
+        boss = TheManaGod(boss_name="Mana God", player_count=5)
+        self.assertIs(forecast_for(boss, 10), forecast_turn(TheManaGod, 10, 5))
+        self.assertLess(timeit.timeit(lambda: forecast_for(boss, 10), number=1000), 0.1)
+
+
+if __name__ == "__main__":
+    unittest.main()
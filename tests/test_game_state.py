@@ -0,0 +1,73 @@
+import unittest
+from raid_boss.game_state import GameState
+from raid_boss.rolls import ReplayLog
+from tests.helpers import GAME, play
+
+
+class TestGameState(unittest.TestCase):
+
+    def test_seed_is_recorded(self):
+        """Test that unseeded games still pick a seed that can be reported."""
+        self.assertIsInstance(GameState().seed, int)
+        self.assertEqual(GameState(seed=99).seed, 99)
+
+    def test_same_seed_same_rolls(self):
+        """Test that the seed alone decides every roll."""
+        first, second = GameState(seed=5), GameState(seed=5)
+        self.assertEqual([first.schedule[turn] for turn in range(30)], [second.schedule[turn] for turn in range(30)])
+
+    def test_seed_is_isolated_from_global_random(self):
+        """Test that the global random module does not affect seeded rolls."""
+        import random
+
+        random.seed(1)
+        first = GameState(seed=5).schedule[20]
+        random.seed(2)
+        self.assertEqual(GameState(seed=5).schedule[20], first)
+
+    def test_hard_mode(self):
+        """Test that hard mode rolls once per turn number."""
+        self.assertEqual(len(GameState(curve="hard", seed=1).schedule[7]), 7)
+
+    def test_hard_mode_attacks_on_turn_one(self):
+        """Test that the boss's one hard-mode roll on turn 1 is cast, heals included."""
+        game_state = GameState(curve="hard", seed=10)
+        transcript = play(game_state, GAME[:4])
+        self.assertIn("\nTest Boss gets 1 roll(s) this turn! Brace yourself!", transcript)
+        self.assertIn("\nBOSS SPELL> Test Boss heals 60\nTest Boss's health is now 790!", transcript)
+        self.assertEqual(game_state.boss.health, 790)
+
+    def test_replay_reproduces_game(self):
+        """Test that a recorded game replays to the same transcript."""
+        recorded = GameState(seed=2024)
+        transcript = play(recorded, GAME)
+
+        replay = ReplayLog.from_bytes(recorded.replay_log.to_bytes())
+        replayed = GameState(replay=replay)
+        self.assertEqual(replayed.seed, 2024)
+        self.assertEqual(play(replayed, GAME), transcript)
+        self.assertEqual(replayed.boss.health, recorded.boss.health)
+
+    def test_replay_outlasts_its_log(self):
+        """Test that a replayed game can play on past the turns its log recorded."""
+        recorded = GameState(seed=7)
+        play(recorded, GAME[:9])
+        log = ReplayLog.from_bytes(recorded.replay_log.to_bytes())
+        recorded_turns = len(log)
+        replayed = GameState(replay=log)
+        transcript = play(replayed, GAME)
+        self.assertGreater(replayed.boss.turn_count, recorded_turns)
+        self.assertEqual(transcript, play(GameState(seed=7), GAME))
+
+    def test_replay_without_a_seed_stops_at_its_end(self):
+        """Test that a log that cannot be carried on stops the replay with an error."""
+        recorded = GameState(seed=7)
+        play(recorded, GAME[:9])
+        log = ReplayLog.from_bytes(recorded.replay_log.to_bytes())
+        log.seed = None
+        with self.assertRaisesRegex(ValueError, "cannot be carried on"):
+            play(GameState(replay=log), GAME)
+
+
+if __name__ == "__main__":
+    unittest.main()
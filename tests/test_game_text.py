@@ -0,0 +1,94 @@
+import unittest
+from unittest.mock import patch
+from raid_boss.game_logic import GameLogic
+from raid_boss.game_state import GameState
+from raid_boss.game_text import MESSAGES, GameTextManager, MessageCatalog, TextType
+from raid_boss.sinks import MemorySink
+
+
+class TestIncrementalDisplay(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a manager that records every display update."""
+        self.manager = GameTextManager()
+        self.updates = []
+        self.screen = ""
+        self.manager.set_output_callback(self._show)
+
+    def _show(self, text: str, append: bool) -> None:
+        self.updates.append((text, append))
+        self.screen = self.screen + text if append else text
+
+    def test_appends_send_only_new_text(self):
+        """Test that each append pushes just the new entry."""
+        self.manager.add_text("Welcome", TextType.GAME_STATE)
+        self.manager.add_text("How many?", TextType.PROMPT)
+        self.assertEqual(self.updates, [("Welcome\n\n", True), ("How many?\n", True)])
+        self.assertEqual(self.manager.rendered_text, "Welcome\n\nHow many?\n")
+
+    def test_only_new_entries_are_formatted(self):
+        """Test that earlier entries are not formatted again."""
+        for index in range(500):
+            self.manager.add_text(f"line {index}", TextType.GAME_STATE)
+        with patch("raid_boss.game_text._format_text", wraps=lambda text: text.content) as format_text:
+            self.manager.add_text("one more", TextType.GAME_STATE)
+        self.assertEqual(format_text.call_count, 1)
+
+    def test_out_of_order_timestamp_redraws(self):
+        """Test that an entry from the past is inserted in order and the display replaced."""
+        with patch("raid_boss.game_text.time", side_effect=[10.0, 20.0, 15.0]):
+            self.manager.add_text("first", TextType.GAME_STATE)
+            self.manager.add_text("third", TextType.GAME_STATE)
+            self.manager.add_text("second", TextType.GAME_STATE)
+        self.assertFalse(self.updates[-1][1])
+        self.assertEqual(self.screen, "first\n\nsecond\n\nthird\n\n")
+
+    def test_old_entries_are_archived(self):
+        """Test that a long game keeps a bounded buffer without redrawing or losing history."""
+        self.manager.max_buffer_size = 10
+        for index in range(40):
+            self.manager.add_text(str(index), TextType.PROMPT)
+            self.assertLessEqual(len(self.manager.text_buffer.recent), 10)
+            self.assertTrue(self.updates[-1][1])
+        self.assertEqual(self.screen, "".join(f"{index}\n" for index in range(40)))
+        self.assertEqual(self.manager.rendered_text, "".join(f"{index}\n" for index in range(30, 40)))
+        self.assertEqual([text.content for text in self.manager.history(5, 15)], [str(i) for i in range(5, 15)])
+
+    def test_clear(self):
+        """Test that clearing empties the display."""
+        self.manager.add_text("Welcome", TextType.GAME_STATE)
+        self.manager.clear()
+        self.assertEqual(self.screen, "")
+        self.assertEqual(self.manager.rendered_text, "")
+
+
+class TestMessageCatalog(unittest.TestCase):
+
+    def test_static_messages_are_shared(self):
+        """Test that messages without fields are built once."""
+        self.assertIs(MESSAGES.get_defeated_players_prompt(), MessageCatalog().get_defeated_players_prompt())
+        self.assertIs(MESSAGES.get_boss_hint(), MESSAGES.get_boss_hint())
+        self.assertIs(MESSAGES.get_boss_selection_menu(["1. A"]), MESSAGES.get_boss_selection_menu(("1. A",)))
+        self.assertEqual(MESSAGES.get_boss_selection_menu(["1. A"])["prompt"].content, "\nEnter your choice (1-1) > ")
+
+    def test_formatted_messages(self):
+        """Test that messages with fields are filled in on every call."""
+        self.assertEqual(MESSAGES.get_next_player_turn(3).content.count("PLAYER 3"), 1)
+        self.assertEqual(MESSAGES.get_next_player_turn(3).text_type, TextType.PROMPT)
+        error = MESSAGES.get_error("invalid_defeated_players", num_players=4)
+        self.assertEqual(error.content, "Please enter a number between 0 and 4 for defeated players.")
+        self.assertIn("{num_players}", MESSAGES.get_error_messages()["invalid_defeated_players"].content)
+
+    def test_valid_input_builds_no_error_text(self):
+        """Test that error messages are only built when input is rejected."""
+        logic = GameLogic(GameState(seed=1), MemorySink())
+        with patch.object(MessageCatalog, "get_error", wraps=MESSAGES.get_error) as get_error:
+            for answer in ["4", "Zed", "1", "20", "0"]:
+                logic.handle_input(answer)
+            get_error.assert_not_called()
+            logic.handle_input("lots")
+        get_error.assert_called_once_with("invalid_damage")
+
+
+if __name__ == "__main__":
+    unittest.main()
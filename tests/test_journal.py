@@ -0,0 +1,156 @@
+import os
+import tempfile
+import unittest
+from raid_boss.game_logic import GameLogic
+from raid_boss.game_state import GameState
+from raid_boss.game_text import TextType
+from raid_boss.journal import GameJournal
+from raid_boss.rolls import ReplayLog
+from raid_boss.sinks import MemorySink
+from tests.helpers import GAME, play
+
+
+class TestGameStateSnapshot(unittest.TestCase):
+
+    def test_snapshot_resumes_the_same_game(self):
+        """Test that a restored snapshot plays on exactly like the original."""
+        original = GameState(seed=2024)
+        play(original, GAME[:12])
+        restored = GameState.from_bytes(original.to_bytes())
+        self.assertEqual(restored.phase, original.phase)
+        self.assertEqual(restored.boss.health, original.boss.health)
+        self.assertEqual(restored.boss.turn_count, original.boss.turn_count)
+        self.assertEqual(play(restored, GAME[12:]), play(original, GAME[12:]))
+        self.assertEqual(restored.replay_log.to_bytes(), original.replay_log.to_bytes())
+
+    def test_snapshot_before_the_boss_is_chosen(self):
+        """Test that a game still in setup can be saved."""
+        original = GameState(curve="hard", seed=5)
+        play(original, GAME[:2])
+        restored = GameState.from_bytes(original.to_bytes())
+        self.assertIsNone(restored.boss)
+        self.assertEqual((restored.num_players, restored.boss_name), (3, "Test Boss"))
+        self.assertEqual(restored.schedule.curve_name, "hard")
+        self.assertEqual(play(restored, GAME[2:]), play(original, GAME[2:]))
+
+    def test_snapshot_of_a_replayed_game(self):
+        """Test that games played back from a replay log can be saved too."""
+        recorded = GameState(seed=8)
+        play(recorded, GAME)
+        original = GameState(replay=ReplayLog.from_bytes(recorded.replay_log.to_bytes()))
+        play(original, GAME[:9])
+        restored = GameState.from_bytes(original.to_bytes())
+        self.assertIsNone(restored.rng)
+        self.assertEqual(play(restored, GAME[9:]), play(original, GAME[9:]))
+
+    def test_custom_curve_cannot_be_saved(self):
+        """Test that a curve that cannot be restored is refused."""
+        with self.assertRaises(ValueError):
+            GameState(curve=lambda turn: 1, seed=1).to_bytes()
+
+
+class TestGameJournal(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def start(self, checkpoint_every=4) -> GameJournal:
+        journal = GameJournal(self.directory.name, checkpoint_every=checkpoint_every)
+        self.addCleanup(journal.close)
+        return journal
+
+    def test_resume_after_interruption(self):
+        """Test that snapshot plus journal bring back the game where it stopped."""
+        journal = self.start()
+        interrupted = GameState(seed=77)
+        journal.checkpoint(interrupted)
+        play(interrupted, GAME[:11], journal)
+        journal.close()
+
+        resumed_journal = self.start()
+        game_state, answers = resumed_journal.load()
+        # Snapshots every 4 answers leave the last 3 in the journal
+        self.assertEqual(answers, GAME[8:11])
+        logic = GameLogic(game_state, MemorySink(), resumed_journal)
+        logic.replay(answers)
+
+        uninterrupted = GameState(seed=77)
+        play(uninterrupted, GAME[:11])
+        self.assertEqual(play(game_state, GAME[11:]), play(uninterrupted, GAME[11:]))
+
+    def test_replayed_answers_are_not_journaled_twice(self):
+        """Test that resuming does not append the replayed answers again."""
+        journal = self.start(checkpoint_every=0)
+        original = GameState(seed=1)
+        journal.checkpoint(original)
+        play(original, GAME[:3], journal)
+        journal.close()
+
+        resumed_journal = self.start(checkpoint_every=0)
+        game_state, answers = resumed_journal.load()
+        GameLogic(game_state, MemorySink(), resumed_journal).replay(answers)
+        resumed_journal.close()
+        self.assertEqual(self.start().load()[1], GAME[:3])
+        self.assertEqual(game_state.phase, original.phase)
+
+    def test_torn_record_is_dropped(self):
+        """Test that a half-written record at the end of the journal is ignored."""
+        journal = self.start(checkpoint_every=0)
+        journal.checkpoint(GameState(seed=3))
+        play(GameState(seed=3), GAME[:2], journal)
+        journal.close()
+        intact_size = os.path.getsize(journal.journal_path)
+        with open(journal.journal_path, "ab") as journal_file:
+            journal_file.write(b"\x01\x02\x03\x04\x05")
+
+        resumed_journal = self.start(checkpoint_every=0)
+        self.assertEqual(resumed_journal.load()[1], GAME[:2])
+        self.assertEqual(os.path.getsize(journal.journal_path), intact_size)
+
+    def test_game_over_discards_the_save(self):
+        """Test that a finished game is not offered for resuming."""
+        journal = self.start()
+        game_state = GameState(seed=4)
+        journal.checkpoint(game_state)
+        play(game_state, ["1", "Test Boss", "1", "0", "1"], journal)
+        self.assertEqual(game_state.phase, 6)
+        journal.close()
+        self.assertIsNone(self.start().load())
+
+    def test_damaged_snapshot_starts_a_new_game(self):
+        """Test that a truncated or foreign snapshot is discarded instead of stopping the game."""
+        journal = self.start()
+        game_state = GameState(seed=4)
+        play(game_state, GAME[:4])
+        journal.checkpoint(game_state)
+        journal.close()
+        with open(journal.snapshot_path, "rb") as snapshot_file:
+            snapshot = snapshot_file.read()
+        for damaged in (snapshot[:30], snapshot[:5], b"", b"XXXX" + snapshot[4:]):
+            with open(journal.snapshot_path, "wb") as snapshot_file:
+                snapshot_file.write(damaged)
+            resumed = self.start()
+            with self.assertWarns(UserWarning):
+                self.assertIsNone(resumed.load())
+            self.assertEqual(resumed.dropped, "The saved game could not be read, so a new game is starting.")
+            resumed.close()
+            self.assertFalse(os.path.exists(journal.snapshot_path))
+
+    def test_no_save(self):
+        """Test that a fresh directory has nothing to resume."""
+        self.assertIsNone(self.start().load())
+
+    def test_show_resume_asks_the_current_question(self):
+        """Test that a resumed game prompts for the phase it stopped in."""
+        game_state = GameState(seed=6)
+        play(game_state, GAME[:4])
+        output = MemorySink()
+        GameLogic(game_state, output).show_resume()
+        self.assertIn("boss health", output.lines[0][0])
+        self.assertEqual(output.lines[-1][1], TextType.PROMPT)
+        self.assertIn("defeated", output.lines[-1][0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+import unittest
+import random
+from raid_boss.boss import TheManaGod, LunarChanneler
+from raid_boss.lookahead import Lookahead
+from raid_boss.rolls import RollSchedule
+
+
+class TestLookahead(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a boss with a seeded schedule."""
+        self.boss = LunarChanneler(boss_name="Lunar", player_count=3)
+        self.schedule = RollSchedule(rng=random.Random(11))
+        self.lookahead = Lookahead(self.boss, self.schedule, depth=4)
+
+    def test_plans_ahead(self):
+        """Test that advancing plans the next few turns."""
+        plan = self.lookahead.advance(10)
+        self.assertEqual(plan.rolls, self.schedule[10])
+        self.assertEqual(sorted(self.lookahead._plans), [10, 11, 12, 13, 14])
+
+    def test_releases_old_turns(self):
+        """Test that played turns are dropped."""
+        self.lookahead.advance(5)
+        self.lookahead.advance(6)
+        self.assertNotIn(5, self.lookahead._plans)
+        with self.assertRaises(IndexError):
+            self.schedule[5]
+
+    def test_hint_matches_get_attack_hint(self):
+        """Test that the planned hint is the boss hint for that turn's rolls."""
+        self.lookahead.advance(1)
+        for turn in range(2, 30):
+            self.assertEqual(self.lookahead.hint(turn), self.boss.get_attack_hint(self.schedule[turn]))
+            self.assertEqual(self.lookahead[turn].hint_mask, self.boss.hint_mask(self.schedule[turn]))
+
+    def test_render_attacks(self):
+        """Test that the pre-rendered text matches rendering the turn directly."""
+        plan = self.lookahead.advance(20)
+        self.assertEqual(self.lookahead.render_attacks(plan), self.boss.render_turn(plan.rolls))
+
+    def test_player_count_change_rebuilds_text(self):
+        """Test that plans are re-rendered when a player is defeated."""
+        self.lookahead.advance(20)
+        self.boss.player_count = 2
+        plan = self.lookahead[21]
+        self.assertEqual(plan.render_key, (2, "Lunar"))
+        self.assertEqual(self.lookahead.render_attacks(plan), self.boss.render_turn(plan.rolls))
+
+    def test_heals_are_cast_at_play_time(self):
+        """Test that planning ahead never heals the boss early."""
+        boss = TheManaGod(boss_name="Mana God", player_count=4)
+        schedule = RollSchedule(lambda turn: 11, rng=random.Random(1))
+        lookahead = Lookahead(boss, schedule, depth=10)
+        plan = lookahead.advance(1)
+        self.assertEqual(boss.health, 1000)
+        heals = boss.heal_table(4)
+        lookahead.render_attacks(plan)
+        self.assertEqual(boss.health, 1000 + sum(heals[roll] for roll in plan.rolls))
+
+    def test_aggregated_attacks(self):
+        """Test that aggregated text shows each spell once and still applies every heal."""
+        boss = TheManaGod(boss_name="Mana God", player_count=4)
+        schedule = RollSchedule(lambda turn: 20, rng=random.Random(3))
+        lookahead = Lookahead(boss, schedule)
+        plan = lookahead.advance(1)
+        text = lookahead.render_attacks(plan, aggregate=True)
+        self.assertEqual(text.count("BOSS SPELL"), len(set(plan.rolls)))
+        heals = boss.heal_table(4)
+        self.assertEqual(boss.health, 1000 + sum(heals[roll] for roll in plan.rolls))
+
+
+class TestHintMasks(unittest.TestCase):
+
+    def test_mask_categories(self):
+        boss = TheManaGod(boss_name="Mana God", player_count=4)
+        self.assertEqual(boss.hint_mask([]), 0)
+        self.assertEqual(boss.hint_mask([0, 1]), 1)
+        self.assertEqual(boss.hint_mask([2, 10]), 6)
+        self.assertEqual(boss.get_attack_hint([10, 0]).count("!"), 2)
+        self.assertEqual(boss.get_attack_hint([]), "\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
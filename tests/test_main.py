@@ -1,9 +1,13 @@
+import tempfile
 import unittest
 from unittest.mock import MagicMock, patch
 from kivy.app import App
 from raid_boss.main import RaidBossApp
 from raid_boss.game_state import GameState
+from raid_boss.journal import GameJournal
+from raid_boss.registry import BossInfo, BossRegistry
 from raid_boss.ui_components import TextType
+from tests.helpers import play
 
 
 class TestRaidBossApp(unittest.TestCase):
@@ -122,6 +126,34 @@ class TestRaidBossApp(unittest.TestCase):
         self.assertEqual(self.app.game_state.boss.health, initial_health - 50)  # Should not change
         self.assertEqual(self.app.game_state.phase, 5)  # Should not change
 
+    def test_damage_handling_late_game(self):
+        """Test that the boss keeps rolling past the old 100 turn preroll."""
+        self.app.game_state.num_players = 4
+        self.app.game_state.boss_name = "Test Boss"
+        self.app.game_state.phase = 3
+        self.app.game_state.initialize_boss("2")
+        self.app.game_state.boss.turn_count = 150
+
+        self.app.game_logic.handle_player_damage("0")
+        self.assertEqual(len(self.app.game_state.boss.current_attacks), 75)
+        self.assertEqual(len(self.app.game_state.boss.next_attacks), 75)
+        self.assertEqual(self.app.game_state.phase, 5)
+
+    def test_damage_output_is_batched(self):
+        """Test that a whole boss turn reaches the output in a single flush."""
+        self.app.game_state.num_players = 4
+        self.app.game_state.boss_name = "Test Boss"
+        self.app.game_state.phase = 3
+        self.app.game_state.initialize_boss("1")
+        self.app.game_state.boss.turn_count = 20
+        output = self.app.interface.output
+
+        with patch.object(output, "flush", wraps=output.flush) as flush:
+            self.app.game_logic.handle_player_damage("10")
+        flush.assert_called_once()
+        self.assertEqual(output._pending, [])
+        self.assertIn("THE BOSS ATTACKS!", output.text)
+
     def test_defeated_players_handling(self):
         """Test handling of defeated players input."""
         # Set up initial state
@@ -143,7 +175,9 @@ class TestRaidBossApp(unittest.TestCase):
         # Test all players defeated
         self.app.game_logic.handle_defeated_players("4")
         self.assertEqual(self.app.game_state.defeated_players, 4)
-        self.assertEqual(self.app.game_state.phase, 6)  # Phase should be 6 (game complete) when all players are defeated
+        self.assertEqual(
+            self.app.game_state.phase, 6
+        )  # Phase should be 6 (game complete) when all players are defeated
 
     def test_game_over_condition(self):
         """Test game over condition handling."""
@@ -176,6 +210,43 @@ class TestRaidBossApp(unittest.TestCase):
         # Verify that the input was processed
         self.assertIn("4", self.app.interface.output.text)
 
+    def test_interrupted_game_resumes(self):
+        """Test that relaunching with a save directory picks the game back up."""
+        with tempfile.TemporaryDirectory() as directory:
+            first = RaidBossApp(save_dir=directory)
+            first.build()
+            for answer in ["2", "Test Boss", "1", "15"]:
+                first.on_enter(MagicMock(text=answer))
+            first.on_stop()
+
+            second = RaidBossApp(save_dir=directory)
+            second.build()
+            second.on_stop()
+            self.assertEqual(second.game_state.phase, 5)
+            self.assertEqual(second.game_state.boss.health, first.game_state.boss.health)
+            self.assertIn("Resuming the battle against Test Boss", second.interface.output.text)
+
+    def test_removed_boss_starts_a_new_game(self):
+        """Test that a save whose boss pack was removed is discarded instead of stopping the game."""
+        bosses = BossRegistry()
+        bosses.register(BossInfo("kraken", "The Kraken", "raid_boss.boss:HorrorfromtheDepths"))
+        with tempfile.TemporaryDirectory() as directory:
+            saved = GameState(seed=3, registry=bosses)
+            play(saved, ["2", "Test Boss", "4", "15"])
+            journal = GameJournal(directory, "main")
+            journal.checkpoint(saved)
+            journal.close()
+
+            app = RaidBossApp(save_dir=directory)
+            app.build()
+            app.on_stop()
+            self.assertEqual(app.game_state.phase, 0)
+            self.assertIn("The saved game's boss 'kraken' is not installed", app.interface.output.text)
+            # The save now holds the new game
+            resumed = GameJournal(directory, "main")
+            self.assertEqual(resumed.load()[0].boss_type, "")
+            resumed.close()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,84 @@
+import json
+import os
+import tempfile
+import unittest
+
+from raid_boss.game_logic import GameLogic
+from raid_boss.game_state import GameState
+from raid_boss.metrics import BUCKETS, Instrumentation, LatencyHistogram
+from tests.helpers import feed
+
+GAME = ["2", "Test Boss", "1", "5", "0", "999", "0"]
+
+
+class Metered:
+    METERED = ("work",)
+
+    def work(self, value):
+        return value * 2
+
+
+class TestLatencyHistogram(unittest.TestCase):
+
+    def test_buckets(self):
+        """Test that observations land in the first bucket whose bound they do not exceed."""
+        histogram = LatencyHistogram()
+        for seconds in (BUCKETS[0], BUCKETS[0] * 1.5, 5.0):
+            histogram.observe(seconds)
+        self.assertEqual(histogram.count, 3)
+        self.assertEqual(histogram.cumulative()[:2], [(repr(BUCKETS[0]), 1), (repr(BUCKETS[1]), 2)])
+        self.assertEqual(histogram.cumulative()[-1], ("+Inf", 3))
+        self.assertEqual(histogram.quantile(0.5), BUCKETS[1])
+        self.assertIsNone(histogram.quantile(1.0))
+
+
+class TestInstrumentation(unittest.TestCase):
+
+    def setUp(self):
+        self.metrics = Instrumentation()
+        self.addCleanup(self.metrics.uninstrument)
+
+    def test_only_instrumented_methods_are_wrapped(self):
+        """Test that instrumenting swaps in timed methods and uninstrumenting puts the originals back."""
+        original = Metered.__dict__["work"]
+        self.metrics.instrument(Metered)
+        self.metrics.instrument(Metered)  # a second call changes nothing
+        self.assertIsNot(Metered.__dict__["work"], original)
+        self.assertEqual(Metered().work(4), 8)
+        self.metrics.uninstrument()
+        self.assertIs(Metered.__dict__["work"], original)
+        self.assertFalse(self.metrics.enabled)
+        self.assertEqual(self.metrics.histograms["Metered.work"].count, 1)
+
+    def test_game_logic_handlers(self):
+        """Test that a played game is counted per handler."""
+        self.metrics.instrument(GameLogic)
+        feed(GameState(seed=3), GAME)
+        counts = {name: histogram.count for name, histogram in self.metrics.histograms.items()}
+        self.assertEqual(counts["GameLogic.handle_input"], len(GAME))
+        self.assertEqual(counts["GameLogic.handle_player_damage"], 2)
+        self.assertEqual(counts["GameLogic._process_boss_attacks"], 2)
+        self.metrics.reset()
+        self.assertEqual(self.metrics.histograms["GameLogic.handle_input"].count, 0)
+
+    def test_exports(self):
+        """Test the JSON and Prometheus text files."""
+        self.metrics.instrument(Metered)
+        Metered().work(1)
+        with tempfile.TemporaryDirectory() as directory:
+            json_path = os.path.join(directory, "metrics.json")
+            prom_path = os.path.join(directory, "metrics.prom")
+            self.metrics.write(json_path)
+            self.metrics.write(prom_path)
+            with open(json_path) as json_file:
+                handlers = json.load(json_file)["handlers"]
+            with open(prom_path) as prom_file:
+                prom = prom_file.read().splitlines()
+        self.assertEqual(handlers["Metered.work"]["count"], 1)
+        self.assertEqual(prom[1], "# TYPE raid_boss_handler_seconds histogram")
+        self.assertIn('raid_boss_handler_seconds_bucket{handler="Metered.work",le="+Inf"} 1', prom)
+        self.assertEqual(prom[-1], 'raid_boss_handler_seconds_count{handler="Metered.work"} 1')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+import unittest
+from raid_boss.game_state import GameState
+from raid_boss.game_text import MESSAGES
+from raid_boss.players import MAX_PLAYERS, PlayerTable, parse_hit
+from tests.helpers import feed
+
+
+class TestParseHit(unittest.TestCase):
+
+    def test_damage_and_poison(self):
+        """Test the ways a player can report their turn."""
+        self.assertEqual(parse_hit("12"), (12, 0))
+        self.assertEqual(parse_hit("3p"), (0, 3))
+        self.assertEqual(parse_hit(" 12  3P "), (12, 3))
+        self.assertEqual(parse_hit("3p 12"), (12, 3))
+        for text in ("", "-10", "p", "1 2", "3p 4p", "ten"):
+            self.assertIsNone(parse_hit(text))
+
+    def test_unicode_digits_are_rejected(self):
+        """Test that digits int() cannot read are invalid rather than an error, and the player is asked again."""
+        for text in ("²", "²p", "12 ³p", "１２"):
+            self.assertIsNone(parse_hit(text))
+        game_state = GameState(seed=1)
+        output = feed(game_state, ["2", "Test Boss", "1", "²"]).output
+        self.assertEqual(game_state.phase, 3)
+        self.assertEqual(output.lines[-1][0], MESSAGES.get_error("invalid_damage").content)
+
+
+class TestPlayerTable(unittest.TestCase):
+
+    def test_updates_and_queries(self):
+        """Test that per-player columns add up."""
+        table = PlayerTable(5)
+        table.deal(0, 10)
+        table.deal(3, 25, 4)
+        table.deal(0, 5, 1)
+        self.assertEqual((table.total_damage, table.total_poison), (40, 5))
+        self.assertEqual(table.top_damage(2), [(3, 25), (0, 15)])
+
+    def test_defeats(self):
+        """Test that defeats count each player once and take the last seats first."""
+        table = PlayerTable(4)
+        table.defeat(1)
+        table.defeat(1)
+        self.assertEqual(table.alive_count, 3)
+        self.assertEqual(table.defeat_count(1), 1)
+        self.assertEqual(list(table.alive_players()), [0, 2])
+        self.assertEqual(table.defeat_count(5), 2)
+        self.assertEqual(table.alive_count, 0)
+
+    def test_round_trip(self):
+        """Test that a table survives being saved."""
+        table = PlayerTable(3)
+        table.deal(2, 7, 2)
+        table.defeat(0)
+        restored, position = PlayerTable.from_bytes(b"xx" + table.to_bytes(), 2)
+        self.assertEqual(position, 2 + len(table.to_bytes()))
+        self.assertEqual((list(restored.damage), list(restored.poison)), ([0, 0, 7], [0, 0, 2]))
+        self.assertEqual((bytes(restored.alive), restored.alive_count), (b"\x00\x01\x01", 2))
+
+    def test_table_with_a_life_column(self):
+        """Test that tables saved with the old life column still load."""
+        table = PlayerTable(3)
+        table.deal(1, 9)
+        saved = table.to_bytes()
+        with_life = saved[:4] + bytes(8 * 3) + saved[4:]
+        restored, position = PlayerTable.from_bytes(with_life, with_life=True)
+        self.assertEqual(position, len(with_life))
+        self.assertEqual(list(restored.damage), [0, 9, 0])
+
+
+class TestPlayerCount(unittest.TestCase):
+
+    def test_player_count_is_capped(self):
+        """Test that a huge table is turned away before any columns are allocated."""
+        game_state = GameState(seed=1)
+        logic = feed(game_state, ["1000000000"])
+        output = logic.output
+        self.assertEqual(game_state.phase, 0)
+        self.assertEqual(
+            output.lines[-1][0], MESSAGES.get_error("invalid_player_count", max_players=MAX_PLAYERS).content
+        )
+        for answer in (str(MAX_PLAYERS), "Zed", "1"):
+            logic.handle_input(answer)
+        self.assertEqual(len(game_state.players), MAX_PLAYERS)
+
+
+class TestPoisonWin(unittest.TestCase):
+
+    def test_poison_defeats_the_boss(self):
+        """Test that 50 poison per player wins the game."""
+        game_state = GameState(seed=1)
+        logic = feed(game_state, ["2", "Zed", "1", "40p", "0", "10 60p"])
+        output = logic.output
+        self.assertTrue(game_state.is_game_over())
+        # The boss still takes its turn before the game ends
+        self.assertEqual(game_state.phase, 5)
+        logic.handle_input("0")
+        self.assertEqual(game_state.phase, 6)
+        self.assertEqual(game_state.players.total_poison, 100)
+        self.assertIn("Zed has 100 of 100 poison counters.", [line for line, _ in output.lines])
+
+    def test_turns_go_round_the_players_still_alive(self):
+        """Test that damage is credited to each player in turn, skipping those defeated."""
+        game_state = GameState(seed=1)
+        feed(game_state, ["3", "Zed", "1", "5", "0", "7", "1", "11", "0", "13", "0"])
+        # Player 3 fell on turn 2, so turns 3 and 4 go to players 1 and 2
+        self.assertEqual(list(game_state.players.damage), [16, 20, 0])
+        self.assertEqual(game_state.players.top_damage(), [(1, 20)])
+
+    def test_defeated_players_shrink_the_boss(self):
+        """Test that the boss casts for the players still standing."""
+        game_state = GameState(seed=1)
+        feed(game_state, ["4", "Zed", "1", "0", "2"])
+        self.assertEqual((game_state.players.alive_count, game_state.boss.player_count), (2, 2))
+        restored = GameState.from_bytes(game_state.to_bytes())
+        self.assertEqual(restored.players.alive_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
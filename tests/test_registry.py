@@ -0,0 +1,116 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+from importlib.metadata import EntryPoint
+from unittest.mock import Mock, patch
+from raid_boss import registry
+from raid_boss.boss import LunarChanneler, TheManaGod
+from raid_boss.boss_data import DataBoss
+from raid_boss.game_state import GameState
+from raid_boss.registry import BossInfo, BossRegistry
+
+PACK = [BossInfo("pack-god", "Pack God", "raid_boss.boss:TheManaGod")]
+
+KRAKEN = """
+from raid_boss.boss import HorrorfromtheDepths
+
+
+class Kraken(HorrorfromtheDepths):
+    BASE_HEALTH = 300
+"""
+
+
+class TestBossRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def write_pack(self, manifest, source=KRAKEN):
+        with open(os.path.join(self.directory.name, "kraken.py"), "w") as module_file:
+            module_file.write(source)
+        with open(os.path.join(self.directory.name, "kraken.json"), "w") as manifest_file:
+            json.dump(manifest, manifest_file)
+
+    def test_builtin_menu(self):
+        """Test that the built-in bosses keep their menu numbers."""
+        bosses = BossRegistry()
+        self.assertEqual(bosses.menu_options(), ("1. TheManaGod", "2. HorrorfromtheDepths", "3. LunarChanneler"))
+        self.assertIs(bosses.find("3").load(), LunarChanneler)
+        self.assertIs(bosses.find("mana-god").load(), TheManaGod)
+        for choice in ("0", "4", "", "-1", "TheManaGod", "²", "３"):
+            self.assertIsNone(bosses.find(choice))
+
+    def test_plugin_dir_loads_metadata_only(self):
+        """Test that a plugin boss is listed at startup and imported when picked."""
+        self.write_pack({"bosses": [{"key": "kraken", "name": "The Kraken", "module": "kraken.py", "class": "Kraken"}]})
+        bosses = BossRegistry()
+        bosses.load_plugin_dir(self.directory.name)
+        self.assertEqual(bosses.menu_options()[-1], "4. The Kraken")
+        self.assertNotIn("raid_boss_plugins.kraken", sys.modules)
+        self.addCleanup(sys.modules.pop, "raid_boss_plugins.kraken", None)
+        self.assertEqual(bosses.find("4").load().BASE_HEALTH, 300)
+
+    def test_broken_manifest_is_skipped(self):
+        """Test that a bad manifest warns instead of stopping the game."""
+        self.write_pack({"bosses": [{"name": "No Key"}]})
+        bosses = BossRegistry()
+        with self.assertWarns(UserWarning):
+            bosses.load_plugin_dir(self.directory.name)
+        self.assertEqual(len(bosses), 3)
+        bosses.load_plugin_dir(os.path.join(self.directory.name, "missing"))
+
+    def test_entry_points(self):
+        """Test that installed packs register through entry points."""
+        pack = EntryPoint("pack", "tests.test_registry:PACK", registry.ENTRY_POINT_GROUP)
+        with patch("importlib.metadata.entry_points", return_value=[pack]):
+            bosses = BossRegistry()
+            bosses.load_entry_points()
+        self.assertEqual(bosses.find("4"), PACK[0])
+        with self.assertRaises(ValueError):
+            bosses.register(PACK[0])
+
+    def test_game_with_a_plugin_boss(self):
+        """Test that a plugin boss can be picked, played and saved by its key."""
+        self.write_pack({"bosses": [{"key": "kraken", "name": "The Kraken", "module": "kraken.py", "class": "Kraken"}]})
+        self.addCleanup(sys.modules.pop, "raid_boss_plugins.kraken", None)
+        bosses = BossRegistry()
+        bosses.load_plugin_dir(self.directory.name)
+        game_state = GameState(seed=1, registry=bosses)
+        game_state.num_players = 2
+        game_state.initialize_boss("4")
+        self.assertEqual((game_state.boss_type, game_state.boss.health), ("kraken", 600))
+        restored = GameState.from_bytes(game_state.to_bytes(), bosses)
+        self.assertEqual(type(restored.boss).__name__, "Kraken")
+        with self.assertRaises(ValueError):
+            GameState.from_bytes(game_state.to_bytes(), BossRegistry())
+
+    def test_packs_load_when_needed(self):
+        """Test that a pack is only read for the menu or a lookup, and a failing pack warns."""
+        load = Mock(return_value=PACK)
+        bosses = BossRegistry()
+        bosses.add_pack("pack", load)
+        bosses.add_pack("broken", Mock(side_effect=OSError("no workbook")))
+        load.assert_not_called()
+        with self.assertWarns(UserWarning):
+            self.assertEqual(bosses.menu_options()[-1], "4. Pack God")
+        self.assertEqual(bosses.find("pack-god"), PACK[0])
+        load.assert_called_once_with()
+
+    def test_workbook_bosses(self):
+        """Test that the workbook's bosses are on the default menu and can be played and saved."""
+        bosses = registry.default_registry()
+        self.assertIn("Mana God (BossMaster)", [info.name for info in bosses])
+        game_state = GameState(seed=1, registry=bosses)
+        game_state.num_players = 2
+        game_state.initialize_boss("bossmaster-mana-god")
+        self.assertIsInstance(game_state.boss, DataBoss)
+        self.assertEqual(game_state.boss.health, TheManaGod(player_count=2).health)
+        restored = GameState.from_bytes(game_state.to_bytes(), bosses)
+        self.assertIs(type(restored.boss), type(game_state.boss))
+
+
+if __name__ == "__main__":
+    unittest.main()
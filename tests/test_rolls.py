@@ -0,0 +1,116 @@
+import unittest
+import math
+import random
+from collections import Counter
+from raid_boss.rolls import ReplayLog, RollSchedule, draw_rolls
+
+
+class TestRollSchedule(unittest.TestCase):
+
+    def test_normal_curve_lengths(self):
+        """Test that normal mode rolls floor(0.5 * turn) times."""
+        schedule = RollSchedule(rng=random.Random(42))
+        for turn in range(100):
+            self.assertEqual(len(schedule[turn]), math.floor(0.5 * turn))
+
+    def test_hard_curve_lengths(self):
+        """Test that hard mode rolls once per turn number."""
+        schedule = RollSchedule("hard", rng=random.Random(42))
+        for turn in range(30):
+            self.assertEqual(len(schedule[turn]), turn)
+
+    def test_custom_curve(self):
+        """Test that a user-supplied curve sets the roll count."""
+        schedule = RollSchedule(lambda turn: 3, rng=random.Random(42))
+        self.assertEqual(len(schedule[0]), 3)
+        self.assertEqual(len(schedule[57]), 3)
+
+    def test_invalid_curves(self):
+        """Test that unknown or negative curves are rejected."""
+        with self.assertRaises(ValueError):
+            RollSchedule("impossible")
+        with self.assertRaises(ValueError):
+            RollSchedule(lambda turn: -1)[1]
+
+    def test_roll_range(self):
+        """Test that every roll indexes into boss_funcs."""
+        schedule = RollSchedule(rng=random.Random(1))
+        self.assertTrue(all(0 <= roll <= 10 for turn in range(60) for roll in schedule[turn]))
+
+    def test_unbounded(self):
+        """Test that turns past the old 100 turn preroll are available."""
+        schedule = RollSchedule(rng=random.Random(1))
+        self.assertEqual(len(schedule[250]), 125)
+
+    def test_release_drops_old_turns(self):
+        """Test that released turns are forgotten."""
+        schedule = RollSchedule(rng=random.Random(1))
+        schedule[10]
+        schedule.release(10)
+        self.assertEqual(len(schedule._turns), 1)
+        with self.assertRaises(IndexError):
+            schedule[9]
+
+    def test_read_order_does_not_change_rolls(self):
+        """Test that reading ahead or releasing unread turns keeps the same rolls."""
+        ahead = RollSchedule(rng=random.Random(3))
+        ahead[20]
+        skipped = RollSchedule(rng=random.Random(3))
+        skipped.release(15)
+        for turn in range(15, 21):
+            self.assertEqual(ahead[turn], skipped[turn])
+
+    def test_roll_distribution(self):
+        """Test that the bulk draw follows the 2d6 distribution."""
+        rolls = draw_rolls(36000, random.Random(1))
+        counts = Counter(rolls)
+        self.assertEqual(len(rolls), 36000)
+        self.assertAlmostEqual(counts[5] / 36000, 6 / 36, delta=0.01)
+        self.assertAlmostEqual(counts[0] / 36000, 1 / 36, delta=0.005)
+        self.assertAlmostEqual(counts[10] / 36000, 1 / 36, delta=0.005)
+
+
+class TestReplayLog(unittest.TestCase):
+
+    def setUp(self):
+        """Record 40 turns of a seeded schedule."""
+        self.log = ReplayLog(seed=1234, curve_name="hard")
+        self.schedule = RollSchedule("hard", rng=random.Random(1234), log=self.log)
+        self.turns = [self.schedule[turn] for turn in range(40)]
+
+    def test_records_every_turn(self):
+        """Test that each drawn turn is logged in order."""
+        self.assertEqual(len(self.log), 40)
+        for turn, rolls in enumerate(self.turns):
+            self.assertEqual(self.log[turn], rolls)
+
+    def test_packs_two_rolls_per_byte(self):
+        """Test that the log stores rolls as nibbles."""
+        self.assertEqual(len(self.log.packed), sum((turn + 1) // 2 for turn in range(40)))
+
+    def test_round_trip(self):
+        """Test that a log survives serialization."""
+        loaded = ReplayLog.from_bytes(self.log.to_bytes())
+        self.assertEqual(loaded.seed, 1234)
+        self.assertEqual(loaded.curve_name, "hard")
+        self.assertEqual([loaded[turn] for turn in range(40)], self.turns)
+
+    def test_rejects_bad_data(self):
+        """Test that foreign or truncated data is refused."""
+        with self.assertRaises(ValueError):
+            ReplayLog.from_bytes(b"NOPE" + bytes(20))
+        with self.assertRaises(ValueError):
+            ReplayLog.from_bytes(self.log.to_bytes()[:-3])
+
+    def test_replay_schedule(self):
+        """Test that the replay schedule serves the recorded rolls and rolls on past the end."""
+        schedule = self.log.schedule()
+        schedule.release(5)
+        self.assertEqual([schedule[turn] for turn in range(5, 40)], self.turns[5:])
+        recording = RollSchedule("hard", rng=random.Random(1234))
+        self.assertEqual([schedule[turn] for turn in range(40, 43)], [recording[turn] for turn in range(40, 43)])
+        self.assertEqual(len(self.log), 43)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import asyncio
+import unittest
+from raid_boss.loadgen import generate_load
+from raid_boss.server import END_OF_RESPONSE, GameServer
+
+MARKER = END_OF_RESPONSE.encode("utf-8")
+
+
+class TestGameServer(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        """Start a server on a free port."""
+        self.server = GameServer(port=0, seed=100)
+        await self.server.start()
+
+    async def asyncTearDown(self):
+        await self.server.close()
+
+    async def connect(self):
+        reader, writer = await asyncio.open_connection(self.server.host, self.server.port)
+        welcome = await reader.readuntil(MARKER)
+        return reader, writer, welcome.decode("utf-8")
+
+    async def send(self, reader, writer, line: str) -> str:
+        writer.write(line.encode("utf-8") + b"\n")
+        await writer.drain()
+        return (await reader.readuntil(MARKER)).decode("utf-8")
+
+    async def test_session_plays_a_game(self):
+        """Test that input lines reach the session's phase handlers."""
+        reader, writer, welcome = await self.connect()
+        self.assertIn("How many people are playing?", welcome)
+        self.assertIn("Wonderful! 3 player(s)", await self.send(reader, writer, "3"))
+        self.assertIn("Choose your boss:", await self.send(reader, writer, "Test Boss"))
+        self.assertIn("The battle begins!", await self.send(reader, writer, "2"))
+        self.assertIn("Damage dealt: 10", await self.send(reader, writer, "10"))
+        writer.close()
+        await writer.wait_closed()
+
+    async def test_sessions_are_independent(self):
+        """Test that two connections play separate games."""
+        first = await self.connect()
+        second = await self.connect()
+        self.assertEqual(len(self.server.sessions), 2)
+        await self.send(first[0], first[1], "2")
+        self.assertIn("Please enter a number from 1 to", await self.send(second[0], second[1], "zero"))
+        phases = sorted(session.game_state.phase for session in self.server.sessions.values())
+        self.assertEqual(phases, [0, 1])
+        for _, writer, _ in (first, second):
+            writer.close()
+            await writer.wait_closed()
+
+    async def test_session_ends_with_the_game(self):
+        """Test that the server hangs up after game over and forgets the session."""
+        reader, writer, _ = await self.connect()
+        for line in ["1", "Test Boss", "1", "0"]:
+            await self.send(reader, writer, line)
+        response = await self.send(reader, writer, "1")
+        self.assertIn("All players have been defeated!", response)
+        self.assertEqual(await reader.read(), b"")
+        writer.close()
+        await writer.wait_closed()
+        self.assertEqual(self.server.sessions, {})
+
+    async def test_load_generator(self):
+        """Test that the load generator plays every scripted game."""
+        report = await generate_load(self.server.host, self.server.port, sessions=20, concurrency=10, turns=3)
+        self.assertEqual((report.sessions, report.failed), (20, 0))
+        self.assertEqual(report.inputs, 20 * (3 + 2 * 3))
+        self.assertEqual(self.server.inputs_handled, report.inputs)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import unittest
+import numpy as np
+from raid_boss.boss import TheManaGod, HorrorfromtheDepths, LunarChanneler
+from raid_boss.simulator import (
+    constant_damage,
+    heal_table,
+    poisson_damage,
+    simulate,
+    simulate_encounters,
+)
+
+
+class TestSimulator(unittest.TestCase):
+
+    def test_heal_table_matches_spells(self):
+        """Test that heal amounts come from TheManaGod's ten() and twelve()."""
+        heals = heal_table(TheManaGod, 4)
+        self.assertEqual(heals[8], 16)
+        self.assertEqual(heals[10], 80)
+        self.assertEqual(heals.sum(), 96)
+        self.assertEqual(heal_table(HorrorfromtheDepths, 4).sum(), 0)
+        self.assertEqual(heal_table(LunarChanneler, 4).sum(), 0)
+
+    def test_overwhelming_damage_wins_on_turn_one(self):
+        """Test that killing damage ends every game on the first turn."""
+        report = simulate(TheManaGod, 4, 1000, constant_damage(1000), seed=1)
+        self.assertEqual(report.wins, 1000)
+        self.assertEqual(report.win_rate, 1.0)
+        self.assertEqual(report.turns_to_kill[1], 1000)
+        self.assertEqual(report.mean_heal, 0.0)
+
+    def test_no_damage_never_wins(self):
+        """Test that games without damage run out of turns."""
+        report = simulate(TheManaGod, 2, 500, constant_damage(0), max_turns=20, seed=1)
+        self.assertEqual(report.wins, 0)
+        self.assertTrue(np.isnan(report.mean_turns_to_kill))
+        self.assertGreater(report.mean_heal, 0)
+
+    def test_fixed_damage_kill_turn(self):
+        """Test the kill turn for a boss that never heals."""
+        # 4 players * 250 health = 1000; 4 * 30 damage per turn kills on turn 9
+        report = simulate(HorrorfromtheDepths, 4, 100, constant_damage(30), seed=1)
+        self.assertEqual(report.turns_to_kill[9], 100)
+        self.assertEqual(report.turns_to_kill_percentile(50), 9)
+
+    def test_tuning_overrides(self):
+        """Test that health can be overridden and poison ends games at its limit."""
+        report = simulate(HorrorfromtheDepths, 4, 100, constant_damage(30), seed=1, base_health=150)
+        self.assertEqual(report.turns_to_kill[5], 100)
+        # 4 players * 5 poison per turn reach the 4 * 50 limit on turn 10, before damage would
+        poisoned = simulate(HorrorfromtheDepths, 4, 100, constant_damage(20), seed=1, poison_model=constant_damage(5))
+        self.assertEqual(poisoned.turns_to_kill[10], 100)
+        self.assertEqual(poisoned.poison_wins, 100)
+        weaker_heals = simulate(TheManaGod, 4, 2000, constant_damage(0), max_turns=20, seed=2, heal_scale=0.5)
+        self.assertLess(
+            weaker_heals.mean_heal, simulate(TheManaGod, 4, 2000, constant_damage(0), max_turns=20, seed=2).mean_heal
+        )
+
+    def test_seed_reproducibility(self):
+        """Test that the same seed reproduces the same report."""
+        first = simulate(TheManaGod, 3, 5000, poisson_damage(25, 2), seed=7, batch_size=1000)
+        second = simulate(TheManaGod, 3, 5000, poisson_damage(25, 2), seed=7, batch_size=1000)
+        self.assertEqual(first.wins, second.wins)
+        np.testing.assert_array_equal(first.turns_to_kill, second.turns_to_kill)
+        np.testing.assert_array_equal(first.heal_totals, second.heal_totals)
+
+    def test_heals_delay_kills(self):
+        """Test that the healing boss takes longer to kill than one that never heals."""
+        healer = simulate(TheManaGod, 4, 20000, poisson_damage(20, 1), seed=3)
+        plain = simulate(HorrorfromtheDepths, 4, 20000, poisson_damage(20, 1), seed=3)
+        self.assertGreater(healer.mean_turns_to_kill, plain.mean_turns_to_kill)
+
+    def test_simulate_encounters_covers_all_bosses(self):
+        """Test that every boss and player count gets a report."""
+        reports = simulate_encounters(100, constant_damage(40), player_counts=[2, 4], seed=5)
+        self.assertEqual(len(reports), 6)
+        self.assertIn(("LunarChanneler", 2), reports)
+        for report in reports.values():
+            self.assertEqual(report.games, 100)
+
+
+if __name__ == "__main__":
+    unittest.main()
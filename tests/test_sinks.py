@@ -0,0 +1,53 @@
+import io
+import subprocess
+import sys
+import unittest
+from raid_boss.game_state import GameState
+from raid_boss.game_text import TextType
+from raid_boss.sinks import MemorySink, StdoutSink
+from tests.helpers import feed
+
+
+def play(output, inputs, seed=3):
+    return feed(GameState(seed=seed), inputs, output).game_state
+
+
+GAME = ["2", "Test Boss", "3"] + ["30", "0"] * 8
+
+
+class TestSinks(unittest.TestCase):
+
+    def test_engine_does_not_import_kivy(self):
+        """Test that the game engine can be used without loading Kivy."""
+        code = "import sys, raid_boss.game_logic, raid_boss.sinks; print('kivy' in sys.modules)"
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        self.assertEqual(result.stdout.strip(), "False")
+
+    def test_memory_sink(self):
+        """Test that a whole game can be played into memory."""
+        output = MemorySink()
+        game_state = play(output, GAME)
+        self.assertIn(game_state.phase, (3, 6))
+        self.assertIn(("Who have you come here to slay? > ", TextType.PROMPT), output.lines)
+        self.assertTrue(output.text.startswith("Wonderful! 2 player(s) are ready to slay some spells!\n\n"))
+
+    def test_stdout_sink_matches_memory_sink(self):
+        """Test that the stream sink writes the same transcript, once per handler."""
+        memory, stream = MemorySink(), io.StringIO()
+        play(memory, GAME)
+        play(StdoutSink(stream), GAME)
+        self.assertEqual(stream.getvalue(), memory.text)
+
+    def test_stdout_sink_batches_writes(self):
+        """Test that a batch is written in one go."""
+        stream = io.StringIO()
+        sink = StdoutSink(stream, color=True)
+        with sink.batch():
+            sink.add_text("Oops", TextType.ERROR)
+            sink.add_texts([("Next? > ", TextType.PROMPT)])
+            self.assertEqual(stream.getvalue(), "")
+        self.assertEqual(stream.getvalue(), "\033[91mOops\033[0m\n\n\033[92mNext? > \033[0m\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+import unittest
+from raid_boss.boss import HorrorfromtheDepths, LunarChanneler, TheManaGod
+from raid_boss.spells import ALL, SpellEffect, Token
+
+
+class TestSpellEffects(unittest.TestCase):
+
+    def test_every_roll_has_an_effect_and_text(self):
+        """Test that each boss describes all eleven roll values."""
+        for boss_cls in (TheManaGod, HorrorfromtheDepths, LunarChanneler):
+            self.assertEqual(len(boss_cls.effect_table(4)), 11)
+            self.assertEqual(len(boss_cls.SPELL_TEXTS), 11)
+
+    def test_effects_scale_with_players(self):
+        """Test that token counts and heals follow the player count."""
+        effect = TheManaGod.effect_table(3)[8]
+        self.assertEqual(effect.heal, 12)
+        self.assertEqual(effect.tokens, (Token("white cleric zombie", 12, 1, 1, ("lifelink", "decayed", "haste")),))
+        self.assertEqual(HorrorfromtheDepths.effect_table(3)[2].bounce, 3)
+        self.assertEqual(HorrorfromtheDepths.effect_table(3)[0].bounce, ALL)
+
+    def test_text_is_filled_in_from_the_effect(self):
+        """Test that the spell text shows the effect's numbers."""
+        boss = TheManaGod(boss_name="Zed", player_count=2)
+        self.assertIn("Create 8 1/1 red goblin", boss.four())
+        self.assertIn("Zed heals 40", boss.twelve())
+        self.assertEqual(boss.health, 540)
+
+    def test_auras_are_not_creatures(self):
+        """Test that aura tokens are listed as auras and do not count as creatures."""
+        effect = LunarChanneler.effect_table(4)[1]
+        self.assertEqual(effect.auras, ("Moon's Presence",))
+        self.assertFalse(effect.tokens[0].creature)
+        self.assertEqual(effect.token_count, 1)
+
+    def test_tables_are_shared(self):
+        """Test that the effect table is built once per boss and player count."""
+        self.assertIs(TheManaGod.effect_table(4), TheManaGod(player_count=4).effect_table(4))
+        self.assertEqual(SpellEffect().token_count, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+import unittest
+from raid_boss.startup import PROFILE_FLAG, StartupProfile, pop_flag, pop_option
+
+
+class TestStartupProfile(unittest.TestCase):
+
+    def test_pop_flag(self):
+        """Test that the profile flag is removed before Kivy sees the arguments."""
+        argv = ["main.py", PROFILE_FLAG, "--size=800x600"]
+        self.assertTrue(pop_flag(argv, PROFILE_FLAG))
+        self.assertEqual(argv, ["main.py", "--size=800x600"])
+        self.assertFalse(pop_flag(argv, PROFILE_FLAG))
+
+    def test_pop_option(self):
+        """Test that an option and its value are removed in either spelling."""
+        argv = ["main.py", "--metrics", "out.prom", "--size=800x600"]
+        self.assertEqual(pop_option(argv, "--metrics"), "out.prom")
+        self.assertEqual(argv, ["main.py", "--size=800x600"])
+        argv = ["main.py", "--metrics=out.json"]
+        self.assertEqual(pop_option(argv, "--metrics"), "out.json")
+        self.assertEqual(argv, ["main.py"])
+        self.assertIsNone(pop_option(argv, "--metrics"))
+
+    def test_phases(self):
+        """Test that phases record their timing and the modules they imported."""
+        profile = StartupProfile()
+        with profile.phase("import"):
+            import raid_boss.startup  # noqa: F401  (already loaded, so no new modules)
+        profile.mark("first prompt drawn")
+        (name, offset, duration, modules), mark = profile.phases
+        self.assertEqual(name, "import")
+        self.assertEqual(modules, 0)
+        self.assertGreaterEqual(mark[1], offset + duration)
+        report = profile.report()
+        self.assertIn("import", report)
+        self.assertIn("first prompt drawn", report)
+
+
+if __name__ == "__main__":
+    unittest.main()
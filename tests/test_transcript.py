@@ -0,0 +1,76 @@
+import os
+import tempfile
+import unittest
+from raid_boss.game_text import MESSAGES, TextType
+from raid_boss.transcript import Transcript, TranscriptArchive, make_entry
+
+
+def entry(index: int):
+    return make_entry(f"line {index}", TextType.BOSS_ATTACK if index % 2 else TextType.PROMPT, float(index), index % 3)
+
+
+class TestTranscript(unittest.TestCase):
+
+    def test_ring_buffer_is_bounded(self):
+        """Test that only the newest entries stay in memory."""
+        transcript = Transcript(capacity=5)
+        for index in range(12):
+            transcript.append(entry(index))
+        self.assertEqual(len(transcript), 12)
+        self.assertEqual(len(transcript.recent), 5)
+        self.assertEqual(transcript.first_in_memory, 7)
+
+    def test_archived_entries_page_back_in(self):
+        """Test that every entry can still be read after it was spilled."""
+        transcript = Transcript(capacity=3, archive_factory=lambda: TranscriptArchive(page_size=4))
+        for index in range(30):
+            transcript.append(entry(index))
+        self.assertEqual([text.content for text in transcript], [f"line {index}" for index in range(30)])
+        self.assertEqual(transcript[9], entry(9))
+        self.assertEqual(transcript[-1].content, "line 29")
+        self.assertEqual([text.timestamp for text in transcript[10:13]], [10.0, 11.0, 12.0])
+
+    def test_catalog_text_is_shared(self):
+        """Test that entries keep the catalog's string rather than copying or interning it."""
+        prompt = MESSAGES.get_boss_name_prompt().content
+        first = make_entry(prompt, TextType.PROMPT, 0.0)
+        second = make_entry(prompt, TextType.PROMPT, 1.0)
+        self.assertIs(first.content, second.content)
+        dynamic = "".join(["PLAYER ", "1"])
+        self.assertIs(make_entry(dynamic, TextType.PROMPT, 2.0).content, dynamic)
+
+    def test_clear(self):
+        """Test that clearing drops the archive too."""
+        transcript = Transcript(capacity=2)
+        for index in range(5):
+            transcript.append(entry(index))
+        transcript.clear()
+        self.assertEqual(len(transcript), 0)
+        self.assertEqual(list(transcript), [])
+
+
+class TestTranscriptArchive(unittest.TestCase):
+
+    def test_reopen(self):
+        """Test that an archive file can be reopened, even with a torn last page."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "transcript.rba")
+            archive = TranscriptArchive(path, page_size=8)
+            for index in range(20):
+                archive.append(entry(index))
+            archive.close()
+            with open(path, "ab") as archive_file:
+                archive_file.write(b"\x10\x00\x00\x00")
+
+            reopened = TranscriptArchive(path, page_size=8)
+            self.assertEqual(len(reopened), 20)
+            self.assertEqual(reopened[17], entry(17))
+            reopened.append(entry(20))
+            reopened.close()
+            final = TranscriptArchive(path)
+            self.assertEqual(len(final), 21)
+            final.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+import os
+import tempfile
+import unittest
+from raid_boss.boss import HorrorfromtheDepths, LunarChanneler, TheManaGod
+from raid_boss.spells import SpellEffect
+from raid_boss.tuner import PlayerModel, Settings, Target, TrialCache, boss_fingerprint, candidate_settings, tune
+
+
+class LoudHorror(HorrorfromtheDepths):
+    """A Horror whose last spell heals, standing in for an edited boss."""
+
+    @classmethod
+    def spell_effects(cls, player_count):
+        return HorrorfromtheDepths.spell_effects(player_count)[:-1] + (SpellEffect(heal=player_count * 10),)
+
+
+SMALL = dict(player_counts=[2, 4], base_healths=[200, 300], heal_scales=[0.5, 1.0], games=500, seed=11, jobs=1)
+
+
+class TestTuner(unittest.TestCase):
+
+    def test_fingerprint_follows_the_definition(self):
+        """Test that every boss hashes differently and the hash is stable."""
+        fingerprints = {boss_fingerprint(boss) for boss in (TheManaGod, HorrorfromtheDepths, LunarChanneler)}
+        self.assertEqual(len(fingerprints), 3)
+        self.assertNotEqual(boss_fingerprint(LoudHorror), boss_fingerprint(HorrorfromtheDepths))
+        self.assertEqual(boss_fingerprint(TheManaGod), boss_fingerprint(TheManaGod))
+
+    def test_heal_and_poison_only_vary_when_they_matter(self):
+        """Test that bosses without heals are not tried at other heal scales."""
+        model = PlayerModel()
+        self.assertEqual(len(candidate_settings(TheManaGod, [200, 300], [0.5, 1.0], [40, 50], model)), 4)
+        self.assertEqual(len(candidate_settings(HorrorfromtheDepths, [200, 300], [0.5, 1.0], [40, 50], model)), 2)
+        poisoned = PlayerModel(poison=3.0)
+        self.assertEqual(len(candidate_settings(TheManaGod, [200], [1.0], [40, 50], poisoned)), 2)
+
+    def test_best_trial_is_closest_to_target(self):
+        """Test that the chosen setting scores best against the target."""
+        result = tune(bosses=[HorrorfromtheDepths], target=Target(win_rate=1.0, turns=7), **SMALL)
+        best = result.best("HorrorfromtheDepths", 2)
+        self.assertEqual(best.settings, Settings(base_health=200))
+        self.assertTrue(
+            all(
+                trial.score(result.target) >= best.score(result.target)
+                for trial in result.trials["HorrorfromtheDepths", 2]
+            )
+        )
+
+    def test_poison_can_win(self):
+        """Test that a low poison limit ends games through poison."""
+        result = tune(
+            bosses=[LunarChanneler],
+            player_model=PlayerModel(damage=5, growth=0, poison=10),
+            poison_limits=[30],
+            **SMALL,
+        )
+        trial = result.best("LunarChanneler", 2)
+        self.assertEqual(trial.poison_wins, trial.games)
+        # 2 players dealing 10 poison each on average reach 2 * 30 in 3 or 4 turns
+        self.assertTrue(3 <= trial.mean_turns <= 4)
+
+    def test_cache_only_recomputes_changed_bosses(self):
+        """Test that cached trials are reused and only an edited boss is simulated again."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "tuner.cache")
+            first = tune(bosses=[TheManaGod, HorrorfromtheDepths], cache=TrialCache(path), **SMALL)
+            self.assertEqual((first.computed, first.cached), (12, 0))
+
+            again = tune(bosses=[TheManaGod, HorrorfromtheDepths], cache=TrialCache(path), **SMALL)
+            self.assertEqual((again.computed, again.cached), (0, 12))
+            self.assertEqual(again.trials, first.trials)
+
+            edited = tune(bosses=[TheManaGod, LoudHorror], cache=TrialCache(path), **SMALL)
+            self.assertEqual((edited.computed, edited.cached), (8, 8))
+
+    def test_cache_is_per_seed(self):
+        """Test that another seed runs its own trials instead of reusing cached ones."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "tuner.cache")
+            first = tune(bosses=[TheManaGod], cache=TrialCache(path), **SMALL)
+            reseeded = tune(bosses=[TheManaGod], cache=TrialCache(path), **dict(SMALL, seed=12))
+            self.assertEqual((reseeded.computed, reseeded.cached), (first.computed, 0))
+            self.assertNotEqual(reseeded.trials, first.trials)
+
+    def test_workers_match_a_single_process(self):
+        """Test that results do not depend on how trials are spread over processes."""
+        options = dict(SMALL, jobs=2)
+        self.assertEqual(tune(bosses=[TheManaGod], **options).trials, tune(bosses=[TheManaGod], **SMALL).trials)
+
+
+if __name__ == "__main__":
+    unittest.main()
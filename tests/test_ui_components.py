@@ -0,0 +1,109 @@
+import unittest
+from kivy.uix.scrollview import ScrollView
+from raid_boss.metrics import Instrumentation
+from raid_boss.ui_components import GameOutput, TextType
+
+
+class TestGameOutput(unittest.TestCase):
+
+    def setUp(self):
+        """Set up an output inside a small scroll view."""
+        self.scroll = ScrollView(size=(400, 200))
+        self.output = GameOutput()
+        self.output.set_scroll_view(self.scroll)
+        self.output.size = (400, self.output.height)
+
+    def test_text_keeps_order_and_spacing(self):
+        """Test that the plain transcript matches the order lines were added in."""
+        self.output.add_text("Welcome", TextType.GAME_STATE)
+        self.output.add_text("How many?", TextType.PROMPT)
+        self.assertEqual(self.output.text, "Welcome\n\nHow many?\n")
+        # Reading the text leaves the queued lines to the next flush
+        self.assertEqual(len(self.output._pending), 2)
+        self.output.flush()
+        self.assertEqual(self.output.text, "Welcome\n\nHow many?\n")
+
+    def test_setting_text_clears(self):
+        """Test that assigning an empty string clears the transcript."""
+        self.output.add_text("Welcome", TextType.GAME_STATE)
+        self.output.text = ""
+        self.assertEqual(self.output.text, "")
+        self.assertEqual(self.output.height, 2 * GameOutput.PADDING)
+
+    def test_append_grows_height(self):
+        """Test that each line adds its own height without re-measuring the rest."""
+        self.output.add_text("First", TextType.GAME_STATE)
+        self.output.flush()
+        height = self.output.height
+        self.output.add_text("Second", TextType.PROMPT)
+        self.output.flush()
+        self.assertGreater(self.output.height, height)
+        self.assertEqual(self.output._offsets[-1], sum(self.output._heights))
+
+    def test_only_visible_lines_are_drawn(self):
+        """Test that a long transcript only renders the lines in the viewport."""
+        for turn in range(300):
+            self.output.add_text(f"Turn {turn}", TextType.BOSS_ATTACK)
+        self.output.flush()
+        self.scroll.scroll_y = 0
+        self.output._redraw()
+        first, last = self.output._visible_range()
+        self.assertEqual(last, 300)
+        self.assertLess(last - first, 20)
+        self.assertLessEqual(len(self.output._textures), GameOutput.TEXTURE_CACHE_SIZE)
+
+        self.scroll.scroll_y = 1
+        self.assertEqual(self.output._visible_range()[0], 0)
+
+    def test_batch_lays_out_once(self):
+        """Test that lines added in a batch are laid out when the batch exits."""
+        with self.output.batch():
+            self.output.add_text("Damage dealt: 5", TextType.GAME_STATE)
+            self.output.add_texts([("THE BOSS ATTACKS!", TextType.BOSS_ATTACK), ("Next?", TextType.PROMPT)])
+            self.assertEqual(len(self.output._lines), 0)
+        self.assertEqual(len(self.output._lines), 3)
+        self.assertEqual(len(self.output._heights), 3)
+
+    def test_unbatched_lines_wait_for_flush(self):
+        """Test that plain add_text calls are coalesced until the next flush."""
+        self.output.add_text("One", TextType.GAME_STATE)
+        self.output.add_text("Two", TextType.GAME_STATE)
+        self.assertEqual(len(self.output._pending), 2)
+        self.output.flush()
+        self.assertEqual([line.content for line in self.output._lines], ["One", "Two"])
+
+    def test_metrics_time_the_layout(self):
+        """Test that metering times flush, where the queued lines are laid out, as well as add_text."""
+        metrics = Instrumentation()
+        metrics.instrument(GameOutput)
+        self.addCleanup(metrics.uninstrument)
+        output = GameOutput()
+        with output.batch():
+            output.add_text("One", TextType.GAME_STATE)
+            output.add_text("Two", TextType.GAME_STATE)
+        self.assertEqual(metrics.histograms["GameOutput.add_text"].count, 2)
+        self.assertEqual(metrics.histograms["GameOutput.flush"].count, 1)
+
+    def test_scrolling_up_pages_archived_lines_in(self):
+        """Test that lines past the in-memory capacity are still drawn when scrolled to."""
+        self.output._lines.capacity = 50
+        for turn in range(300):
+            self.output.add_text(f"Turn {turn}", TextType.BOSS_ATTACK)
+        self.output.flush()
+        self.assertEqual(len(self.output._lines.recent), 50)
+        self.scroll.scroll_y = 1
+        self.output._redraw()
+        self.assertEqual(self.output._lines[0].content, "Turn 0")
+        self.assertIn(0, self.output._textures)
+
+    def test_resize_rewraps(self):
+        """Test that narrowing the output re-measures the lines."""
+        self.output.add_text("a long line of boss text " * 10, TextType.BOSS_ATTACK)
+        self.output.flush()
+        height = self.output.height
+        self.output.width = 150
+        self.assertGreater(self.output.height, height)
+
+
+if __name__ == "__main__":
+    unittest.main()